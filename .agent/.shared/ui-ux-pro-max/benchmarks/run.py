@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Benchmarks - latency, index build time, memory and throughput
+of core.search, core.search_stack and design-system generation
+
+Each scale runs in a fresh worker process against a temporary copy of data/
+whose CSVs are synthetically scaled (1x = the shipped rows; extra copies
+shuffle every column independently, so vocabulary and row lengths stay
+realistic), with an empty index cache:
+
+  build       compile every domain, stack and all-stacks index from CSV
+  cold        first query per dataset after dropping the in-process indices
+              (index read back from the on-disk cache, then scored)
+  warm        the query corpus (queries.json) repeated with indices in memory:
+              p50/p95/p99 latency and single-thread queries per second
+  peak RSS    of the worker process (Unix only)
+
+Usage:
+    python benchmarks/run.py                                  # scales 1,10,100
+    python benchmarks/run.py --scales 1,10 --repeat 20 -o results.json
+    python benchmarks/run.py --compare baseline.json          # exit 1 on regressions
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent / "scripts"
+SOURCE_DATA_DIR = BENCH_DIR.parent / "data"
+QUERIES_FILE = BENCH_DIR / "queries.json"
+
+DEFAULT_SCALES = [1, 10, 100]
+DEFAULT_REPEAT = 20
+# --compare: a metric regresses when it is TOLERANCE worse than the baseline
+# and, for timings, at least MIN_DELTA_MS worse (sub-0.2 ms jitter is noise)
+TOLERANCE = 0.25
+MIN_DELTA_MS = 0.2
+
+
+# ============ SYNTHETIC DATA ============
+def scale_csv(src, dst, factor, seed=0):
+    """Write src with factor times its rows; copies after the first shuffle each column"""
+    with open(src, 'r', encoding='utf-8', newline='') as f:
+        rows = [row for row in csv.reader(f) if row]
+    if not rows:
+        dst.write_bytes(src.read_bytes())
+        return 0
+    header, body = rows[0], rows[1:]
+    width = len(header)
+    body = [(row + [""] * width)[:width] for row in body]
+
+    rng = random.Random(f"{src.name}:{seed}")
+    out = [header] + body
+    columns = list(zip(*body)) if body else []
+    for copy in range(1, factor):
+        shuffled = [rng.sample(column, len(column)) for column in columns]
+        for row in zip(*shuffled):
+            row = list(row)
+            row[0] = f"{row[0]} syn{copy}"
+            out.append(row)
+
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    with open(dst, 'w', encoding='utf-8', newline='') as f:
+        csv.writer(f).writerows(out)
+    return len(out) - 1
+
+
+def make_dataset(root, factor):
+    """Scaled copy of every CSV under data/ in root/data; returns the total row count"""
+    rows = 0
+    for src in sorted(SOURCE_DATA_DIR.rglob("*.csv")):
+        rows += scale_csv(src, root / "data" / src.relative_to(SOURCE_DATA_DIR), factor)
+    return rows
+
+
+# ============ STATISTICS ============
+def percentile(sorted_samples, pct):
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_samples:
+        return None
+    rank = max(1, min(len(sorted_samples), round(pct / 100 * len(sorted_samples))))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples):
+    """Latency summary (ms) and throughput for a list of per-call timings in ms"""
+    samples = sorted(samples)
+    total = sum(samples)
+    return {
+        "n": len(samples),
+        "mean_ms": total / len(samples) if samples else None,
+        "p50_ms": percentile(samples, 50),
+        "p95_ms": percentile(samples, 95),
+        "p99_ms": percentile(samples, 99),
+        "qps": len(samples) / (total / 1000) if total else None
+    }
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, or None where unsupported"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+# ============ WORKER ============
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return (time.perf_counter() - start) * 1000
+
+
+def run_worker(corpus, repeat):
+    """Measure one scale; DATA_DIR / CACHE_DIR come from the environment"""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    import core
+    from design_system import DesignSystemGenerator
+
+    # Build: compile every index from CSV into the (empty) cache
+    build = {}
+    for domain, config in core.CSV_CONFIG.items():
+        build[domain] = _timed(core._load_index, core.DATA_DIR / config["file"], config["search_cols"], config["output_cols"])
+    for stack, config in core.STACK_CONFIG.items():
+        build[f"stack:{stack}"] = _timed(core._load_index, core.DATA_DIR / config["file"],
+                                         core._STACK_COLS["search_cols"], core._STACK_COLS["output_cols"])
+    build["stack:all"] = _timed(core._load_stack_union, core.AVAILABLE_STACKS)
+
+    # Cold: first query per dataset with indices read back from disk
+    core._INDEX_CACHE.clear()
+    cold = {}
+    for domain, queries in corpus["domains"].items():
+        cold[domain] = _timed(core.search, queries[0], domain)
+    for stack, queries in corpus["stacks"].items():
+        cold[f"stack:{stack}"] = _timed(core.search_stack, queries[0], stack)
+    cold["design_system"] = _timed(DesignSystemGenerator().generate, corpus["design_system"][0])
+
+    # Warm: the whole corpus, repeated
+    search_samples, stack_samples, ds_samples = [], [], []
+    generator = DesignSystemGenerator()  # no generate() cache: every call searches
+    for _ in range(repeat):
+        for domain, queries in corpus["domains"].items():
+            search_samples.extend(_timed(core.search, query, domain) for query in queries)
+        for stack, queries in corpus["stacks"].items():
+            stack_samples.extend(_timed(core.search_stack, query, stack) for query in queries)
+        ds_samples.extend(_timed(generator.generate, query) for query in corpus["design_system"])
+
+    cold_search = [ms for name, ms in cold.items() if not name.startswith(("stack:", "design_system"))]
+    cold_stack = [ms for name, ms in cold.items() if name.startswith("stack:")]
+    return {
+        "build_ms": sum(build.values()),
+        "build_ms_by_index": build,
+        "cold_ms_by_dataset": cold,
+        "search": {"cold_mean_ms": sum(cold_search) / len(cold_search), "warm": summarize(search_samples)},
+        "search_stack": {"cold_mean_ms": sum(cold_stack) / len(cold_stack), "warm": summarize(stack_samples)},
+        "design_system": {"cold_mean_ms": cold["design_system"], "warm": summarize(ds_samples)},
+        "peak_rss_mb": peak_rss_mb()
+    }
+
+
+# ============ DRIVER ============
+def run_scale(factor, repeat, queries_file):
+    """Generate the scaled dataset in a temp dir and measure it in a fresh process"""
+    with tempfile.TemporaryDirectory(prefix=f"uipro-bench-{factor}x-") as tmp:
+        root = Path(tmp)
+        rows = make_dataset(root, factor)
+        env = dict(os.environ,
+                   UIPRO_DATA_DIR=str(root / "data"),
+                   UIPRO_CACHE_DIR=str(root / "cache"),
+                   UIPRO_PACK_FILE=str(root / "data" / "datasets.pack"))
+        proc = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), "--worker", "--repeat", str(repeat), "--queries", str(queries_file)],
+            env=env, capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"{factor}x worker failed:\n{proc.stderr}")
+        result = json.loads(proc.stdout)
+        result["rows"] = rows
+        return result
+
+
+def headline_metrics(results):
+    """Flatten results into {"<scale>x.<metric>": value} for comparison"""
+    metrics = {}
+    for scale, result in results["scales"].items():
+        prefix = f"{scale}x"
+        metrics[f"{prefix}.build_ms"] = result["build_ms"]
+        metrics[f"{prefix}.peak_rss_mb"] = result["peak_rss_mb"]
+        for group in ("search", "search_stack", "design_system"):
+            metrics[f"{prefix}.{group}.cold_mean_ms"] = result[group]["cold_mean_ms"]
+            metrics[f"{prefix}.{group}.p50_ms"] = result[group]["warm"]["p50_ms"]
+            metrics[f"{prefix}.{group}.p95_ms"] = result[group]["warm"]["p95_ms"]
+            metrics[f"{prefix}.{group}.qps"] = result[group]["warm"]["qps"]
+    return metrics
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """List of (metric, baseline, current) that regressed beyond tolerance"""
+    current, previous = headline_metrics(results), headline_metrics(baseline)
+    regressions = []
+    for name, base in previous.items():
+        value = current.get(name)
+        if value is None or base is None:
+            continue
+        if name.endswith(".qps"):
+            worse = value < base * (1 - tolerance)
+        else:
+            worse = value > base * (1 + tolerance)
+            if name.endswith("_ms"):
+                worse = worse and value - base >= MIN_DELTA_MS
+        if worse:
+            regressions.append((name, base, value))
+    return regressions
+
+
+def format_report(results):
+    """Human-readable summary table"""
+    lines = [f"UI Pro Max benchmarks | Python {results['machine']['python']} | {results['machine']['platform']}"]
+    header = f"{'scale':>6} {'rows':>7} {'build ms':>9} {'RSS MB':>7} | {'group':13} {'cold ms':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'QPS':>9}"
+    lines.append(header)
+    lines.append("-" * len(header))
+    for scale, result in results["scales"].items():
+        rss = f"{result['peak_rss_mb']:.1f}" if result["peak_rss_mb"] is not None else "n/a"
+        for i, group in enumerate(("search", "search_stack", "design_system")):
+            warm = result[group]["warm"]
+            left = f"{scale + 'x':>6} {result['rows']:>7} {result['build_ms']:>9.1f} {rss:>7}" if i == 0 else " " * 32
+            lines.append(f"{left} | {group:13} {result[group]['cold_mean_ms']:>8.3f} {warm['p50_ms']:>8.3f} "
+                         f"{warm['p95_ms']:>8.3f} {warm['p99_ms']:>8.3f} {warm['qps']:>9.0f}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max search benchmarks")
+    parser.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)), help="Comma-separated data scale factors (default: 1,10,100)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Warm passes over the query corpus (default: 20)")
+    parser.add_argument("--queries", default=str(QUERIES_FILE), help="Query corpus JSON (default: benchmarks/queries.json)")
+    parser.add_argument("--output", "-o", help="Write results JSON to this file")
+    parser.add_argument("--json", action="store_true", help="Print results JSON instead of the table")
+    parser.add_argument("--compare", help="Baseline results JSON; exit 1 if any headline metric regressed")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="Allowed relative slowdown for --compare (default: 0.25)")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    with open(args.queries, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+
+    if args.worker:
+        json.dump(run_worker(corpus, args.repeat), sys.stdout)
+        sys.exit(0)
+
+    results = {
+        "machine": {"python": platform.python_version(), "platform": platform.platform(), "cpu_count": os.cpu_count()},
+        "repeat": args.repeat,
+        "scales": {}
+    }
+    for factor in (int(value) for value in args.scales.split(",")):
+        print(f"Running {factor}x...", file=sys.stderr, flush=True)
+        results["scales"][str(factor)] = run_scale(factor, args.repeat, args.queries)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    print(json.dumps(results, indent=2) if args.json else format_report(results))
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for name, base, value in regressions:
+            print(f"REGRESSION {name}: {base:.3f} -> {value:.3f}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.compare} (tolerance {args.tolerance:.0%})", file=sys.stderr)
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Evaluation - search relevance against labelled judgments
+
+Runs every query in judgments.json through core.search() for its domain and
+scores the ranking with nDCG@k (graded gains 2^grade - 1) and MRR (first row
+with any grade). Results are compared with the stored baseline.json:
+
+  - any domain's mean nDCG or MRR lower than the baseline fails the run
+  - changed rankings are listed; with --strict they fail the run too
+
+Indices come from the usual on-disk cache, so a full run takes well under a
+second and can gate every change to BM25, tokenization or the data files.
+
+Usage:
+    python evaluation/evaluate.py                     # compare with baseline.json
+    python evaluation/evaluate.py --strict            # also fail on ranking changes
+    python evaluation/evaluate.py --update-baseline   # accept current results
+    python evaluation/evaluate.py --json              # machine-readable report
+"""
+
+import argparse
+import json
+import sys
+import time
+from math import log2
+from pathlib import Path
+
+EVAL_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(EVAL_DIR.parent / "scripts"))
+
+from core import CSV_CONFIG, search
+
+JUDGMENTS_FILE = EVAL_DIR / "judgments.json"
+BASELINE_FILE = EVAL_DIR / "baseline.json"
+K = 5
+# Metric drops smaller than this are float noise, not regressions
+EPSILON = 1e-9
+
+# Column identifying a row in each domain (judgments refer to rows by it)
+KEY_COLUMNS = {
+    "style": "Style Category",
+    "prompt": "Style Category",
+    "color": "Product Type",
+    "chart": "Data Type",
+    "landing": "Pattern Name",
+    "product": "Product Type",
+    "ux": "Issue",
+    "typography": "Font Pairing Name",
+    "icons": "Icon Name",
+    "react": "Issue",
+    "web": "Issue"
+}
+
+
+# ============ METRICS ============
+def dcg(gains):
+    """Discounted cumulative gain of graded relevances in rank order"""
+    return sum((2 ** grade - 1) / log2(rank + 2) for rank, grade in enumerate(gains))
+
+
+def ndcg(ranked_keys, judgments, k=K):
+    """nDCG@k; a key repeated in the ranking (duplicate rows) only counts once"""
+    seen = set()
+    gains = []
+    for key in ranked_keys[:k]:
+        gains.append(judgments.get(key, 0) if key not in seen else 0)
+        seen.add(key)
+    ideal = dcg(sorted(judgments.values(), reverse=True)[:k])
+    return dcg(gains) / ideal if ideal else 0.0
+
+
+def reciprocal_rank(ranked_keys, judgments):
+    """1 / rank of the first judged-relevant result, 0 if none"""
+    for rank, key in enumerate(ranked_keys, 1):
+        if judgments.get(key, 0) > 0:
+            return 1 / rank
+    return 0.0
+
+
+# ============ EVALUATION ============
+def evaluate(judgments, k=K):
+    """Run every judged query; returns {"domains": {...}, "overall": {...}}"""
+    report = {"k": k, "domains": {}}
+    all_ndcg, all_rr = [], []
+    for domain, queries in judgments["domains"].items():
+        if domain not in CSV_CONFIG:
+            raise ValueError(f"Judgments for unknown domain: {domain}")
+        key_column = KEY_COLUMNS[domain]
+        per_query = {}
+        for query, grades in queries.items():
+            rows = search(query, domain, k)["results"]
+            ranked = [row.get(key_column) for row in rows]
+            per_query[query] = {
+                "ranking": ranked,
+                "ndcg": ndcg(ranked, grades, k),
+                "rr": reciprocal_rank(ranked, grades)
+            }
+        ndcgs = [result["ndcg"] for result in per_query.values()]
+        rrs = [result["rr"] for result in per_query.values()]
+        all_ndcg.extend(ndcgs)
+        all_rr.extend(rrs)
+        report["domains"][domain] = {
+            "ndcg": sum(ndcgs) / len(ndcgs),
+            "mrr": sum(rrs) / len(rrs),
+            "queries": per_query
+        }
+    report["overall"] = {"ndcg": sum(all_ndcg) / len(all_ndcg), "mrr": sum(all_rr) / len(all_rr), "queries": len(all_ndcg)}
+    return report
+
+
+def compare(report, baseline):
+    """(regressions, ranking_changes) of report against a stored baseline report"""
+    regressions = []
+    changes = []
+    for domain, current in report["domains"].items():
+        previous = baseline.get("domains", {}).get(domain)
+        if previous is None:
+            continue
+        for metric in ("ndcg", "mrr"):
+            if current[metric] < previous[metric] - EPSILON:
+                regressions.append((domain, metric, previous[metric], current[metric]))
+        for query, result in current["queries"].items():
+            before = previous["queries"].get(query)
+            if before is not None and before["ranking"] != result["ranking"]:
+                changes.append((domain, query, before["ranking"], result["ranking"]))
+    return regressions, changes
+
+
+def format_report(report):
+    """Per-domain metric table"""
+    lines = [f"{'domain':12} {'queries':>7} {'nDCG@' + str(report['k']):>8} {'MRR':>6}"]
+    for domain, result in report["domains"].items():
+        lines.append(f"{domain:12} {len(result['queries']):>7} {result['ndcg']:>8.4f} {result['mrr']:>6.4f}")
+    overall = report["overall"]
+    lines.append(f"{'overall':12} {overall['queries']:>7} {overall['ndcg']:>8.4f} {overall['mrr']:>6.4f}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max search relevance evaluation")
+    parser.add_argument("--judgments", default=str(JUDGMENTS_FILE), help="Judgments JSON (default: evaluation/judgments.json)")
+    parser.add_argument("--baseline", default=str(BASELINE_FILE), help="Baseline report JSON (default: evaluation/baseline.json)")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the current results as the new baseline")
+    parser.add_argument("--strict", action="store_true", help="Fail on any ranking change, not only on metric drops")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+    args = parser.parse_args()
+
+    with open(args.judgments, 'r', encoding='utf-8') as f:
+        judgments = json.load(f)
+
+    start = time.perf_counter()
+    report = evaluate(judgments)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    print(f"Evaluated {report['overall']['queries']} queries in {elapsed:.0f} ms", file=sys.stderr)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+        sys.exit(0)
+
+    try:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one", file=sys.stderr)
+        sys.exit(0)
+
+    regressions, changes = compare(report, baseline)
+    for domain, query, before, after in changes:
+        print(f"CHANGED {domain} '{query}': {before} -> {after}", file=sys.stderr)
+    for domain, metric, before, after in regressions:
+        print(f"REGRESSION {domain} {metric}: {before:.4f} -> {after:.4f}", file=sys.stderr)
+    if regressions or (args.strict and changes):
+        sys.exit(1)
+    print("No relevance regressions against baseline", file=sys.stderr)
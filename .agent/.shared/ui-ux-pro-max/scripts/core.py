@@ -4,16 +4,26 @@
 UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
-import csv
+import heapq
+from bisect import bisect_left
+import os
 import re
+import sys
+import threading
 from pathlib import Path
 from math import log
 from collections import defaultdict
+from itertools import islice
 
 # ============ CONFIGURATION ============
-DATA_DIR = Path(__file__).parent.parent / "data"
+# Datasets ship in ../data; override with UIPRO_DATA_DIR (e.g. benchmarks on scaled copies)
+DATA_DIR = Path(os.environ.get("UIPRO_DATA_DIR", Path(__file__).parent.parent / "data"))
 MAX_RESULTS = 3
 
+# Compiled indices live next to the data; override with UIPRO_CACHE_DIR
+CACHE_DIR = Path(os.environ.get("UIPRO_CACHE_DIR", Path(__file__).parent.parent / ".cache"))
+INDEX_VERSION = 5
+
 CSV_CONFIG = {
     "style": {
         "file": "styles.csv",
@@ -95,20 +105,77 @@ _STACK_COLS = {
 
 AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
+# Scoring backend: "auto" uses NumPy when importable and the index is large
+# enough to amortize importing it, else pure Python
+BM25_BACKEND = os.environ.get("UIPRO_BM25_BACKEND", "auto")
+AUTO_NUMPY_MIN_POSTINGS = 20000
+
+# Fuzzy matching: query tokens missing from an index's vocabulary expand to
+# vocabulary terms they prefix or share most trigrams with (typos), weighted
+# FUZZY_WEIGHT * similarity so exact matches always count for more.
+# Opt-in (UIPRO_FUZZY=1): it changes rankings of any query with an unknown word
+FUZZY_MATCHING = os.environ.get("UIPRO_FUZZY", "0") != "0"
+FUZZY_MIN_LENGTH = 4
+FUZZY_MIN_SIMILARITY = 0.6
+FUZZY_EXPANSIONS = 3
+FUZZY_PREFIX_CANDIDATES = 50
+FUZZY_WEIGHT = 0.8
+
+
+# ============ OPTIONAL DEPENDENCIES ============
+_numpy = False  # not probed yet
+
+
+def _get_numpy():
+    """Import NumPy on first use; None when it is not installed"""
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = None
+    return _numpy
+
 
 # ============ BM25 IMPLEMENTATION ============
 class BM25:
-    """BM25 ranking algorithm for text search"""
+    """
+    BM25 ranking algorithm for text search (inverted-index scoring).
+
+    backend: "python", "numpy" or "auto". The NumPy backend scores from a CSR
+    term-document matrix and ranks identically; "auto" picks it on the first
+    query when NumPy is importable and the index has at least
+    AUTO_NUMPY_MIN_POSTINGS postings, so small catalogs never import NumPy.
+
+    fuzzy: expand out-of-vocabulary query tokens through the prefix/trigram
+    vocabulary index (defaults to FUZZY_MATCHING).
+    """
 
-    def __init__(self, k1=1.5, b=0.75):
+    def __init__(self, k1=1.5, b=0.75, backend=None, fuzzy=None):
         self.k1 = k1
         self.b = b
-        self.corpus = []
+        self.fuzzy = FUZZY_MATCHING if fuzzy is None else fuzzy
+        self.backend = backend or BM25_BACKEND
+        if self.backend not in ("auto", "python", "numpy"):
+            raise ValueError(f"Unknown BM25 backend: {self.backend}")
+        self._active_backend = None
         self.doc_lengths = []
         self.avgdl = 0
         self.idf = {}
         self.doc_freqs = defaultdict(int)
         self.N = 0
+        # term -> [(doc_idx, term_freq), ...] in ascending doc order
+        self.postings = {}
+        # per-document k1 * (1 - b + b * dl / avgdl)
+        self.length_norms = []
+        # NumPy CSR matrix (term_rows, indptr, doc_ids, weights), built on first query
+        self._csr = None
+        # sorted vocabulary, and trigram -> [vocab position, ...] over "$term$"
+        self.vocab = []
+        self.trigrams = {}
+        # out-of-vocabulary token -> weighted expansion, filled on demand
+        self._expansions = {}
 
     def tokenize(self, text):
         """Lowercase, split, remove punctuation, filter short words"""
@@ -117,53 +184,823 @@ class BM25:
 
     def fit(self, documents):
         """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
-        self.N = len(self.corpus)
+        corpus = [self.tokenize(doc) for doc in documents]
+        self.N = len(corpus)
         if self.N == 0:
             return
-        self.doc_lengths = [len(doc) for doc in self.corpus]
+        self.doc_lengths = [len(doc) for doc in corpus]
         self.avgdl = sum(self.doc_lengths) / self.N
 
-        for doc in self.corpus:
-            seen = set()
+        postings = defaultdict(list)
+        for idx, doc in enumerate(corpus):
+            term_freqs = defaultdict(int)
             for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
+                term_freqs[word] += 1
+            for word, tf in term_freqs.items():
+                postings[word].append((idx, tf))
+        self.postings = dict(postings)
+
+        for word, plist in self.postings.items():
+            self.doc_freqs[word] = len(plist)
 
         for word, freq in self.doc_freqs.items():
             self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
 
+        self.length_norms = [self.k1 * (1 - self.b + self.b * dl / self.avgdl) for dl in self.doc_lengths]
+
+        self.vocab = sorted(self.postings)
+        trigrams = defaultdict(list)
+        for pos, term in enumerate(self.vocab):
+            for gram in _trigrams(term):
+                trigrams[gram].append(pos)
+        self.trigrams = dict(trigrams)
+
+    def expand(self, tokens):
+        """
+        Weighted query terms: (token, 1.0) for every token, except that an
+        out-of-vocabulary token of FUZZY_MIN_LENGTH+ characters is replaced by
+        its closest vocabulary terms (see _fuzzy_terms).
+        """
+        terms = []
+        for token in tokens:
+            if token in self.postings or not self.fuzzy or len(token) < FUZZY_MIN_LENGTH:
+                terms.append((token, 1.0))
+            else:
+                terms.extend(self._fuzzy_terms(token))
+        return terms
+
+    def _fuzzy_terms(self, token):
+        """
+        Up to FUZZY_EXPANSIONS vocabulary terms similar to token, as
+        (term, FUZZY_WEIGHT * similarity). Terms that extend the token score
+        0.5 + 0.5 * coverage; others the Dice coefficient of their trigram sets.
+        Of the terms extending the token, only the FUZZY_PREFIX_CANDIDATES
+        shortest (fewest added characters) are considered, and equally similar
+        terms rank by document frequency.
+        """
+        cached = self._expansions.get(token)
+        if cached is not None:
+            return cached
+
+        vocab = self.vocab
+        doc_freqs = self.doc_freqs
+        start = bisect_left(vocab, token)
+        end = bisect_left(vocab, token[:-1] + chr(ord(token[-1]) + 1), start)
+        prefixed = heapq.nsmallest(FUZZY_PREFIX_CANDIDATES, vocab[start:end],
+                                   key=lambda term: (len(term), -doc_freqs[term], term))
+        similarity = {term: 0.5 + 0.5 * len(token) / len(term) for term in prefixed}
+
+        grams = _trigrams(token)
+        shared = defaultdict(int)
+        for gram in grams:
+            for pos in self.trigrams.get(gram, ()):
+                shared[pos] += 1
+        for pos, count in shared.items():
+            # Dice <= 2c / (|grams| + c): skip candidates that cannot qualify
+            if 2 * count < FUZZY_MIN_SIMILARITY * (len(grams) + count):
+                continue
+            term = vocab[pos]
+            dice = 2 * count / (len(grams) + len(_trigrams(term)))
+            if dice > similarity.get(term, 0):
+                similarity[term] = dice
+
+        best = sorted((item for item in similarity.items() if item[1] >= FUZZY_MIN_SIMILARITY),
+                      key=lambda item: (-item[1], -doc_freqs[item[0]], item[0]))[:FUZZY_EXPANSIONS]
+        expansion = [(term, FUZZY_WEIGHT * sim) for term, sim in best]
+        self._expansions[token] = expansion
+        return expansion
+
+    def _accumulate(self, terms):
+        """Sum weighted BM25 contributions, visiting only documents that contain a query term"""
+        scores = {}
+        k1_plus_1 = self.k1 + 1
+        norms = self.length_norms
+        for term, weight in terms:
+            plist = self.postings.get(term)
+            if not plist:
+                continue
+            idf = self.idf[term]
+            if weight == 1.0:
+                for idx, tf in plist:
+                    scores[idx] = scores.get(idx, 0) + idf * (tf * k1_plus_1) / (tf + norms[idx])
+            else:
+                for idx, tf in plist:
+                    scores[idx] = scores.get(idx, 0) + idf * (tf * k1_plus_1) / (tf + norms[idx]) * weight
+        return scores
+
     def score(self, query):
         """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
+        scores = self._accumulate(self.expand(self.tokenize(query)))
+        ranked = [(idx, scores.get(idx, 0)) for idx in range(self.N)]
+        return sorted(ranked, key=lambda x: x[1], reverse=True)
+
+    def top_k(self, query, k):
+        """Return the k best (doc_idx, score) pairs with score > 0, ties by doc order"""
+        return self.top_k_tokens(self.tokenize(query), k)
+
+    def top_k_tokens(self, tokens, k):
+        """top_k() for an already tokenized query"""
+        terms = self.expand(tokens)
+        if self._resolve_backend() == "numpy":
+            return self._top_k_numpy(terms, k)
+        scores = self._accumulate(terms)
+        return heapq.nlargest(k, scores.items(), key=lambda x: (x[1], -x[0]))
+
+    def iter_ranked(self, tokens):
+        """
+        Yield (doc_idx, score) for every matching document, best first, ties
+        by doc order (same order as top_k_tokens). Ranking is lazy: each pop
+        from the heap costs O(log n), so consumers can stop at any point.
+        """
+        heap = [(-score, idx) for idx, score in self._accumulate(self.expand(tokens)).items()]
+        heapq.heapify(heap)
+        while heap:
+            neg_score, idx = heapq.heappop(heap)
+            yield idx, -neg_score
+
+    def _resolve_backend(self):
+        """Pick the scoring backend on first use (may import NumPy)"""
+        if self._active_backend is None:
+            backend = self.backend
+            if backend == "auto":
+                postings = sum(self.doc_freqs.values())
+                large = postings >= AUTO_NUMPY_MIN_POSTINGS
+                backend = "numpy" if large and _get_numpy() is not None else "python"
+            elif backend == "numpy" and _get_numpy() is None:
+                raise ImportError("BM25 backend 'numpy' requested but NumPy is not installed")
+            self._active_backend = backend
+        return self._active_backend
+
+    def _build_csr(self):
+        """Compile postings into CSR arrays of precomputed per-(term, doc) weights"""
+        np = _get_numpy()
+        k1_plus_1 = self.k1 + 1
+        norms = self.length_norms
+        term_rows = {}
+        indptr = [0]
+        doc_ids = []
+        weights = []
+        for row, (term, plist) in enumerate(self.postings.items()):
+            term_rows[term] = row
+            idf = self.idf[term]
+            for idx, tf in plist:
+                doc_ids.append(idx)
+                weights.append(idf * (tf * k1_plus_1) / (tf + norms[idx]))
+            indptr.append(len(doc_ids))
+        self._csr = (
+            term_rows,
+            np.array(indptr, dtype=np.int64),
+            np.array(doc_ids, dtype=np.int64),
+            np.array(weights, dtype=np.float64)
+        )
+        return self._csr
+
+    def _top_k_numpy(self, terms, k):
+        """Vectorized scoring: gather weighted query-term rows, sum per document, partial sort"""
+        np = _get_numpy()
+        term_rows, indptr, doc_ids, weights = self._csr or self._build_csr()
+        matched = [(term_rows[term], weight) for term, weight in terms if term in term_rows]
+        if not matched or k <= 0:
+            return []
+
+        # Concatenating slices in query order keeps per-document summation order
+        # identical to the pure-Python path, so scores match bit for bit
+        rows = np.array([row for row, _ in matched])
+        starts, ends = indptr[rows], indptr[rows + 1]
+        gather = np.concatenate([np.arange(a, e) for a, e in zip(starts.tolist(), ends.tolist())])
+        contributions = weights[gather]
+        term_weights = np.array([weight for _, weight in matched])
+        if (term_weights != 1.0).any():
+            contributions = contributions * np.repeat(term_weights, ends - starts)
+        scores = np.bincount(doc_ids[gather], weights=contributions, minlength=self.N)
+
+        candidates = np.flatnonzero(scores)
+        values = scores[candidates]
+        if len(candidates) > k:
+            kth = np.partition(values, len(values) - k)[len(values) - k]
+            keep = values >= kth
+            candidates, values = candidates[keep], values[keep]
+        order = np.lexsort((candidates, -values))[:k]
+        return list(zip(candidates[order].tolist(), values[order].tolist()))
+
+    def state(self):
+        """Export fitted index as plain data (for on-disk caching)"""
+        return {
+            "k1": self.k1,
+            "b": self.b,
+            "doc_lengths": self.doc_lengths,
+            "avgdl": self.avgdl,
+            "idf": self.idf,
+            "doc_freqs": dict(self.doc_freqs),
+            "N": self.N,
+            "postings": self.postings,
+            "length_norms": self.length_norms,
+            "vocab": self.vocab,
+            "trigrams": self.trigrams
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """Restore a fitted index exported by state()"""
+        bm25 = cls(state["k1"], state["b"])
+        bm25.doc_lengths = state["doc_lengths"]
+        bm25.avgdl = state["avgdl"]
+        bm25.idf = state["idf"]
+        bm25.doc_freqs = defaultdict(int, state["doc_freqs"])
+        bm25.N = state["N"]
+        bm25.postings = state["postings"]
+        bm25.length_norms = state["length_norms"]
+        bm25.vocab = state["vocab"]
+        bm25.trigrams = state["trigrams"]
+        return bm25
+
+
+def _trigrams(term):
+    """Character trigrams of a term padded with "$" (so prefixes and suffixes count)"""
+    padded = f"${term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# ============ COLUMNAR TABLE ============
+class Table:
+    """
+    Column-oriented CSV data: interned column names, one list per column and
+    row access by index, instead of a dict per row.
+
+    Each distinct cell string is stored once per table (repeated values such
+    as categories or severities share one object). Fields missing from short
+    rows are None, as with csv.DictReader.
+    """
+
+    __slots__ = ("columns", "data", "_positions")
+
+    def __init__(self, columns, data):
+        self.columns = tuple(sys.intern(col) for col in columns)
+        self.data = data  # one list per column, aligned with self.columns
+        self._positions = {col: i for i, col in enumerate(self.columns)}
+
+    @classmethod
+    def from_rows(cls, header, rows):
+        """Build from a header and an iterable of field lists (e.g. csv.reader)"""
+        width = len(header)
+        data = [[] for _ in range(width)]
+        pool = {}
+        for fields in rows:
+            if not fields:
+                continue  # blank line; csv.DictReader skips these too
+            for i in range(width):
+                value = fields[i] if i < len(fields) else None
+                data[i].append(pool.setdefault(value, value))
+        return cls(header, data)
+
+    def __len__(self):
+        return len(self.data[0]) if self.data else 0
+
+    def __contains__(self, col):
+        return col in self._positions
+
+    def column(self, col):
+        """All values of one column (a list shared with the table)"""
+        return self.data[self._positions[col]]
+
+    def get(self, idx, col, default=""):
+        """Value of one cell; default when the table has no such column"""
+        pos = self._positions.get(col)
+        return default if pos is None else self.data[pos][idx]
+
+    def row(self, idx):
+        """Materialize one row as a dict (only for rows that are returned)"""
+        return {col: values[idx] for col, values in zip(self.columns, self.data)}
+
+    def rows(self):
+        """Materialize every row (compatibility with list-of-dicts callers)"""
+        return [self.row(idx) for idx in range(len(self))]
+
+    def select(self, columns):
+        """Table restricted to the given columns that exist, in that order"""
+        present = [col for col in columns if col in self._positions]
+        return Table(present, [self.column(col) for col in present])
+
+    def state(self):
+        """Export as plain data (for on-disk caching)"""
+        return {"columns": list(self.columns), "data": self.data}
+
+    @classmethod
+    def from_state(cls, state):
+        """Restore a table exported by state(); ValueError if the columns do not line up"""
+        columns, data = state["columns"], state["data"]
+        if len(columns) != len(data) or len({len(values) for values in data}) > 1:
+            raise ValueError("malformed table state")
+        pool = {}
+        return cls(columns, [[pool.setdefault(value, value) for value in values] for values in data])
+
+
+# ============ MULTI-PATTERN MATCHING ============
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton: finds every occurrence of every pattern in one
+    left-to-right pass over the text, independent of the number of patterns.
+
+    patterns: iterable of (pattern, value); several values may share a pattern.
+    Matching is case-sensitive, so lowercase both patterns and text.
+    """
+
+    def __init__(self, patterns):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]  # state -> [(pattern_length, value), ...]
+
+        for pattern, value in patterns:
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = nxt
+            self.output[state].append((len(pattern), value))
+
+        # Breadth-first failure links; each state inherits its fallback's outputs
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.output[nxt] = self.output[nxt] + self.output[self.fail[nxt]]
+
+    def iter_matches(self, text):
+        """Yield (start, end, value) for every pattern occurrence, ordered by end position"""
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length, value in output[state]:
+                yield (pos + 1 - length, pos + 1, value)
+
+    def values(self, text):
+        """Set of values whose pattern occurs anywhere in text"""
+        return {value for _, _, value in self.iter_matches(text)}
+
+
+# ============ DOMAIN DETECTION ============
+DOMAIN_KEYWORDS = {
+    "color": ["color", "palette", "hex", "#", "rgb"],
+    "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
+    "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
+    "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
+    "prompt": ["prompt", "css", "implementation", "variable", "checklist", "tailwind"],
+    "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora"],
+    "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
+    "typography": ["font", "typography", "heading", "serif", "sans"],
+    "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
+    "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
+    "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
+}
+
+_DOMAIN_MATCHER = None
+
+
+def _domain_matcher():
+    """Compile DOMAIN_KEYWORDS once, on the first auto-detected query; values are (domain, keyword)"""
+    global _DOMAIN_MATCHER
+    if _DOMAIN_MATCHER is None:
+        _DOMAIN_MATCHER = KeywordMatcher(
+            (kw, (domain, kw)) for domain, keywords in DOMAIN_KEYWORDS.items() for kw in keywords
+        )
+    return _DOMAIN_MATCHER
+
+
+# ============ INDEX CACHE ============
+# filepath -> (stat fingerprint, index) for indices already loaded in this process
+_INDEX_CACHE = {}
+# filepath -> lock, so concurrent searches load each index only once
+_INDEX_LOCKS = {}
+_INDEX_LOCKS_GUARD = threading.Lock()
+
+
+def _stat_fingerprint(filepath):
+    """Cheap change detection: modification time and size"""
+    st = filepath.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _content_hash(filepath):
+    """SHA-256 of the file contents"""
+    import hashlib
+    with open(filepath, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _index_path(filepath):
+    """Location of the compiled index for a CSV"""
+    try:
+        name = filepath.relative_to(DATA_DIR).as_posix()
+    except ValueError:
+        name = filepath.name
+    return CACHE_DIR / (name.replace("/", "__") + ".idx")
+
+
+def _encode_index(index):
+    """
+    Serialize a compiled index (or data-pack section) as JSON. Only plain data
+    is stored, so a cache or pack file written by someone else can at worst
+    fail to load, never run code.
+    """
+    import json
+    return json.dumps(dict(index, table=index["table"].state()), separators=(",", ":")).encode("utf-8")
+
+
+def _decode_index(blob):
+    """Inverse of _encode_index(), or None if the data is not a well-formed index"""
+    import json
+    try:
+        index = json.loads(blob)
+        index["table"] = Table.from_state(index["table"])
+        if "bm25" in index:
+            BM25.from_state(index["bm25"])
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+    return index
+
+
+def _write_index(path, index):
+    """Atomically write a compiled index; caching is best-effort"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, 'wb') as f:
+            f.write(_encode_index(index))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _read_index(path):
+    """Read a compiled index in one go, or None if missing/unreadable"""
+    try:
+        with open(path, 'rb') as f:
+            return _decode_index(f.read())
+    except OSError:
+        return None
+
+
+def _build_index(filepath, search_cols, output_cols, fingerprint):
+    """Tokenize a CSV, fit BM25 and keep the output columns"""
+    table = _load_csv(filepath)
+
+    # Build documents from search columns
+    columns = [table.column(col) if col in table else [""] * len(table) for col in search_cols]
+    documents = [" ".join(str(value) for value in values) for values in zip(*columns)] if columns else [""] * len(table)
+
+    bm25 = BM25()
+    bm25.fit(documents)
+
+    return {
+        "version": INDEX_VERSION,
+        "mtime_ns": fingerprint[0],
+        "size": fingerprint[1],
+        "sha256": _content_hash(filepath),
+        "search_cols": list(search_cols),
+        "output_cols": list(output_cols),
+        "bm25": bm25.state(),
+        "table": table.select(output_cols)
+    }
 
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
 
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
+def _load_index(filepath, search_cols, output_cols):
+    """
+    Return (bm25, table) for a CSV, using the compiled on-disk index when valid.
 
-            scores.append((idx, score))
+    The index is reused while the CSV's mtime and size are unchanged. If they
+    differ but the content hash still matches (e.g. after a checkout), the
+    index is kept and only its stored fingerprint is refreshed.
+    """
+    fingerprint = _stat_fingerprint(filepath)
+    cached = _INDEX_CACHE.get(filepath)
+    if cached and cached[0] == fingerprint:
+        return cached[1]
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+    with _index_lock(filepath):
+        cached = _INDEX_CACHE.get(filepath)
+        if cached and cached[0] == fingerprint:
+            return cached[1]
+        return _load_index_locked(filepath, search_cols, output_cols, fingerprint)
+
+
+def _index_lock(key):
+    """Lock guarding the load of one index (a CSV path or a tuple of them)"""
+    with _INDEX_LOCKS_GUARD:
+        return _INDEX_LOCKS.setdefault(key, threading.Lock())
+
+
+def _load_index_locked(filepath, search_cols, output_cols, fingerprint):
+    """Data pack / disk cache / rebuild path of _load_index(); caller holds the file's lock"""
+    index = _pack_section(filepath, "index", fingerprint, search_cols, output_cols)
+    if index is not None:
+        loaded = (BM25.from_state(index["bm25"]), index["table"])
+        _INDEX_CACHE[filepath] = (fingerprint, loaded)
+        return loaded
+
+    path = _index_path(filepath)
+    index = _read_index(path)
+    valid = (
+        isinstance(index, dict)
+        and index.get("version") == INDEX_VERSION
+        and index.get("search_cols") == list(search_cols)
+        and index.get("output_cols") == list(output_cols)
+    )
+    if valid and (index.get("mtime_ns"), index.get("size")) != fingerprint:
+        valid = index.get("sha256") == _content_hash(filepath)
+        if valid:
+            index["mtime_ns"], index["size"] = fingerprint
+            _write_index(path, index)
+    if not valid:
+        index = _build_index(filepath, search_cols, output_cols, fingerprint)
+        _write_index(path, index)
+
+    loaded = (BM25.from_state(index["bm25"]), index["table"])
+    _INDEX_CACHE[filepath] = (fingerprint, loaded)
+    return loaded
+
+
+# ============ CROSS-STACK INDEX ============
+def resolve_stacks(spec):
+    """
+    Stack names for "all", a comma-separated string or a list, in
+    AVAILABLE_STACKS order. Raises ValueError for unknown or empty specs.
+    """
+    if isinstance(spec, str):
+        spec = AVAILABLE_STACKS if spec.strip() == "all" else [name.strip() for name in spec.split(",")]
+    requested = [name for name in spec if name]
+    unknown = [name for name in requested if name not in STACK_CONFIG]
+    if unknown or not requested:
+        raise ValueError(f"Unknown stack: {', '.join(unknown) or spec}. Available: {', '.join(AVAILABLE_STACKS)}")
+    return [name for name in AVAILABLE_STACKS if name in requested]
+
+
+def _stack_union_path(stacks):
+    """Location of the compiled index for a set of stacks"""
+    name = "all" if stacks == AVAILABLE_STACKS else "+".join(stacks)
+    return CACHE_DIR / f"stacks__{name}.idx"
+
+
+def _build_stack_union(stacks, filepaths, fingerprints):
+    """
+    One BM25 index over several stack CSVs, so IDF and average document
+    length are shared and scores are comparable across stacks. Rows gain a
+    leading "Stack" column naming their source.
+    """
+    search_cols, output_cols = _STACK_COLS["search_cols"], _STACK_COLS["output_cols"]
+    columns = ["Stack"] + output_cols
+    documents = []
+    rows = []
+    sources = {}
+    for stack, filepath, fingerprint in zip(stacks, filepaths, fingerprints):
+        table = _load_csv(filepath)
+        for idx in range(len(table)):
+            documents.append(" ".join(str(table.get(idx, col)) for col in search_cols))
+            rows.append([stack] + [table.get(idx, col) for col in output_cols])
+        sources[filepath.relative_to(DATA_DIR).as_posix()] = [fingerprint[0], fingerprint[1], _content_hash(filepath)]
+
+    bm25 = BM25()
+    bm25.fit(documents)
+
+    return {
+        "version": INDEX_VERSION,
+        "sources": sources,
+        "bm25": bm25.state(),
+        "table": Table.from_rows(columns, rows)
+    }
+
+
+def _load_stack_union(stacks):
+    """
+    Return (bm25, table) for the unified index over the given stacks, or None
+    when none of their CSVs exist.
+
+    The compiled index is keyed on every source CSV: it is reused while each
+    one's mtime and size (or, failing that, content hash) is unchanged.
+    """
+    pairs = [(stack, DATA_DIR / STACK_CONFIG[stack]["file"]) for stack in stacks]
+    pairs = [(stack, filepath) for stack, filepath in pairs if filepath.exists()]
+    if not pairs:
+        return None
+    stacks = [stack for stack, _ in pairs]
+    filepaths = tuple(filepath for _, filepath in pairs)
+    fingerprints = tuple(_stat_fingerprint(filepath) for filepath in filepaths)
+    cached = _INDEX_CACHE.get(filepaths)
+    if cached and cached[0] == fingerprints:
+        return cached[1]
+
+    with _index_lock(filepaths):
+        cached = _INDEX_CACHE.get(filepaths)
+        if cached and cached[0] == fingerprints:
+            return cached[1]
+
+        path = _stack_union_path(stacks)
+        index = _read_index(path)
+        valid = isinstance(index, dict) and index.get("version") == INDEX_VERSION and index.get("sources") is not None
+        if valid:
+            names = [filepath.relative_to(DATA_DIR).as_posix() for filepath in filepaths]
+            valid = sorted(index["sources"]) == sorted(names)
+            refreshed = False
+            for name, filepath, fingerprint in zip(names, filepaths, fingerprints):
+                if not valid:
+                    break
+                source = index["sources"][name]
+                if (source[0], source[1]) != fingerprint:
+                    valid = source[2] == _content_hash(filepath)
+                    source[0], source[1] = fingerprint
+                    refreshed = True
+            if valid and refreshed:
+                _write_index(path, index)
+        if not valid:
+            index = _build_stack_union(stacks, filepaths, fingerprints)
+            _write_index(path, index)
+
+        loaded = (BM25.from_state(index["bm25"]), index["table"])
+        _INDEX_CACHE[filepaths] = (fingerprints, loaded)
+        return loaded
+
+
+# ============ DATA PACK ============
+# Every dataset compiled into one file:
+#   PACK_MAGIC | header length (uint32 LE) | header JSON | JSON sections
+# The header maps each CSV (relative to DATA_DIR) to the offset and length of
+# its section and the fingerprint it was built from. The pack is memory-mapped
+# and only the sections a search touches are decoded (see _encode_index); a
+# section whose CSV has changed is ignored and that CSV is loaded the usual way.
+PACK_FILE = Path(os.environ.get("UIPRO_PACK_FILE", DATA_DIR / "datasets.pack"))
+PACK_MAGIC = b"UIPROPK\0"
+PACK_VERSION = 2
+_PACK = None  # (stat fingerprint, mmap or None, entries, data offset)
+_PACK_GUARD = threading.Lock()
+
+
+def build_pack(path=None):
+    """
+    Compile every CSV under DATA_DIR into the data pack.
+
+    Domain and stack CSVs are stored as search indices, any other CSV (e.g.
+    ui-reasoning.csv) as a plain Table. Returns a summary dict.
+    """
+    import json
+    import struct
+    path = Path(path) if path else PACK_FILE
+    sources = {config["file"]: (config["search_cols"], config["output_cols"]) for config in CSV_CONFIG.values()}
+    sources.update((config["file"], (_STACK_COLS["search_cols"], _STACK_COLS["output_cols"])) for config in STACK_CONFIG.values())
+
+    entries = {}
+    sections = []
+    offset = 0
+    for filepath in sorted(DATA_DIR.rglob("*.csv")):
+        name = filepath.relative_to(DATA_DIR).as_posix()
+        fingerprint = _stat_fingerprint(filepath)
+        if name in sources:
+            search_cols, output_cols = sources[name]
+            section = _build_index(filepath, search_cols, output_cols, fingerprint)
+            entry = {"kind": "index", "search_cols": list(search_cols), "output_cols": list(output_cols)}
+        else:
+            section = {"table": _load_csv(filepath), "sha256": _content_hash(filepath)}
+            entry = {"kind": "table"}
+        blob = _encode_index(section)
+        entry.update(offset=offset, length=len(blob), mtime_ns=fingerprint[0], size=fingerprint[1], sha256=section["sha256"])
+        entries[name] = entry
+        sections.append(blob)
+        offset += len(blob)
+
+    header = json.dumps({"version": PACK_VERSION, "index_version": INDEX_VERSION, "entries": entries}).encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, 'wb') as f:
+        f.write(PACK_MAGIC + struct.pack("<I", len(header)) + header)
+        for blob in sections:
+            f.write(blob)
+    os.replace(tmp, path)
+    return {"path": str(path), "datasets": len(entries), "bytes": path.stat().st_size}
+
+
+def _open_pack():
+    """Memory-map the data pack once per version of the file; None when it is missing"""
+    global _PACK
+    try:
+        fingerprint = _stat_fingerprint(PACK_FILE)
+    except OSError:
+        return None
+    with _PACK_GUARD:
+        if _PACK is None or _PACK[0] != fingerprint:
+            if _PACK is not None and _PACK[1] is not None:
+                _PACK[1].close()
+            _PACK = _map_pack(fingerprint)
+        return _PACK
+
+
+def _map_pack(fingerprint):
+    """Map PACK_FILE and parse its header; unusable packs map to no entries"""
+    import json
+    import mmap
+    import struct
+    unusable = (fingerprint, None, {}, 0)
+    try:
+        with open(PACK_FILE, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return unusable
+    try:
+        if mm[:len(PACK_MAGIC)] != PACK_MAGIC:
+            raise ValueError("not a data pack")
+        start = len(PACK_MAGIC) + 4
+        (length,) = struct.unpack_from("<I", mm, len(PACK_MAGIC))
+        header = json.loads(mm[start:start + length])
+        if header.get("version") != PACK_VERSION or header.get("index_version") != INDEX_VERSION:
+            raise ValueError("data pack built by another version")
+    except (ValueError, struct.error):
+        mm.close()
+        return unusable
+    return (fingerprint, mm, header["entries"], start + length)
+
+
+def _pack_section(filepath, kind, fingerprint, search_cols=None, output_cols=None):
+    """Decode a CSV's section from the data pack, or None if absent, stale or malformed"""
+    pack = _open_pack()
+    if pack is None or pack[1] is None:
+        return None
+    try:
+        name = filepath.relative_to(DATA_DIR).as_posix()
+    except ValueError:
+        return None
+    entry = pack[2].get(name)
+    if not entry or entry["kind"] != kind:
+        return None
+    if kind == "index" and (entry["search_cols"] != list(search_cols) or entry["output_cols"] != list(output_cols)):
+        return None
+    if (entry["mtime_ns"], entry["size"]) != fingerprint:
+        # Touched but possibly identical (e.g. after a checkout)
+        if entry["size"] != fingerprint[1] or entry["sha256"] != _content_hash(filepath):
+            return None
+    start = pack[3] + entry["offset"]
+    try:
+        blob = pack[1][start:start + entry["length"]]
+    except ValueError:
+        return None  # unmapped by a concurrent reopen after the pack changed
+    return _decode_index(blob)
+
+
+def load_table(filepath):
+    """Table for a CSV, from the data pack when it is current"""
+    section = _pack_section(filepath, "table", _stat_fingerprint(filepath))
+    return section["table"] if section is not None else _load_csv(filepath)
+
+
+def data_version():
+    """Short fingerprint of every data file (path, mtime, size) for cache invalidation"""
+    import hashlib
+    digest = hashlib.sha256()
+    for path in sorted(DATA_DIR.rglob("*.csv")):
+        st = path.stat()
+        digest.update(f"{path.relative_to(DATA_DIR).as_posix()}:{st.st_mtime_ns}:{st.st_size};".encode())
+    return digest.hexdigest()[:16]
+
+
+# ============ SHARED EXECUTOR ============
+SEARCH_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+_EXECUTOR = None
+_EXECUTOR_GUARD = threading.Lock()
+
+
+def get_executor():
+    """
+    Process-wide thread pool for fanning out independent searches.
+
+    Tasks running on it must not block on other tasks submitted to it.
+    """
+    global _EXECUTOR
+    with _EXECUTOR_GUARD:
+        if _EXECUTOR is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _EXECUTOR = ThreadPoolExecutor(max_workers=SEARCH_WORKERS, thread_name_prefix="uipro-search")
+        return _EXECUTOR
 
 
 # ============ SEARCH FUNCTIONS ============
 def _load_csv(filepath):
-    """Load CSV and return list of dicts"""
+    """Load CSV into a column-oriented Table"""
+    import csv
     with open(filepath, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
+        reader = csv.reader(f)
+        header = next(reader, [])
+        return Table.from_rows(header, reader)
 
 
 def _search_csv(filepath, search_cols, output_cols, query, max_results):
@@ -171,45 +1008,48 @@ def _search_csv(filepath, search_cols, output_cols, query, max_results):
     if not filepath.exists():
         return []
 
-    data = _load_csv(filepath)
+    bm25, table = _load_index(filepath, search_cols, output_cols)
 
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+    # Only documents sharing a query token get a score, so all hits are > 0
+    return [table.row(idx) for idx, score in bm25.top_k(query, max_results)]
 
-    # BM25 search
-    bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
-
-    # Get top results with score > 0
-    results = []
-    for idx, score in ranked[:max_results]:
-        if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
-
-    return results
-
-
-def detect_domain(query):
-    """Auto-detect the most relevant domain from query"""
-    query_lower = query.lower()
-
-    domain_keywords = {
-        "color": ["color", "palette", "hex", "#", "rgb"],
-        "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
-        "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
-        "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
-        "prompt": ["prompt", "css", "implementation", "variable", "checklist", "tailwind"],
-        "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora"],
-        "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
-        "typography": ["font", "typography", "heading", "serif", "sans"],
-        "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
-        "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
-        "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
-    }
 
-    scores = {domain: sum(1 for kw in keywords if kw in query_lower) for domain, keywords in domain_keywords.items()}
+def match_domains(query):
+    """
+    Find every domain keyword in the query in a single pass.
+
+    Returns {domain: [(start, end, keyword), ...]} with character positions in
+    the lowercased query, so callers can weight earlier or longer matches.
+    """
+    matches = defaultdict(list)
+    for start, end, (domain, keyword) in _domain_matcher().iter_matches(query.lower()):
+        matches[domain].append((start, end, keyword))
+    return dict(matches)
+
+
+def detect_domain(query, weight=None):
+    """
+    Auto-detect the most relevant domain from query.
+
+    By default a domain scores one point per distinct keyword present. Pass
+    weight(start, end, keyword) to score each distinct keyword's first match
+    instead (e.g. favour early or long matches). Ties go to the domain listed
+    first in DOMAIN_KEYWORDS; no match falls back to "style".
+    """
+    matches = match_domains(query)
+    if not matches:
+        return "style"
+
+    scores = {}
+    for domain in DOMAIN_KEYWORDS:
+        first_hits = {}
+        for start, end, keyword in matches.get(domain, ()):
+            first_hits.setdefault(keyword, (start, end))
+        if weight is None:
+            scores[domain] = len(first_hits)
+        else:
+            scores[domain] = sum(weight(start, end, kw) for kw, (start, end) in first_hits.items())
+
     best = max(scores, key=scores.get)
     return best if scores[best] > 0 else "style"
 
@@ -237,7 +1077,10 @@ def search(query, domain=None, max_results=MAX_RESULTS):
 
 
 def search_stack(query, stack, max_results=MAX_RESULTS):
-    """Search stack-specific guidelines"""
+    """Search stack-specific guidelines ("all" or a comma-separated list searches several)"""
+    if isinstance(stack, (list, tuple)) or stack == "all" or "," in (stack or ""):
+        return search_stacks(query, stack, max_results)
+
     if stack not in STACK_CONFIG:
         return {"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"}
 
@@ -256,3 +1099,178 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
         "count": len(results),
         "results": results
     }
+
+
+def _stacks_header(stacks, query):
+    """Result fields identifying a cross-stack search"""
+    files = [STACK_CONFIG[stack]["file"] for stack in stacks]
+    return {
+        "domain": "stack",
+        "stack": "all" if stacks == AVAILABLE_STACKS else ",".join(stacks),
+        "stacks": stacks,
+        "query": query,
+        "file": "stacks/*.csv" if stacks == AVAILABLE_STACKS else ", ".join(files)
+    }
+
+
+def search_stacks(query, stacks="all", max_results=MAX_RESULTS):
+    """
+    Search several stacks at once and merge them into one ranked list.
+
+    stacks is "all", a comma-separated string or a list of stack names. All
+    of them are scored by a single unified index, and every result carries a
+    "Stack" field naming its source.
+    """
+    try:
+        stacks = resolve_stacks(stacks)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    index = _load_stack_union(stacks)
+    if index is None:
+        return {"error": "Stack files not found", "stack": ",".join(stacks)}
+
+    bm25, table = index
+    results = [table.row(idx) for idx, score in bm25.top_k(query, max_results)]
+
+    result = _stacks_header(stacks, query)
+    result["count"] = len(results)
+    result["results"] = results
+    return result
+
+
+def _resolve_source(query, domain=None, stack=None):
+    """
+    Route a query to the index that answers it.
+
+    Returns (header, key, load, missing): header holds the result fields that
+    identify the source, key identifies the index, load() returns
+    (bm25, table) or None, and missing is the error to report in that case.
+    For an unknown stack, header is the error dict and key is None.
+    """
+    if isinstance(stack, (list, tuple)) or stack == "all" or "," in (stack or ""):
+        try:
+            stacks = resolve_stacks(stack)
+        except ValueError as e:
+            return {"error": str(e)}, None, None, None
+        header = _stacks_header(stacks, query)
+        missing = {"error": "Stack files not found", "stack": header["stack"]}
+        return header, tuple(stacks), lambda: _load_stack_union(stacks), missing
+
+    if stack is not None:
+        if stack not in STACK_CONFIG:
+            return {"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"}, None, None, None
+        file = STACK_CONFIG[stack]["file"]
+        search_cols, output_cols = _STACK_COLS["search_cols"], _STACK_COLS["output_cols"]
+        header = {"domain": "stack", "stack": stack, "query": query, "file": file}
+        missing = {"error": f"Stack file not found: {DATA_DIR / file}", "stack": stack}
+    else:
+        if domain is None:
+            domain = detect_domain(query)
+        config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
+        file = config["file"]
+        search_cols, output_cols = config["search_cols"], config["output_cols"]
+        header = {"domain": domain, "query": query, "file": file}
+        missing = {"error": f"File not found: {DATA_DIR / file}", "domain": domain}
+
+    filepath = DATA_DIR / file
+    return header, file, lambda: _load_index(filepath, search_cols, output_cols) if filepath.exists() else None, missing
+
+
+def stream_search(query, domain=None, stack=None, max_results=MAX_RESULTS):
+    """
+    Incremental form of search() / search_stack().
+
+    Returns (header, rows): header is the full result minus "count" and
+    "results" (or an error dict), and rows is a generator that ranks lazily
+    and materializes each row only as it is consumed.
+    """
+    header, key, load, missing = _resolve_source(query, domain, stack)
+    index = load() if key is not None else None
+    if index is None:
+        return (header if key is None else missing), iter(())
+
+    bm25, table = index
+    ranked = bm25.iter_ranked(bm25.tokenize(query))
+    return header, (table.row(idx) for idx, score in islice(ranked, max(max_results, 0)))
+
+
+def _parse_max_results(value):
+    """max_results of a request as a positive int; ValueError otherwise"""
+    try:
+        count = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid max_results: {value!r}") from None
+    if count < 1:
+        raise ValueError(f"Invalid max_results: {value!r}")
+    return count
+
+
+def _batch_item_error(query, domain, stack):
+    """Why a batch query cannot be run (wrong field types), or None"""
+    if not isinstance(query, str) or not query.strip():
+        return f"Invalid query: {query!r}"
+    if domain is not None and not isinstance(domain, str):
+        return f"Invalid domain: {domain!r}"
+    if stack is not None and not isinstance(stack, str) and not (
+            isinstance(stack, (list, tuple)) and all(isinstance(name, str) for name in stack)):
+        return f"Invalid stack: {stack!r}"
+    return None
+
+
+def search_many(queries, domain=None, max_results=MAX_RESULTS):
+    """
+    Run a batch of searches, yielding one result per query in input order.
+
+    Each query is either a string or a dict with "query" and optional
+    "domain", "stack" and "max_results" overriding the batch defaults;
+    "stack" may name several stacks as in search_stacks().
+    Every query is tokenized once, each data file's index is resolved once
+    for the whole batch, and identical token sets are scored only once.
+    Results have the same shape as search() / search_stack(); a query dict
+    that already carries an "error", has an empty or non-string "query", a
+    non-string "domain" or "stack", or an invalid "max_results", yields
+    {"query": ..., "error": ...} and the batch goes on.
+    """
+    indices = {}
+    ranked_memo = {}
+
+    for item in queries:
+        if isinstance(item, dict):
+            query = item.get("query", "")
+            if "error" in item:
+                yield {"query": query, "error": item["error"]}
+                continue
+            item_domain = item.get("domain", domain)
+            stack = item.get("stack")
+            try:
+                item_max = _parse_max_results(item.get("max_results", max_results))
+            except ValueError as e:
+                yield {"query": query, "error": str(e)}
+                continue
+        else:
+            query, item_domain, stack, item_max = item, domain, None, max_results
+        error = _batch_item_error(query, item_domain, stack)
+        if error:
+            yield {"query": query, "error": error}
+            continue
+
+        header, file, load, missing = _resolve_source(query, item_domain, stack)
+        if file is None:
+            yield header
+            continue
+        if file not in indices:
+            indices[file] = load()
+        if indices[file] is None:
+            yield missing
+            continue
+
+        bm25, table = indices[file]
+        key = (file, tuple(bm25.tokenize(query)), item_max)
+        if key not in ranked_memo:
+            ranked_memo[key] = bm25.top_k_tokens(key[1], item_max)
+        results = [table.row(idx) for idx, score in ranked_memo[key]]
+
+        header["count"] = len(results)
+        header["results"] = results
+        yield header
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search Daemon - keeps every domain and stack index hot in memory
+and answers JSON queries over a Unix domain socket.
+
+Usage:
+    python search.py --serve [--socket PATH]     # Start the daemon
+    python search.py "<query>" [--domain ...]    # Uses the daemon when it is running
+
+    from daemon import DaemonClient
+    with DaemonClient() as client:
+        client.request({"op": "search", "query": "glassmorphism", "domain": "style"})
+
+Protocol (newline-delimited JSON, any number of requests per connection):
+    {"op": "search", "query": "...", "domain": "color", "max_results": 3}
+    {"op": "search_stack", "query": "...", "stack": "react", "max_results": 3}
+    {"op": "search_stack", "query": "...", "stack": "all", "max_results": 3}   # or "react,nextjs"
+    Add "rerank": true to either search op for the semantic second stage (rerank.py)
+    {"op": "ping"}
+    {"op": "shutdown"}
+"""
+
+import os
+
+from core import CSV_CONFIG, STACK_CONFIG, AVAILABLE_STACKS, DATA_DIR, MAX_RESULTS, _STACK_COLS, _load_index, _load_stack_union, _parse_max_results, search, search_stack
+
+
+# ============ CONFIGURATION ============
+# json/socket/socketserver are imported on demand: a client with no daemon
+# running only needs to see that the socket file is missing
+_UID = os.getuid() if hasattr(os, "getuid") else "user"
+_TMP_DIR = os.environ.get("TMPDIR") or os.environ.get("TEMP") or os.environ.get("TMP") or "/tmp"
+DEFAULT_SOCKET = os.environ.get("UIPRO_SOCKET") or os.path.join(_TMP_DIR, f"ui-ux-pro-max-{_UID}.sock")
+CONNECT_TIMEOUT = 0.5
+
+
+def is_supported():
+    """Unix domain sockets are unavailable on some platforms (older Windows)"""
+    import socket
+    return hasattr(socket, "AF_UNIX")
+
+
+# ============ SERVER ============
+def warm_indices():
+    """Load every domain and stack index so the first query pays only for scoring"""
+    count = 0
+    for config in CSV_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            _load_index(filepath, config["search_cols"], config["output_cols"])
+            count += 1
+    for config in STACK_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            _load_index(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"])
+            count += 1
+    if _load_stack_union(AVAILABLE_STACKS) is not None:
+        count += 1
+    return count
+
+
+def handle_request(request):
+    """Execute one decoded request and return the response dict"""
+    op = request.get("op", "search")
+    try:
+        max_results = _parse_max_results(request.get("max_results", MAX_RESULTS))
+    except ValueError as e:
+        return {"error": str(e)}
+
+    if request.get("rerank") and op in ("search", "search_stack"):
+        from rerank import search_reranked
+        stack = request.get("stack") if op == "search_stack" else None
+        return search_reranked(request.get("query", ""), request.get("domain"), stack, max_results)
+
+    if op == "search":
+        return search(request.get("query", ""), request.get("domain"), max_results)
+    if op == "search_stack":
+        return search_stack(request.get("query", ""), request.get("stack"), max_results)
+    if op == "ping":
+        return {"status": "ok", "pid": os.getpid()}
+    return {"error": f"Unknown op: {op}"}
+
+
+def _make_server(socket_path):
+    """Build the threaded Unix socket server (imports socketserver on demand)"""
+    import json
+    import socketserver
+    import threading
+
+    class RequestHandler(socketserver.StreamRequestHandler):
+        """Reads newline-delimited JSON requests until the client disconnects"""
+
+        def handle(self):
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                except ValueError as e:
+                    response = {"error": f"Invalid JSON: {e}"}
+                else:
+                    if request.get("op") == "shutdown":
+                        self._reply({"status": "shutting down"})
+                        threading.Thread(target=self.server.shutdown, daemon=True).start()
+                        return
+                    try:
+                        response = handle_request(request)
+                    except Exception as e:
+                        response = {"error": str(e)}
+                self._reply(response)
+
+        def _reply(self, response):
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+    class SearchServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    return SearchServer(socket_path, RequestHandler)
+
+
+def serve(socket_path=DEFAULT_SOCKET):
+    """Run the daemon in the foreground until interrupted or sent a shutdown op"""
+    if not is_supported():
+        raise RuntimeError("Unix domain sockets are not supported on this platform")
+
+    if os.path.exists(socket_path):
+        if ping(socket_path):
+            raise RuntimeError(f"Daemon already running on {socket_path}")
+        os.unlink(socket_path)  # stale socket from a crashed daemon
+
+    count = warm_indices()
+    server = _make_server(socket_path)
+    print(f"UI Pro Max daemon: {count} indices loaded, listening on {socket_path}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+# ============ CLIENT ============
+class DaemonClient:
+    """Persistent connection to a running daemon"""
+
+    def __init__(self, socket_path=DEFAULT_SOCKET, timeout=None):
+        import socket
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            self.sock.connect(socket_path)
+        except OSError:
+            self.sock.close()
+            raise
+        self.sock.settimeout(timeout)
+        self.reader = self.sock.makefile("rb")
+
+    def request(self, request):
+        """Send one request and wait for its response"""
+        import json
+        self.sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError("Daemon closed the connection")
+        return json.loads(line)
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def query(request, socket_path=DEFAULT_SOCKET):
+    """
+    Send a single request to the daemon.
+
+    Returns the response dict, or None when no daemon is reachable so the
+    caller can fall back to in-process search.
+    """
+    if not os.path.exists(socket_path) or not is_supported():
+        return None
+    try:
+        with DaemonClient(socket_path) as client:
+            return client.request(request)
+    except (OSError, ValueError):
+        return None
+
+
+def ping(socket_path=DEFAULT_SOCKET):
+    """True if a daemon answers on socket_path"""
+    response = query({"op": "ping"}, socket_path)
+    return bool(response and response.get("status") == "ok")
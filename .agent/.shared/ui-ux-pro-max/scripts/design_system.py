@@ -11,19 +11,35 @@ Usage:
     # With persistence (Master + Overrides pattern)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True, page="dashboard")
+
+    # Batch (many projects/pages from a JSON or YAML manifest)
+    results = generate_from_manifest("design-systems.json")
 """
 
-import csv
+import bisect
+import hashlib
 import json
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from core import search, DATA_DIR
+from core import search, get_executor, data_version, load_table, KeywordMatcher, Table, CACHE_DIR, CSV_CONFIG, DATA_DIR
 
 
 # ============ CONFIGURATION ============
 REASONING_FILE = "ui-reasoning.csv"
 
+# generate() memoization: bump CACHE_VERSION whenever generate() output changes
+CACHE_VERSION = 1
+CACHE_MAX_ENTRIES = 256
+CACHE_MAX_BYTES = 8 * 1024 * 1024
+CACHE_FILE = CACHE_DIR / "design_system_cache.json"
+# data_version() stats every CSV, so long-lived caches re-check it at most this often
+CACHE_CHECK_SECONDS = 1.0
+
 SEARCH_CONFIG = {
     "product": {"max_results": 1},
     "style": {"max_results": 3},
@@ -33,57 +49,271 @@ SEARCH_CONFIG = {
 }
 
 
+# ============ GENERATION CACHE ============
+class GenerateCache:
+    """
+    LRU cache for DesignSystemGenerator.generate() results.
+
+    Keyed by normalized query and effective project name; bounded by entry
+    count and by the encoded size of the stored results. Values are kept as
+    JSON so every hit returns a fresh copy. With a path, entries are loaded
+    from and written back to disk so repeat runs across processes hit too.
+    Entries are dropped when the data files or CACHE_VERSION change, both on
+    load and (re-checked every CACHE_CHECK_SECONDS) in long-lived processes.
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, max_bytes: int = CACHE_MAX_BYTES, path: Path = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.path = path
+        self.entries = OrderedDict()  # key -> encoded result
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._loaded = path is None
+        self._data_version = None
+        self._checked = 0.0
+
+    @staticmethod
+    def make_key(query: str, project_name: str = None) -> str:
+        """Case and whitespace do not change search results, so normalize both away"""
+        normalized = " ".join(query.lower().split())
+        return json.dumps([normalized, project_name or query.upper()])
+
+    def get(self, key: str):
+        with self._lock:
+            self._load()
+            self._check_version()
+            encoded = self.entries.get(key)
+            if encoded is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+        return json.loads(encoded)
+
+    def put(self, key: str, value: dict):
+        encoded = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._load()
+            self._check_version()
+            if key in self.entries:
+                self.size -= len(self.entries.pop(key))
+            self.entries[key] = encoded
+            self.size += len(encoded)
+            while self.entries and (len(self.entries) > self.max_entries or self.size > self.max_bytes):
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+            self._save()
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.size = 0
+            self._save()
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries), "bytes": self.size}
+
+    def _version(self) -> str:
+        return f"{CACHE_VERSION}:{data_version()}"
+
+    def _check_version(self):
+        """Drop every entry once the data files have changed (caller holds the lock)"""
+        now = time.monotonic()
+        if self._data_version is not None and now - self._checked < CACHE_CHECK_SECONDS:
+            return
+        self._checked = now
+        version = self._version()
+        if self._data_version is not None and version != self._data_version:
+            self.entries.clear()
+            self.size = 0
+        self._data_version = version
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        self._data_version = self._version()
+        self._checked = time.monotonic()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        if stored.get("version") != self._data_version:
+            return
+        for key, encoded in stored.get("entries", []):
+            self.entries[key] = encoded
+            self.size += len(encoded)
+
+    def _save(self):
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({"version": self._data_version or self._version(), "entries": list(self.entries.items())}, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+# Shared in-process cache; generate_design_system(persistent_cache=True) uses the on-disk one
+_MEMORY_CACHE = GenerateCache()
+_DISK_CACHE = None
+
+
+def get_generate_cache(persistent: bool = False) -> GenerateCache:
+    """Return the process-wide generate() cache, optionally the disk-backed one."""
+    global _DISK_CACHE
+    if not persistent:
+        return _MEMORY_CACHE
+    if _DISK_CACHE is None:
+        _DISK_CACHE = GenerateCache(path=CACHE_FILE)
+    return _DISK_CACHE
+
+
+# ============ REASONING RULE INDEX ============
+class ReasoningIndex:
+    """
+    Reasoning rules compiled for category lookup.
+
+    Resolves a category with the same precedence as a linear scan (exact
+    name, then substring either way, then any word of the rule name, each
+    returning the first rule in file order) but without touching every rule:
+    an exact-match dict, an Aho-Corasick matcher over rule names, a joined
+    haystack for "category inside rule name", and a word-to-rules map.
+    """
+
+    def __init__(self, table: Table):
+        self.table = table
+        names = [(name or "").lower() for name in (table.column("UI_Category") if "UI_Category" in table else [""] * len(table))]
+
+        self.exact = {}
+        for idx, name in enumerate(names):
+            self.exact.setdefault(name, idx)
+
+        # Rule name contained in the category
+        self.name_matcher = KeywordMatcher((name, idx) for idx, name in enumerate(names))
+        self.empty_names = [idx for idx, name in enumerate(names) if not name]
+
+        # Category contained in a rule name: one str.find over all names
+        self.haystack = "\x00".join(names)
+        self.offsets = []
+        offset = 0
+        for name in names:
+            self.offsets.append(offset)
+            offset += len(name) + 1
+
+        # Word of a rule name contained in the category
+        self.keyword_rules = {}
+        for idx, name in enumerate(names):
+            for keyword in name.replace("/", " ").replace("-", " ").split():
+                rule_ids = self.keyword_rules.setdefault(keyword, [])
+                if not rule_ids or rule_ids[-1] != idx:
+                    rule_ids.append(idx)
+        self.keyword_matcher = KeywordMatcher((kw, kw) for kw in self.keyword_rules)
+
+    def find(self, category: str) -> dict:
+        """Return the best matching rule for a category, or {}."""
+        category_lower = category.lower()
+
+        idx = self.exact.get(category_lower)
+        if idx is not None:
+            return self.table.row(idx)
+
+        candidates = self.name_matcher.values(category_lower)
+        candidates.update(self.empty_names)
+        pos = self.haystack.find(category_lower)
+        if pos != -1:
+            candidates.add(bisect.bisect_right(self.offsets, pos) - 1)
+        if candidates:
+            return self.table.row(min(candidates))
+
+        keyword_hits = [self.keyword_rules[kw][0] for kw in self.keyword_matcher.values(category_lower)]
+        if keyword_hits:
+            return self.table.row(min(keyword_hits))
+
+        return {}
+
+    @property
+    def rules(self) -> list:
+        """All rules as dicts (materialized on demand)."""
+        return self.table.rows()
+
+
+# ui-reasoning.csv compiled once per process (keyed by mtime/size)
+_REASONING_CACHE = {}
+
+
+def load_reasoning_index() -> ReasoningIndex:
+    """Load and compile ui-reasoning.csv, reusing the compiled index while the file is unchanged."""
+    filepath = DATA_DIR / REASONING_FILE
+    if not filepath.exists():
+        return ReasoningIndex(Table([], []))
+    st = filepath.stat()
+    fingerprint = (st.st_mtime_ns, st.st_size)
+    cached = _REASONING_CACHE.get("index")
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+    index = ReasoningIndex(load_table(filepath))
+    _REASONING_CACHE["index"] = (fingerprint, index)
+    return index
+
+
+def _completed(value):
+    """Wrap an already computed result as a finished future."""
+    from concurrent.futures import Future
+    future = Future()
+    future.set_result(value)
+    return future
+
+
 # ============ DESIGN SYSTEM GENERATOR ============
 class DesignSystemGenerator:
     """Generates design system recommendations from aggregated searches."""
 
-    def __init__(self):
-        self.reasoning_data = self._load_reasoning()
+    def __init__(self, cache: GenerateCache = None):
+        self.reasoning_index = load_reasoning_index()
+        self.cache = cache
+
+    @property
+    def reasoning_data(self) -> list:
+        """Reasoning rules as a list of dicts."""
+        return self.reasoning_index.rules
 
     def _load_reasoning(self) -> list:
         """Load reasoning rules from CSV."""
-        filepath = DATA_DIR / REASONING_FILE
-        if not filepath.exists():
-            return []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return list(csv.DictReader(f))
-
-    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
-        results = {}
+        return load_reasoning_index().rules
+
+    def _multi_domain_search(self, query: str, style_priority: list = None, pending: dict = None) -> dict:
+        """
+        Execute searches across multiple domains concurrently.
+
+        pending maps domains to futures already submitted by the caller; the
+        remaining domains are submitted to the shared executor, so latency is
+        bounded by the slowest domain rather than their sum.
+        """
+        executor = get_executor()
+        pending = dict(pending or {})
         for domain, config in SEARCH_CONFIG.items():
+            if domain in pending:
+                continue
             if domain == "style" and style_priority:
                 # For style, also search with priority keywords
                 priority_query = " ".join(style_priority[:2]) if style_priority else query
                 combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
+                pending[domain] = executor.submit(search, combined_query, domain, config["max_results"])
             else:
-                results[domain] = search(query, domain, config["max_results"])
-        return results
+                pending[domain] = executor.submit(search, query, domain, config["max_results"])
+        return {domain: pending[domain].result() for domain in SEARCH_CONFIG}
 
     def _find_reasoning_rule(self, category: str) -> dict:
         """Find matching reasoning rule for a category."""
-        category_lower = category.lower()
-
-        # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
-
-        # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
-
-        # Try keyword match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            keywords = ui_cat.replace("/", " ").replace("-", " ").split()
-            if any(kw in category_lower for kw in keywords):
-                return rule
-
-        return {}
+        return self.reasoning_index.find(category)
 
     def _apply_reasoning(self, category: str, search_results: dict) -> dict:
         """Apply reasoning rules to search results."""
@@ -161,7 +391,25 @@ class DesignSystemGenerator:
         return search_result.get("results", [])
 
     def generate(self, query: str, project_name: str = None) -> dict:
-        """Generate complete design system recommendation."""
+        """Generate complete design system recommendation (memoized when a cache is set)."""
+        if self.cache is None:
+            return self._generate(query, project_name)
+        key = self.cache.make_key(query, project_name)
+        design_system = self.cache.get(key)
+        if design_system is None:
+            design_system = self._generate(query, project_name)
+            self.cache.put(key, design_system)
+        return design_system
+
+    def _generate(self, query: str, project_name: str = None) -> dict:
+        """Run the searches and reasoning behind generate()."""
+        # Domains that do not depend on the product category start right away
+        executor = get_executor()
+        pending = {
+            domain: executor.submit(search, query, domain, config["max_results"])
+            for domain, config in SEARCH_CONFIG.items() if domain not in ("product", "style")
+        }
+
         # Step 1: First search product to get category
         product_result = search(query, "product", 1)
         product_results = product_result.get("results", [])
@@ -174,8 +422,8 @@ class DesignSystemGenerator:
         style_priority = reasoning.get("style_priority", [])
 
         # Step 3: Multi-domain search with style priority hints
-        search_results = self._multi_domain_search(query, style_priority)
-        search_results["product"] = product_result  # Reuse product search
+        pending["product"] = _completed(product_result)  # Reuse product search
+        search_results = self._multi_domain_search(query, style_priority, pending)
 
         # Step 4: Select best matches from each domain using priority
         style_results = self._extract_results(search_results.get("style", {}))
@@ -460,7 +708,8 @@ def format_markdown(design_system: dict) -> str:
 
 # ============ MAIN ENTRY POINT ============
 def generate_design_system(query: str, project_name: str = None, output_format: str = "ascii", 
-                           persist: bool = False, page: str = None, output_dir: str = None) -> str:
+                           persist: bool = False, page: str = None, output_dir: str = None,
+                           persistent_cache: bool = False) -> str:
     """
     Main entry point for design system generation.
 
@@ -471,11 +720,12 @@ def generate_design_system(query: str, project_name: str = None, output_format:
         persist: If True, save design system to design-system/ folder
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
+        persistent_cache: If True, reuse/store results in the on-disk generate() cache
 
     Returns:
         Formatted design system string
     """
-    generator = DesignSystemGenerator()
+    generator = DesignSystemGenerator(cache=get_generate_cache(persistent_cache))
     design_system = generator.generate(query, project_name)
     
     # Persist to files if requested
@@ -488,9 +738,129 @@ def generate_design_system(query: str, project_name: str = None, output_format:
 
 
 # ============ PERSISTENCE FUNCTIONS ============
+# design-system/<slug>/manifest.json records inputs and output hashes per file
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Timestamps are ignored when deciding whether a persisted file changed
+_GENERATED_LINE = re.compile(r"^(> )?\*\*Generated:\*\* .*$", re.MULTILINE)
+
+
+def _content_digest(content: str) -> str:
+    """SHA-256 of persisted markdown, excluding the Generated timestamp."""
+    return hashlib.sha256(_GENERATED_LINE.sub("", content).encode("utf-8")).hexdigest()
+
+
+def _input_digest(*parts) -> str:
+    """Fingerprint of everything a persisted file is rendered from."""
+    encoded = json.dumps([CACHE_VERSION, *parts], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _data_versions() -> dict:
+    """Content hashes of the data files that persisted output is derived from."""
+    files = sorted({CSV_CONFIG[domain]["file"] for domain in (*SEARCH_CONFIG, "ux")} | {REASONING_FILE})
+    versions = {}
+    for name in files:
+        path = DATA_DIR / name
+        if path.exists():
+            versions[name] = hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+    return versions
+
+
+def _file_digest(path: Path):
+    """_content_digest() of a file on disk, or None if it cannot be read."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return _content_digest(f.read())
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _atomic_write(path: Path, content: str):
+    """Write via a temp file and rename so watchers never see a partial file."""
+    if not path.parent.is_dir():
+        path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp, path)
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write content unless the file already holds the same design rules. Returns True if written."""
+    if _file_digest(path) == _content_digest(content):
+        return False
+    _atomic_write(path, content)
+    return True
+
+
+def _persist_outputs(design_system: dict, design_system_dir: Path, pages: list, query: str = None,
+                     pool=None) -> tuple:
+    """
+    Render and write MASTER.md plus the given (page_name, page_query) overrides.
+
+    A file is skipped without rendering when manifest.json shows the same
+    inputs (design system, page query, data-file versions) and the file on
+    disk still has the recorded hash; otherwise it is rendered (on pool, if
+    given) and written only if its content changed. The manifest itself is
+    rewritten only when its contents change, so unchanged re-runs touch
+    nothing.
+
+    Returns:
+        (written_files, unchanged_files)
+    """
+    manifest_path = design_system_dir / MANIFEST_FILE
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    entries = dict(manifest.get("files", {})) if manifest.get("version") == MANIFEST_VERSION else {}
+
+    data_versions = _data_versions()
+    targets = [("MASTER.md", _input_digest(design_system), None, format_master_md, (design_system,))]
+    for page_name, page_query in pages:
+        rel = f"pages/{page_name.lower().replace(' ', '-')}.md"
+        inputs = _input_digest(design_system, page_name, page_query, data_versions)
+        targets.append((rel, inputs, page_query, format_page_override_md, (design_system, page_name, page_query)))
+
+    written, unchanged, rendering = [], [], []
+    for rel, inputs, page_query, render, args in targets:
+        path = design_system_dir / rel
+        entry = entries.get(rel, {})
+        if entry.get("inputs") == inputs and _file_digest(path) == entry.get("hash"):
+            unchanged.append(str(path))
+            continue
+        future = pool.submit(render, *args) if pool else _completed(render(*args))
+        rendering.append((rel, inputs, page_query, path, future))
+
+    for rel, inputs, page_query, path, future in rendering:
+        content = future.result()
+        (written if _write_if_changed(path, content) else unchanged).append(str(path))
+        entries[rel] = {"inputs": inputs, "hash": _content_digest(content)}
+        if page_query is not None:
+            entries[rel]["page_query"] = page_query
+
+    updated = {
+        "version": MANIFEST_VERSION,
+        "project": design_system.get("project_name"),
+        "query": query if query is not None else manifest.get("query"),
+        "data_versions": data_versions,
+        "files": entries
+    }
+    if updated != manifest:
+        _atomic_write(manifest_path, json.dumps(updated, indent=2, ensure_ascii=False) + "\n")
+
+    return written, unchanged
+
+
 def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None) -> dict:
     """
     Persist design system to design-system/<project>/ folder using Master + Overrides pattern.
+
+    Writes are incremental: files are rewritten (atomically) only when their
+    content changes, and re-runs with unchanged inputs are a no-op.
     
     Args:
         design_system: The generated design system dictionary
@@ -499,7 +869,7 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
         page_query: Optional query string for intelligent page override generation
     
     Returns:
-        dict with created file paths and status
+        dict with created file paths, which of them were written or unchanged, and status
     """
     base_dir = Path(output_dir) if output_dir else Path.cwd()
     
@@ -508,37 +878,109 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
     project_slug = project_name.lower().replace(' ', '-')
     
     design_system_dir = base_dir / "design-system" / project_slug
-    pages_dir = design_system_dir / "pages"
-    
-    created_files = []
-    
-    # Create directories
-    design_system_dir.mkdir(parents=True, exist_ok=True)
-    pages_dir.mkdir(parents=True, exist_ok=True)
-    
-    master_file = design_system_dir / "MASTER.md"
-    
-    # Generate and write MASTER.md
-    master_content = format_master_md(design_system)
-    with open(master_file, 'w', encoding='utf-8') as f:
-        f.write(master_content)
-    created_files.append(str(master_file))
-    
-    # If page is specified, create page override file with intelligent content
+    pages = [(page, page_query)] if page else []
+    written, unchanged = _persist_outputs(design_system, design_system_dir, pages, page_query)
+
+    created_files = [str(design_system_dir / "MASTER.md")]
     if page:
-        page_file = pages_dir / f"{page.lower().replace(' ', '-')}.md"
-        page_content = format_page_override_md(design_system, page, page_query)
-        with open(page_file, 'w', encoding='utf-8') as f:
-            f.write(page_content)
-        created_files.append(str(page_file))
+        created_files.append(str(design_system_dir / "pages" / f"{page.lower().replace(' ', '-')}.md"))
     
     return {
         "status": "success",
         "design_system_dir": str(design_system_dir),
-        "created_files": created_files
+        "created_files": created_files,
+        "written_files": written,
+        "unchanged_files": unchanged
     }
 
 
+# ============ BATCH GENERATION ============
+def load_manifest(manifest_path: str) -> list:
+    """
+    Load a batch manifest (JSON, or YAML when PyYAML is installed).
+
+    Accepts either a list of projects or {"output_dir": ..., "projects": [...]}.
+    Each project: {"name", "query", optional "output_dir", optional "pages"},
+    where a page is a name or {"name", optional "query"}. Raises ValueError
+    for projects without a query and pages without a name.
+    """
+    path = Path(manifest_path)
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix.lower() in (".yml", ".yaml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("YAML manifests require PyYAML (pip install pyyaml); use JSON otherwise")
+            manifest = yaml.safe_load(f)
+        else:
+            manifest = json.load(f)
+
+    if isinstance(manifest, dict):
+        default_dir = manifest.get("output_dir")
+        projects = manifest.get("projects", [])
+    else:
+        default_dir = None
+        projects = manifest or []
+
+    # Merge repeated projects so each master is generated only once
+    merged = {}
+    for project in projects:
+        if not project.get("query"):
+            raise ValueError(f"Manifest project without a query: {project}")
+        output_dir = project.get("output_dir", default_dir)
+        key = (project["query"], project.get("name"), output_dir)
+        entry = merged.setdefault(key, {"name": project.get("name"), "query": project["query"],
+                                        "output_dir": output_dir, "pages": []})
+        for page in project.get("pages", []):
+            page = {"name": page} if isinstance(page, str) else page
+            if not isinstance(page, dict) or not isinstance(page.get("name"), str) or not page["name"].strip():
+                raise ValueError(f"Manifest page without a name in project {project.get('name')!r}: {page}")
+            page = dict(page)
+            page.setdefault("query", project["query"])
+            if page not in entry["pages"]:
+                entry["pages"].append(page)
+    return list(merged.values())
+
+
+def generate_from_manifest(manifest_path: str, output_dir: str = None, persistent_cache: bool = False,
+                           workers: int = None) -> list:
+    """
+    Generate and persist design systems for every project/page in a manifest.
+
+    Each project's master is generated and written once; its page overrides
+    are rendered in parallel. Persistence is incremental, as in
+    persist_design_system(). Files go to the project's own output_dir, else
+    the manifest's, else `output_dir`, else the current directory.
+
+    Returns:
+        list of dicts with project, design_system_dir, written and unchanged files
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    generator = DesignSystemGenerator(cache=get_generate_cache(persistent_cache))
+    summaries = []
+
+    # Page rendering waits on searches from the shared executor, so it needs its own pool
+    with ThreadPoolExecutor(max_workers=workers or min(8, (os.cpu_count() or 1) + 4)) as pool:
+        for project in load_manifest(manifest_path):
+            design_system = generator.generate(project["query"], project["name"])
+            base_dir = Path(project["output_dir"] or output_dir or Path.cwd())
+            project_slug = design_system.get("project_name", "default").lower().replace(' ', '-')
+            design_system_dir = base_dir / "design-system" / project_slug
+
+            pages = [(page["name"], page["query"]) for page in project["pages"]]
+            written, unchanged = _persist_outputs(design_system, design_system_dir, pages, project["query"], pool)
+
+            summaries.append({
+                "project": design_system.get("project_name"),
+                "design_system_dir": str(design_system_dir),
+                "written": written,
+                "unchanged": unchanged
+            })
+
+    return summaries
+
+
 def format_master_md(design_system: dict) -> str:
     """Format design system as MASTER.md with hierarchical override logic."""
     project = design_system.get("project_name", "PROJECT")
@@ -918,16 +1360,18 @@ def _generate_intelligent_overrides(page_name: str, page_query: str, design_syst
     Uses the existing search infrastructure to find relevant style, UX, and layout
     data instead of hardcoded page types.
     """
-    from core import search
-    
     page_lower = page_name.lower()
     query_lower = (page_query or "").lower()
     combined_context = f"{page_lower} {query_lower}"
     
-    # Search across multiple domains for page-specific guidance
-    style_search = search(combined_context, "style", max_results=1)
-    ux_search = search(combined_context, "ux", max_results=3)
-    landing_search = search(combined_context, "landing", max_results=1)
+    # Search across multiple domains for page-specific guidance (concurrently)
+    executor = get_executor()
+    style_future = executor.submit(search, combined_context, "style", 1)
+    ux_future = executor.submit(search, combined_context, "ux", 3)
+    landing_future = executor.submit(search, combined_context, "landing", 1)
+    style_search = style_future.result()
+    ux_search = ux_future.result()
+    landing_search = landing_future.result()
     
     # Extract results from search response
     style_results = style_search.get("results", [])
@@ -1017,27 +1461,41 @@ def _generate_intelligent_overrides(page_name: str, page_query: str, design_syst
     }
 
 
+# Page type keyword groups, checked in priority order
+PAGE_PATTERNS = [
+    (["dashboard", "admin", "analytics", "data", "metrics", "stats", "monitor", "overview"], "Dashboard / Data View"),
+    (["checkout", "payment", "cart", "purchase", "order", "billing"], "Checkout / Payment"),
+    (["settings", "profile", "account", "preferences", "config"], "Settings / Profile"),
+    (["landing", "marketing", "homepage", "hero", "home", "promo"], "Landing / Marketing"),
+    (["login", "signin", "signup", "register", "auth", "password"], "Authentication"),
+    (["pricing", "plans", "subscription", "tiers", "packages"], "Pricing / Plans"),
+    (["blog", "article", "post", "news", "content", "story"], "Blog / Article"),
+    (["product", "item", "detail", "pdp", "shop", "store"], "Product Detail"),
+    (["search", "results", "browse", "filter", "catalog", "list"], "Search Results"),
+    (["empty", "404", "error", "not found", "zero"], "Empty State"),
+]
+
+_PAGE_TYPE_MATCHER = None
+
+
+def _page_type_matcher() -> KeywordMatcher:
+    """Compile PAGE_PATTERNS on first use; values are group priorities."""
+    global _PAGE_TYPE_MATCHER
+    if _PAGE_TYPE_MATCHER is None:
+        _PAGE_TYPE_MATCHER = KeywordMatcher(
+            (kw, priority) for priority, (keywords, _) in enumerate(PAGE_PATTERNS) for kw in keywords
+        )
+    return _PAGE_TYPE_MATCHER
+
+
 def _detect_page_type(context: str, style_results: list) -> str:
     """Detect page type from context and search results."""
     context_lower = context.lower()
     
-    # Check for common page type patterns
-    page_patterns = [
-        (["dashboard", "admin", "analytics", "data", "metrics", "stats", "monitor", "overview"], "Dashboard / Data View"),
-        (["checkout", "payment", "cart", "purchase", "order", "billing"], "Checkout / Payment"),
-        (["settings", "profile", "account", "preferences", "config"], "Settings / Profile"),
-        (["landing", "marketing", "homepage", "hero", "home", "promo"], "Landing / Marketing"),
-        (["login", "signin", "signup", "register", "auth", "password"], "Authentication"),
-        (["pricing", "plans", "subscription", "tiers", "packages"], "Pricing / Plans"),
-        (["blog", "article", "post", "news", "content", "story"], "Blog / Article"),
-        (["product", "item", "detail", "pdp", "shop", "store"], "Product Detail"),
-        (["search", "results", "browse", "filter", "catalog", "list"], "Search Results"),
-        (["empty", "404", "error", "not found", "zero"], "Empty State"),
-    ]
-    
-    for keywords, page_type in page_patterns:
-        if any(kw in context_lower for kw in keywords):
-            return page_type
+    # Check for common page type patterns (highest-priority group wins)
+    groups = _page_type_matcher().values(context_lower)
+    if groups:
+        return PAGE_PATTERNS[min(groups)][1]
     
     # Fallback: try to infer from style results
     if style_results:
@@ -1060,8 +1518,9 @@ if __name__ == "__main__":
     parser.add_argument("query", help="Search query (e.g., 'SaaS dashboard')")
     parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name")
     parser.add_argument("--format", "-f", choices=["ascii", "markdown"], default="ascii", help="Output format")
+    parser.add_argument("--cache", action="store_true", help="Reuse results from the on-disk design system cache")
 
     args = parser.parse_args()
 
-    result = generate_design_system(args.query, args.project_name, args.format)
+    result = generate_design_system(args.query, args.project_name, args.format, persistent_cache=args.cache)
     print(result)
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Rerank - optional semantic second stage for BM25 search
+
+BM25 only rewards shared words, so rows describing the same thing in other
+terms ("fintech" vs "banking app") rank low. This module embeds every row with
+a small local latent semantic model (signed hashing TF-IDF reduced by SVD; no
+network, no downloads) and reorders the BM25 top-N by a blend of the BM25
+score and cosine similarity.
+
+Vectors are computed once per dataset and stored under CACHE_DIR/vectors as
+.npy files that are memory-mapped on load; they are rebuilt when a source CSV
+changes. Requires NumPy: without it search_reranked() returns the plain BM25
+results (with "reranked": false).
+
+Usage:
+    python search.py "<query>" --domain product --rerank
+    python rerank.py --build                  # precompute vectors for every dataset
+    python rerank.py --benchmark [-n 3]       # per-query latency, BM25 vs BM25 + rerank
+"""
+
+import json
+import os
+import threading
+import zlib
+from math import log
+
+from core import (
+    BM25, CACHE_DIR, CSV_CONFIG, STACK_CONFIG, AVAILABLE_STACKS, DATA_DIR, MAX_RESULTS, _STACK_COLS,
+    _get_numpy, _load_csv, _resolve_source, _stat_fingerprint, search, search_stack
+)
+
+
+# ============ CONFIGURATION ============
+VECTOR_DIR = CACHE_DIR / "vectors"
+MODEL_VERSION = 1
+HASH_FEATURES = 2048  # hashed vocabulary size
+DIMENSIONS = 64       # SVD components kept per dataset
+CANDIDATES = 20       # BM25 results reranked (at least 4x max_results)
+BM25_WEIGHT = 0.6     # final = BM25_WEIGHT * bm25 / max(bm25) + (1 - BM25_WEIGHT) * cosine
+
+_TOKENIZER = BM25()
+# key -> (source fingerprints, (doc_vectors, projection, idf))
+_VECTORS = {}
+_VECTORS_GUARD = threading.Lock()
+
+
+# ============ MODEL ============
+def _hashed_terms(text):
+    """Signed hashing-trick term counts: {bucket: count}, collisions partly cancel"""
+    counts = {}
+    for token in _TOKENIZER.tokenize(text):
+        h = zlib.crc32(token.encode("utf-8"))
+        bucket = h % HASH_FEATURES
+        counts[bucket] = counts.get(bucket, 0) + (1 if h & 0x80000000 else -1)
+    return counts
+
+
+def _sources(key):
+    """(csv path, search columns) feeding an index key from core._resolve_source()"""
+    if isinstance(key, tuple):
+        # Missing stack CSVs are left out of the union index too (core._load_stack_union)
+        paths = [DATA_DIR / STACK_CONFIG[stack]["file"] for stack in key]
+        return [(filepath, _STACK_COLS["search_cols"]) for filepath in paths if filepath.exists()]
+    for config in CSV_CONFIG.values():
+        if config["file"] == key:
+            return [(DATA_DIR / key, config["search_cols"])]
+    return [(DATA_DIR / key, _STACK_COLS["search_cols"])]
+
+
+def _vector_name(key):
+    """File stem for a dataset's vectors"""
+    if isinstance(key, tuple):
+        return "stacks__" + ("all" if list(key) == AVAILABLE_STACKS else "+".join(key))
+    return key[:-len(".csv")].replace("/", "__")
+
+
+def _documents(key):
+    """Row texts in index order (same search columns BM25 indexes)"""
+    documents = []
+    for filepath, search_cols in _sources(key):
+        table = _load_csv(filepath)
+        documents.extend(" ".join(str(table.get(idx, col)) for col in search_cols) for idx in range(len(table)))
+    return documents
+
+
+def _save(path, array):
+    """Atomically write one .npy file"""
+    np = _get_numpy()
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, 'wb') as f:
+        np.save(f, array)
+    os.replace(tmp, path)
+
+
+def build_vectors(key):
+    """
+    Fit the hashed TF-IDF + SVD model for one dataset and write its files:
+    <name>.docs.npy (rows x DIMENSIONS, unit length), <name>.proj.npy
+    (HASH_FEATURES x DIMENSIONS), <name>.idf.npy and <name>.json metadata.
+    """
+    np = _get_numpy()
+    documents = _documents(key)
+    n = len(documents)
+    matrix = np.zeros((n, HASH_FEATURES), dtype=np.float64)
+    for row, text in enumerate(documents):
+        for bucket, count in _hashed_terms(text).items():
+            matrix[row, bucket] = count
+    df = np.count_nonzero(matrix, axis=0)
+    idf = np.log((n + 1) / (df + 1)) + 1
+    matrix = np.sign(matrix) * (1 + np.log(np.maximum(np.abs(matrix), 1))) * (matrix != 0) * idf
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix /= np.where(norms == 0, 1, norms)
+
+    # Rows span at most n dimensions, so economy SVD on the n x HASH_FEATURES matrix is cheap
+    _, _, vt = np.linalg.svd(matrix, full_matrices=False)
+    projection = vt[:DIMENSIONS].T.astype(np.float32)
+    docs = (matrix @ projection).astype(np.float32)
+    lengths = np.linalg.norm(docs, axis=1, keepdims=True)
+    docs /= np.where(lengths == 0, 1, lengths)
+
+    name = _vector_name(key)
+    VECTOR_DIR.mkdir(parents=True, exist_ok=True)
+    _save(VECTOR_DIR / f"{name}.docs.npy", docs)
+    _save(VECTOR_DIR / f"{name}.proj.npy", projection)
+    _save(VECTOR_DIR / f"{name}.idf.npy", idf.astype(np.float32))
+    meta = {
+        "version": MODEL_VERSION,
+        "features": HASH_FEATURES,
+        "dimensions": DIMENSIONS,
+        "rows": n,
+        "sources": {filepath.relative_to(DATA_DIR).as_posix(): list(_stat_fingerprint(filepath))
+                    for filepath, _ in _sources(key)}
+    }
+    (VECTOR_DIR / f"{name}.json").write_text(json.dumps(meta), encoding="utf-8")
+    return meta
+
+
+def load_vectors(key):
+    """(doc_vectors, projection, idf) for a dataset, memory-mapped; rebuilt when stale"""
+    np = _get_numpy()
+    fingerprints = {filepath.relative_to(DATA_DIR).as_posix(): list(_stat_fingerprint(filepath))
+                    for filepath, _ in _sources(key)}
+    cached = _VECTORS.get(key)
+    if cached and cached[0] == fingerprints:
+        return cached[1]
+
+    with _VECTORS_GUARD:
+        cached = _VECTORS.get(key)
+        if cached and cached[0] == fingerprints:
+            return cached[1]
+        name = _vector_name(key)
+        try:
+            meta = json.loads((VECTOR_DIR / f"{name}.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            meta = None
+        current = (
+            isinstance(meta, dict)
+            and meta.get("version") == MODEL_VERSION
+            and meta.get("features") == HASH_FEATURES
+            and meta.get("dimensions") == DIMENSIONS
+            and meta.get("sources") == fingerprints
+        )
+        if not current:
+            build_vectors(key)
+        vectors = tuple(np.load(VECTOR_DIR / f"{name}.{part}.npy", mmap_mode='r') for part in ("docs", "proj", "idf"))
+        _VECTORS[key] = (fingerprints, vectors)
+        return vectors
+
+
+def embed_query(query, projection, idf):
+    """Project a query into the dataset's latent space (unit length, or zeros)"""
+    np = _get_numpy()
+    vector = np.zeros(projection.shape[1], dtype=np.float64)
+    for bucket, count in _hashed_terms(query).items():
+        if count == 0:
+            continue  # colliding terms cancelled out
+        weight = (1 if count > 0 else -1) * (1 + log(abs(count))) * idf[bucket]
+        vector += weight * projection[bucket]
+    length = np.linalg.norm(vector)
+    return vector / length if length else vector
+
+
+# ============ RERANKING ============
+def rerank(query, candidates, vectors, k):
+    """
+    Reorder BM25 (doc_idx, score) candidates by
+    BM25_WEIGHT * score / max score + (1 - BM25_WEIGHT) * max(cosine, 0);
+    returns the best k (doc_idx, combined score), ties by doc order.
+    """
+    if not candidates:
+        return []
+    np = _get_numpy()
+    docs, projection, idf = vectors
+    query_vector = embed_query(query, projection, idf)
+    ids = np.array([idx for idx, _ in candidates])
+    cosine = np.maximum(docs[ids] @ query_vector, 0).tolist()
+    top = max(score for _, score in candidates)
+    combined = [(idx, BM25_WEIGHT * score / top + (1 - BM25_WEIGHT) * cos)
+                for (idx, score), cos in zip(candidates, cosine)]
+    combined.sort(key=lambda item: (-item[1], item[0]))
+    return combined[:k]
+
+
+def search_reranked(query, domain=None, stack=None, max_results=MAX_RESULTS):
+    """
+    search() / search_stack() with the semantic second stage: the BM25 top
+    max(CANDIDATES, 4 * max_results) are reranked and the best max_results
+    returned. Falls back to plain BM25 when NumPy is unavailable.
+    """
+    if _get_numpy() is None:
+        result = search_stack(query, stack, max_results) if stack is not None else search(query, domain, max_results)
+        result["reranked"] = False
+        return result
+
+    header, key, load, missing = _resolve_source(query, domain, stack)
+    if key is None:
+        return header
+    index = load()
+    if index is None:
+        return missing
+
+    bm25, table = index
+    candidates = bm25.top_k(query, max(CANDIDATES, 4 * max_results))
+    ranked = rerank(query, candidates, load_vectors(key), max_results)
+    results = [table.row(idx) for idx, _ in ranked]
+
+    header["count"] = len(results)
+    header["results"] = results
+    header["reranked"] = True
+    return header
+
+
+# ============ OFFLINE BUILD / BENCHMARK ============
+def build_all():
+    """Precompute vectors for every domain and stack dataset (and the all-stacks union)"""
+    keys = [config["file"] for config in CSV_CONFIG.values()]
+    keys += [config["file"] for config in STACK_CONFIG.values()]
+    keys.append(tuple(AVAILABLE_STACKS))
+    return {_vector_name(key): build_vectors(key)["rows"] for key in keys}
+
+
+BENCHMARK_QUERIES = [
+    ("fintech", "product"), ("banking app", "product"), ("online store luxury", "product"),
+    ("calm wellness", "style"), ("futuristic neon", "style"), ("minimal clean professional", "style"),
+    ("healthcare trust", "color"), ("playful kids", "typography"), ("accessibility keyboard", "ux"),
+    ("social proof pricing", "landing")
+]
+
+
+def benchmark(repeat=200, max_results=MAX_RESULTS):
+    """Mean / p95 warm latency per query in ms for BM25 alone and BM25 + rerank"""
+    import time
+
+    def measure(fn):
+        samples = []
+        for _ in range(repeat):
+            for query, domain in BENCHMARK_QUERIES:
+                start = time.perf_counter()
+                fn(query, domain, max_results=max_results)
+                samples.append((time.perf_counter() - start) * 1000)
+        samples.sort()
+        return {"mean_ms": sum(samples) / len(samples), "p95_ms": samples[int(len(samples) * 0.95)]}
+
+    for query, domain in BENCHMARK_QUERIES:  # load indices and vectors first
+        search_reranked(query, domain, max_results=max_results)
+    return {"bm25": measure(search), "bm25+rerank": measure(search_reranked)}
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="UI Pro Max semantic reranker")
+    parser.add_argument("--build", action="store_true", help="Precompute vectors for every dataset")
+    parser.add_argument("--benchmark", action="store_true", help="Measure per-query latency with and without reranking")
+    parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Results per benchmark query (default: 3)")
+    args = parser.parse_args()
+
+    if _get_numpy() is None:
+        parser.exit(1, "NumPy is required for reranking (pip install numpy)\n")
+    if args.build:
+        for name, rows in build_all().items():
+            print(f"✅ {name}: {rows} vectors")
+    if args.benchmark:
+        for stage, stats in benchmark(max_results=args.max_results).items():
+            print(f"{stage:12} mean {stats['mean_ms']:.3f} ms | p95 {stats['p95_ms']:.3f} ms")
+    if not (args.build or args.benchmark):
+        parser.print_help()
@@ -5,73 +5,244 @@ UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
        python search.py "<query>" --design-system [-p "Project Name"]
        python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
+       python search.py --manifest design-systems.json [-o <dir>]
+       python search.py "<query>" --stack all|react,nextjs,shadcn
+       python search.py "<query>" [--domain <domain>] --jsonl
+       python search.py --batch queries.jsonl [--domain <domain>] [--stack <stack>]
+       python search.py --serve [--socket PATH]
+       python search.py --build-pack
+       python search.py "<query>" --profile-startup
 
 Domains: style, prompt, color, chart, landing, product, ux, typography
-Stacks: html-tailwind, react, nextjs
+Stacks: html-tailwind, react, nextjs, ... ("all" or a comma-separated list searches
+        several stacks in one ranked list, each result tagged with its Stack)
 
 Persistence (Master + Overrides pattern):
   --persist    Save design system to design-system/MASTER.md
   --page       Also create a page-specific override file in design-system/pages/
+
+Manifest mode:
+  --manifest   Generate and persist design systems for every project and page
+               listed in a JSON/YAML manifest; unchanged files are not rewritten
+
+Semantic rerank:
+  --rerank     Reorder the BM25 top-N with local hashed TF-IDF/SVD row vectors
+               (rerank.py; needs NumPy, otherwise plain BM25 results)
+
+Streaming output:
+  --jsonl      Write one compact JSON object per result ({..header, "rank",
+               "result"}) as soon as it is ranked, instead of one --json document
+
+Batch mode:
+  --batch      Read newline-delimited queries (plain text or JSON objects with
+               "query" and optional "domain"/"stack"/"max_results") from a file
+               or "-" for stdin, and stream one JSON result per line
+
+Daemon (indices kept hot in memory):
+  --serve      Answer JSON queries over a Unix domain socket (see daemon.py)
+  Domain and stack searches use a running daemon automatically and fall back
+  to in-process search when none is reachable (--no-daemon to force that).
+
+Data pack:
+  --build-pack Compile every CSV into data/datasets.pack, which is memory-mapped
+               at search time instead of parsing CSVs; datasets edited since the
+               pack was built are read from their CSVs until it is rebuilt
 """
 
+import time
+_STARTED = time.perf_counter()
+
 import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system, persist_design_system
+import sys
+from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack, search_many, stream_search, build_pack, resolve_stacks
+import daemon
 
+# design_system and json are imported only by the code paths that use them
+# (--json/--batch output, daemon traffic once a socket exists, the data pack
+# and on-disk index cache), so the import time reported by --profile-startup
+# stays small
+_IMPORTED = time.perf_counter()
 
-def format_output(result):
-    """Format results for Claude consumption (token-optimized)"""
+
+def iter_format_output(result):
+    """Yield the lines of format_output() one at a time"""
     if "error" in result:
-        return f"Error: {result['error']}"
+        yield f"Error: {result['error']}"
+        return
 
-    output = []
     if result.get("stack"):
-        output.append(f"## UI Pro Max Stack Guidelines")
-        output.append(f"**Stack:** {result['stack']} | **Query:** {result['query']}")
+        yield f"## UI Pro Max Stack Guidelines"
+        yield f"**Stack:** {result['stack']} | **Query:** {result['query']}"
     else:
-        output.append(f"## UI Pro Max Search Results")
-        output.append(f"**Domain:** {result['domain']} | **Query:** {result['query']}")
-    output.append(f"**Source:** {result['file']} | **Found:** {result['count']} results\n")
+        yield f"## UI Pro Max Search Results"
+        yield f"**Domain:** {result['domain']} | **Query:** {result['query']}"
+    yield f"**Source:** {result['file']} | **Found:** {result['count']} results\n"
 
     for i, row in enumerate(result['results'], 1):
-        output.append(f"### Result {i}")
+        yield f"### Result {i}"
         for key, value in row.items():
             value_str = str(value)
             if len(value_str) > 300:
                 value_str = value_str[:300] + "..."
-            output.append(f"- **{key}:** {value_str}")
-        output.append("")
+            yield f"- **{key}:** {value_str}"
+        yield ""
+
+
+def format_output(result):
+    """Format results for Claude consumption (token-optimized)"""
+    return "\n".join(iter_format_output(result))
+
+
+def iter_jsonl(header, rows):
+    """
+    Encode a search as compact JSON lines: one object per result, carrying
+    the header fields plus "rank" and "result", produced as rows arrive.
+    """
+    import json
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    if "error" in header:
+        yield encode(header)
+        return
+    for rank, row in enumerate(rows, 1):
+        yield encode({**header, "rank": rank, "result": row})
 
-    return "\n".join(output)
+
+def run_jsonl(request, socket_path=daemon.DEFAULT_SOCKET, use_daemon=True, out=sys.stdout):
+    """--jsonl: write each result line as soon as it is ranked (or as received from the daemon)"""
+    response = daemon.query(request, socket_path) if use_daemon else None
+    if response is None and request.get("rerank"):
+        response = daemon.handle_request(request)
+    if response is not None:
+        header = {key: value for key, value in response.items() if key not in ("count", "results")}
+        rows = response.get("results", [])
+    else:
+        header, rows = stream_search(request["query"], request.get("domain"), request.get("stack"), request["max_results"])
+    for line in iter_jsonl(header, rows):
+        out.write(line + "\n")
+        out.flush()
+
+
+def stack_arg(value):
+    """argparse type for --stack: one stack, a comma-separated list or "all" """
+    try:
+        resolve_stacks(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return value
+
+
+def run_query(request, socket_path=daemon.DEFAULT_SOCKET, use_daemon=True):
+    """Answer a search request via the daemon if one is running, else in-process"""
+    if use_daemon:
+        response = daemon.query(request, socket_path)
+        if response is not None:
+            return response
+    return daemon.handle_request(request)
+
+
+def read_batch(lines, domain=None, stack=None, max_results=MAX_RESULTS):
+    """Parse batch input lines into search_many() query dicts"""
+    import json
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            try:
+                item = json.loads(line)
+            except ValueError as e:
+                yield {"query": line, "error": f"Invalid JSON: {e}"}
+                continue
+        else:
+            item = {"query": line}
+        if stack and "stack" not in item and "domain" not in item:
+            item["stack"] = stack
+        item.setdefault("domain", domain)
+        item.setdefault("max_results", max_results)
+        yield item
+
+
+def run_batch(path, domain=None, stack=None, max_results=MAX_RESULTS, out=sys.stdout):
+    """Stream batch results as compact JSONL, one line per input query"""
+    import json
+    f = sys.stdin if path == "-" else open(path, 'r', encoding='utf-8')
+    try:
+        for result in search_many(read_batch(f, domain, stack, max_results)):
+            out.write(json.dumps(result, ensure_ascii=False, separators=(",", ":")) + "\n")
+            out.flush()
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def report_startup(ready, done, out=sys.stderr):
+    """Print import and first-query timings (--profile-startup)"""
+    out.write(
+        f"[profile-startup] imports: {(_IMPORTED - _STARTED) * 1000:.1f} ms"
+        f" | first query: {(done - ready) * 1000:.1f} ms"
+        f" | total: {(done - _STARTED) * 1000:.1f} ms"
+        f" | modules loaded: {len(sys.modules)}\n"
+    )
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
+    parser.add_argument("query", nargs="?", help="Search query")
     parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
-    parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
+    parser.add_argument("--stack", "-s", type=stack_arg, help=f"Stack-specific search ({', '.join(AVAILABLE_STACKS)}; 'all' or a comma-separated list to search several)")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--rerank", action="store_true", help="Rerank BM25 results with local semantic vectors (needs NumPy)")
+    parser.add_argument("--jsonl", action="store_true", help="Stream one compact JSON line per result as it is ranked")
+    parser.add_argument("--batch", type=str, default=None, help="Run newline-delimited queries from a file ('-' for stdin), output JSONL")
     # Design system generation
     parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
     parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
     parser.add_argument("--format", "-f", choices=["ascii", "markdown"], default="ascii", help="Output format for design system")
+    parser.add_argument("--cache", action="store_true", help="Reuse design systems from the on-disk cache across runs")
     # Persistence (Master + Overrides pattern)
     parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
     parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
-    parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
+    parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory; with --manifest, only for projects without their own output_dir)")
+    parser.add_argument("--manifest", type=str, default=None, help="Batch-generate design systems from a JSON/YAML manifest of projects and pages")
+    # Daemon
+    parser.add_argument("--serve", action="store_true", help="Run the search daemon on a Unix domain socket")
+    parser.add_argument("--socket", type=str, default=daemon.DEFAULT_SOCKET, help="Daemon socket path (default: $UIPRO_SOCKET or a per-user temp path)")
+    parser.add_argument("--no-daemon", action="store_true", help="Always search in-process, even if a daemon is running")
+    parser.add_argument("--build-pack", action="store_true", help="Compile all datasets into the memory-mapped data pack")
+    parser.add_argument("--profile-startup", action="store_true", help="Report import and first-query time on stderr")
 
     args = parser.parse_args()
+    ready = time.perf_counter()
 
+    if args.serve:
+        daemon.serve(args.socket)
+    elif args.build_pack:
+        summary = build_pack()
+        print(f"✅ Packed {summary['datasets']} datasets into {summary['path']} ({summary['bytes'] / 1024:.0f} KB)")
+    elif args.batch:
+        run_batch(args.batch, args.domain, args.stack, args.max_results)
+    elif args.manifest:
+        from design_system import generate_from_manifest
+        for summary in generate_from_manifest(args.manifest, args.output_dir, args.cache):
+            print(f"✅ {summary['project']}: {summary['design_system_dir']}")
+            for path in summary["written"]:
+                print(f"   📄 {path} (written)")
+            for path in summary["unchanged"]:
+                print(f"   ⏭️  {path} (unchanged)")
+    elif args.query is None:
+        parser.error("the following arguments are required: query")
     # Design system takes priority
-    if args.design_system:
+    elif args.design_system:
+        from design_system import generate_design_system
         result = generate_design_system(
             args.query, 
             args.project_name, 
             args.format,
             persist=args.persist,
             page=args.page,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            persistent_cache=args.cache
         )
         print(result)
         
@@ -88,19 +259,24 @@ if __name__ == "__main__":
             print(f"📖 Usage: When building a page, check design-system/{project_slug}/pages/[page].md first.")
             print(f"   If exists, its rules override MASTER.md. Otherwise, use MASTER.md.")
             print("=" * 60)
-    # Stack search
-    elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
-        if args.json:
-            import json
-            print(json.dumps(result, indent=2, ensure_ascii=False))
-        else:
-            print(format_output(result))
-    # Domain search
+    # Stack / domain search
     else:
-        result = search(args.query, args.domain, args.max_results)
-        if args.json:
-            import json
-            print(json.dumps(result, indent=2, ensure_ascii=False))
+        if args.stack:
+            request = {"op": "search_stack", "query": args.query, "stack": args.stack, "max_results": args.max_results}
         else:
-            print(format_output(result))
+            request = {"op": "search", "query": args.query, "domain": args.domain, "max_results": args.max_results}
+        if args.rerank:
+            request["rerank"] = True
+        if args.jsonl:
+            run_jsonl(request, args.socket, not args.no_daemon)
+        else:
+            result = run_query(request, args.socket, not args.no_daemon)
+            if args.json:
+                import json
+                print(json.dumps(result, indent=2, ensure_ascii=False))
+            else:
+                for line in iter_format_output(result):
+                    print(line)
+
+    if args.profile_startup:
+        report_startup(ready, time.perf_counter())
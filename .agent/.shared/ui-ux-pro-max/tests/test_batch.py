@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max batch search - malformed --batch lines become error records
+
+Usage:
+    python -m pytest .agent/.shared/ui-ux-pro-max/tests
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from core import search_many
+from search import read_batch, run_batch
+
+
+def run_lines(tmp_path, lines):
+    """Results of search.py --batch --no-daemon for the given input lines"""
+    path = tmp_path / "batch.jsonl"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    out = io.StringIO()
+    run_batch(str(path), out=out)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_null_query_is_reported_and_batch_continues(tmp_path):
+    results = run_lines(tmp_path, ['{"query": null}', 'glassmorphism'])
+    assert results[0] == {"query": None, "error": "Invalid query: None"}
+    assert results[1]["query"] == "glassmorphism" and results[1]["count"] > 0
+
+
+def test_non_string_stack_is_reported_and_batch_continues(tmp_path):
+    results = run_lines(tmp_path, ['{"query": "x", "stack": 5}', '{"query": "hooks", "stack": "react"}'])
+    assert results[0] == {"query": "x", "error": "Invalid stack: 5"}
+    assert results[1]["stack"] == "react" and results[1]["count"] > 0
+
+
+def test_search_many_checks_field_types():
+    items = [{"query": ""}, {"query": "x", "domain": 3}, {"query": "hooks", "stack": ["react", "nextjs"]}]
+    results = list(search_many(read_batch(json.dumps(item) for item in items)))
+    assert [result.get("error") for result in results[:2]] == ["Invalid query: ''", "Invalid domain: 3"]
+    assert results[2]["stacks"] == ["react", "nextjs"]
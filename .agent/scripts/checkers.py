@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Checker Plugins - Antigravity Kit
+=================================
+
+In-process execution of the skill validation scripts.
+
+A validation script is a checker plugin when it defines
+
+    run(project_path: str, inventory: FileInventory) -> dict
+
+(plus an optional `url` keyword for checks against a running site). The
+result is the script's structured report and always contains "passed"; a
+one-line "status" is shown by the orchestrators when present. The script's
+main() stays a thin CLI around run(), so every script still works stand-alone.
+
+checklist.py and verify_all.py import plugins once and call run() in their
+worker threads instead of starting one Python process per check. All checks
+share the same FileInventory and file-content cache (file_inventory.read_text).
+Scripts without run() are still executed as subprocesses.
+
+The shared modules (file_inventory, result_cache) live in this directory; the
+loader puts it on sys.path before importing a plugin. Each skill script also
+adds it when run directly from the command line.
+"""
+
+import sys
+import inspect
+import importlib.util
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import Optional
+
+from file_inventory import FileInventory
+
+KIT_SCRIPTS = Path(__file__).resolve().parent
+
+_MODULES = {}
+_LOCK = threading.Lock()
+
+
+def load_checker(script_path: Path) -> Optional[ModuleType]:
+    """Import a validation script once; None if it is missing or not a plugin"""
+    script_path = Path(script_path).resolve()
+    with _LOCK:
+        if script_path not in _MODULES:
+            module = None
+            if script_path.exists():
+                if str(KIT_SCRIPTS) not in sys.path:
+                    sys.path.insert(0, str(KIT_SCRIPTS))
+                name = f"checker_{script_path.parent.parent.name}_{script_path.stem}".replace("-", "_")
+                spec = importlib.util.spec_from_file_location(name, script_path)
+                try:
+                    module = importlib.util.module_from_spec(spec)
+                    spec.loader.exec_module(module)
+                except Exception:
+                    module = None  # broken import: let the subprocess path report it
+            _MODULES[script_path] = module if callable(getattr(module, "run", None)) else None
+        return _MODULES[script_path]
+
+
+def run_checker(module: ModuleType, project_path: Path, inventory: FileInventory, url: Optional[str] = None) -> dict:
+    """Call a plugin's run(); `url` is passed only to checkers that accept it"""
+    kwargs = {}
+    if url and "url" in inspect.signature(module.run).parameters:
+        kwargs["url"] = url
+    report = module.run(str(project_path), inventory, **kwargs)
+    if not isinstance(report, dict) or "passed" not in report:
+        raise TypeError(f"{module.__name__}.run() must return a dict with 'passed'")
+    return report
+
+
+def summarize(report: dict) -> str:
+    """One-line description of a plugin report"""
+    if report.get("status"):
+        return str(report["status"])
+    counts = [f"{key.replace('_', ' ')}: {report[key]}"
+              for key in ("files_checked", "issues_found", "files_with_issues") if key in report]
+    return ", ".join(counts)
@@ -6,9 +6,27 @@ Master Checklist Runner - Antigravity Kit
 Orchestrates all validation scripts in priority order.
 Use this for incremental validation during development.
 
+Independent checks run concurrently in a bounded worker pool (CPU-heavy
+checks are capped at the core count). A check starts once the checks it
+depends on have finished; if a required check fails, every check depending
+on it is cancelled (only the performance checks declare dependencies) and
+the other checks still run to completion. Only --jobs 1 keeps the original
+behaviour: checks run one at a time in priority order and the first
+required failure stops the checklist.
+
+Skill scripts that implement the checker plugin interface (see checkers.py)
+run in-process and share one file inventory and file-content cache; other
+scripts run as subprocesses. --isolate runs every check as a subprocess.
+
+Per-file findings are cached in .agent/cache/results/ (see result_cache.py),
+so a re-run only re-checks the files that changed since the last one.
+
 Usage:
     python scripts/checklist.py .                    # Run core checks
     python scripts/checklist.py . --url <URL>        # Include performance checks
+    python scripts/checklist.py . --jobs 1           # One at a time, stop at first required failure
+    python scripts/checklist.py . --isolate          # One Python process per check
+    python scripts/checklist.py . --no-cache         # Re-check every file
 
 Priority Order:
     P0: Security Scan (vulnerabilities, secrets)
@@ -20,12 +38,18 @@ Priority Order:
     P6: Performance (lighthouse - requires URL)
 """
 
+import os
 import sys
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+from file_inventory import FileInventory, share_inventory
+from checkers import load_checker, run_checker, summarize
+from result_cache import ENV_VAR as RESULT_CACHE_VAR
+
 # ANSI colors for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -54,21 +78,27 @@ def print_warning(text: str):
 def print_error(text: str):
     print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
 
-# Define priority-ordered checks
+# Define priority-ordered checks:
+# (name, script, required, depends_on, cpu_heavy)
 CORE_CHECKS = [
-    ("Security Scan", ".agent/skills/vulnerability-scanner/scripts/security_scan.py", True),
-    ("Lint Check", ".agent/skills/lint-and-validate/scripts/lint_runner.py", True),
-    ("Schema Validation", ".agent/skills/database-design/scripts/schema_validator.py", False),
-    ("Test Runner", ".agent/skills/testing-patterns/scripts/test_runner.py", False),
-    ("UX Audit", ".agent/skills/frontend-design/scripts/ux_audit.py", False),
-    ("SEO Check", ".agent/skills/seo-fundamentals/scripts/seo_checker.py", False),
+    ("Security Scan", ".agent/skills/vulnerability-scanner/scripts/security_scan.py", True, (), False),
+    ("Lint Check", ".agent/skills/lint-and-validate/scripts/lint_runner.py", True, (), True),
+    ("Schema Validation", ".agent/skills/database-design/scripts/schema_validator.py", False, (), False),
+    ("Test Runner", ".agent/skills/testing-patterns/scripts/test_runner.py", False, (), True),
+    ("UX Audit", ".agent/skills/frontend-design/scripts/ux_audit.py", False, (), False),
+    ("SEO Check", ".agent/skills/seo-fundamentals/scripts/seo_checker.py", False, (), False),
 ]
 
+# Performance checks only make sense once the required core checks pass
 PERFORMANCE_CHECKS = [
-    ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True),
-    ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False),
+    ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True, ("Security Scan", "Lint Check"), True),
+    ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False, ("Security Scan", "Lint Check"), True),
 ]
 
+# Worker pool size, and how many CPU-heavy checks may run at once
+CPU_COUNT = os.cpu_count() or 1
+DEFAULT_JOBS = min(8, CPU_COUNT + 2)
+
 def check_script_exists(script_path: Path) -> bool:
     """Check if script file exists"""
     return script_path.exists() and script_path.is_file()
@@ -125,34 +155,179 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
         print_error(f"{name}: ERROR - {str(e)}")
         return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False}
 
+def run_plugin(name: str, module, project_path: Path, inventory: FileInventory, url: Optional[str] = None) -> dict:
+    """Run a checker plugin in-process; same result shape as run_script plus the structured report"""
+    print_step(f"Running: {name}")
+    try:
+        report = run_checker(module, project_path, inventory, url)
+    except Exception as e:
+        print_error(f"{name}: ERROR - {str(e)}")
+        return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False}
+    
+    passed = bool(report["passed"])
+    summary = summarize(report)
+    if passed:
+        print_success(f"{name}: PASSED")
+    else:
+        print_error(f"{name}: FAILED")
+        if summary:
+            print(f"  {summary}")
+    
+    return {
+        "name": name,
+        "passed": passed,
+        "output": summary,
+        "error": "" if passed else summary,
+        "skipped": False,
+        "report": report
+    }
+
+def execute_check(name: str, script_path: Path, project_path: Path, inventory: Optional[FileInventory],
+                  url: Optional[str] = None) -> dict:
+    """In-process when the script is a checker plugin (and inventory is shared), else a subprocess"""
+    module = load_checker(script_path) if inventory is not None and check_script_exists(script_path) else None
+    if module is None:
+        return run_script(name, script_path, str(project_path), url)
+    return run_plugin(name, module, project_path, inventory, url)
+
+def cancelled_result(name: str, reason: str) -> dict:
+    """Result for a check that never ran because a required dependency failed"""
+    print_warning(f"{name}: CANCELLED ({reason})")
+    return {"name": name, "passed": False, "output": "", "error": reason, "skipped": True, "cancelled": True}
+
+def find_cycle(checks: List[Tuple]) -> Optional[List[str]]:
+    """A dependency cycle among the checks (names in order), or None"""
+    graph = {check[0]: list(check[3]) for check in checks}
+    state = {}  # name -> "visiting" | "done"
+
+    def visit(name, path):
+        state[name] = "visiting"
+        for dep in graph[name]:
+            if dep not in graph:
+                continue
+            if state.get(dep) == "visiting":
+                return path[path.index(dep):] + [dep]
+            if dep not in state:
+                cycle = visit(dep, path + [dep])
+                if cycle:
+                    return cycle
+        state[name] = "done"
+        return None
+
+    for name in graph:
+        if name not in state:
+            cycle = visit(name, [name])
+            if cycle:
+                return cycle
+    return None
+
+def run_checks(checks: List[Tuple], project_path: Path, url: Optional[str] = None,
+               jobs: int = DEFAULT_JOBS, cpu_slots: int = CPU_COUNT,
+               inventory: Optional[FileInventory] = None, stop_on_fail: bool = False) -> List[dict]:
+    """
+    Run checks concurrently, respecting dependencies and the required gate
+
+    A check is started (in priority order) once all of its dependencies have
+    finished, as long as fewer than `jobs` checks are running and, for
+    CPU-heavy checks, fewer than `cpu_slots` CPU-heavy checks are running.
+    When a required check fails, its dependents are cancelled transitively;
+    with stop_on_fail every check not yet started is cancelled instead.
+    Given an inventory, checker plugins run in-process against it.
+
+    Returns:
+        results in the order of `checks`
+    """
+    cycle = find_cycle(checks)
+    if cycle:
+        raise ValueError(f"Dependency cycle between checks: {' -> '.join(cycle)}")
+    names = {check[0] for check in checks}
+    pending = list(checks)
+    results = {}
+    failed_required = set()
+    running = {}  # future -> check
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        while pending or running:
+            # Cancel checks whose required dependencies failed
+            for check in list(pending):
+                name, _, _, depends_on, _ = check
+                blocked = [dep for dep in depends_on if dep in failed_required]
+                if blocked:
+                    pending.remove(check)
+                    results[name] = cancelled_result(name, f"{', '.join(blocked)} failed")
+                    failed_required.add(name)  # propagate to its own dependents
+
+            # Start every check whose dependencies are done, within the limits
+            heavy_running = sum(1 for check in running.values() if check[4])
+            for check in list(pending):
+                name, script_path, _, depends_on, cpu_heavy = check
+                if len(running) >= jobs:
+                    break
+                if any(dep in names and dep not in results for dep in depends_on):
+                    continue
+                if cpu_heavy and heavy_running >= cpu_slots:
+                    continue
+                pending.remove(check)
+                future = executor.submit(execute_check, name, project_path / script_path, project_path, inventory, url)
+                running[future] = check
+                heavy_running += cpu_heavy
+
+            if not running:
+                for check in pending:  # unsatisfiable dependencies
+                    results[check[0]] = cancelled_result(check[0], "dependencies never completed")
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, _, required, _, _ = running.pop(future)
+                result = future.result()
+                results[name] = result
+                if required and not result["passed"] and not result.get("skipped"):
+                    failed_required.add(name)
+                    if stop_on_fail:
+                        print_error(f"CRITICAL: {name} failed. Stopping checklist.")
+                        for check in pending:
+                            results[check[0]] = cancelled_result(check[0], f"{name} failed")
+                        pending = []
+                    else:
+                        print_error(f"CRITICAL: {name} failed. Cancelling checks that depend on it.")
+
+    return [results[check[0]] for check in checks if check[0] in results]
+
 def print_summary(results: List[dict]):
     """Print final summary report"""
     print_header("📊 CHECKLIST SUMMARY")
     
     passed_count = sum(1 for r in results if r["passed"] and not r.get("skipped"))
     failed_count = sum(1 for r in results if not r["passed"] and not r.get("skipped"))
-    skipped_count = sum(1 for r in results if r.get("skipped"))
+    skipped_count = sum(1 for r in results if r.get("skipped") and not r.get("cancelled"))
+    cancelled_count = sum(1 for r in results if r.get("cancelled"))
     
     print(f"Total Checks: {len(results)}")
     print(f"{Colors.GREEN}✅ Passed: {passed_count}{Colors.ENDC}")
     print(f"{Colors.RED}❌ Failed: {failed_count}{Colors.ENDC}")
     print(f"{Colors.YELLOW}⏭️  Skipped: {skipped_count}{Colors.ENDC}")
+    if cancelled_count:
+        print(f"{Colors.YELLOW}🚫 Cancelled: {cancelled_count}{Colors.ENDC}")
     print()
     
     # Detailed results
     for r in results:
-        if r.get("skipped"):
+        if r.get("cancelled"):
+            status = f"{Colors.YELLOW}🚫{Colors.ENDC}"
+        elif r.get("skipped"):
             status = f"{Colors.YELLOW}⏭️ {Colors.ENDC}"
         elif r["passed"]:
             status = f"{Colors.GREEN}✅{Colors.ENDC}"
         else:
             status = f"{Colors.RED}❌{Colors.ENDC}"
         
-        print(f"{status} {r['name']}")
+        detail = f" - {r['output']}" if r.get("report") and r["output"] else ""
+        print(f"{status} {r['name']}{detail}")
     
     print()
     
-    if failed_count > 0:
+    if failed_count > 0 or cancelled_count > 0:
         print_error(f"{failed_count} check(s) FAILED - Please fix before proceeding")
         return False
     else:
@@ -167,11 +342,17 @@ def main():
 Examples:
   python scripts/checklist.py .                      # Core checks only
   python scripts/checklist.py . --url http://localhost:3000  # Include performance
+  python scripts/checklist.py . --jobs 1             # Sequential, stop at first required failure
+  python scripts/checklist.py . --isolate            # Subprocess per check
+  python scripts/checklist.py . --no-cache           # Ignore cached per-file results
         """
     )
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", help="URL for performance checks (lighthouse, playwright)")
     parser.add_argument("--skip-performance", action="store_true", help="Skip performance checks even if URL provided")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS, help=f"Checks to run concurrently (default: {DEFAULT_JOBS}). Only 1 stops at the first required failure; in parallel, only checks depending on a failed required check are cancelled")
+    parser.add_argument("--isolate", action="store_true", help="Run every check in its own Python process")
+    parser.add_argument("--no-cache", action="store_true", help="Re-check every file instead of reusing cached per-file results")
     
     args = parser.parse_args()
     
@@ -185,28 +366,22 @@ Examples:
     print(f"Project: {project_path}")
     print(f"URL: {args.url if args.url else 'Not provided (performance checks skipped)'}")
     
-    results = []
+    if args.no_cache:
+        os.environ[RESULT_CACHE_VAR] = "0"  # read by the checks, in-process and in subprocesses
     
-    # Run core checks
-    print_header("📋 CORE CHECKS")
-    for name, script_path, required in CORE_CHECKS:
-        script = project_path / script_path
-        result = run_script(name, script, str(project_path))
-        results.append(result)
-        
-        # If required check fails, stop
-        if required and not result["passed"] and not result.get("skipped"):
-            print_error(f"CRITICAL: {name} failed. Stopping checklist.")
-            print_summary(results)
-            sys.exit(1)
+    # One directory walk, shared with every check via AGENT_FILE_INVENTORY
+    inventory = share_inventory(project_path)
+    print(f"Inventory: {len(inventory)} files")
     
-    # Run performance checks if URL provided
+    checks = list(CORE_CHECKS)
     if args.url and not args.skip_performance:
-        print_header("⚡ PERFORMANCE CHECKS")
-        for name, script_path, required in PERFORMANCE_CHECKS:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            results.append(result)
+        checks += PERFORMANCE_CHECKS
+    
+    # Run core (and performance) checks
+    print_header("📋 CORE CHECKS" if len(checks) == len(CORE_CHECKS) else "📋 CORE + ⚡ PERFORMANCE CHECKS")
+    print(f"Running up to {max(1, args.jobs)} checks in parallel\n")
+    results = run_checks(checks, project_path, args.url, max(1, args.jobs),
+                         inventory=None if args.isolate else inventory, stop_on_fail=args.jobs <= 1)
     
     # Print summary
     all_passed = print_summary(results)
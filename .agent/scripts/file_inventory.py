@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+File Inventory - Antigravity Kit
+================================
+
+Shared single-pass project file walker for the validation scripts.
+
+The project tree is walked once with one ignore set (build/vendor directories
+plus every .gitignore in the tree), and each file is classified by extension
+and role (source, test, config, style, markup, doc, data, asset, other).
+Validators query the inventory instead of running their own os.walk / glob.
+Entries are in sorted walk order, which fixes the sample seen by checkers
+that only look at their first N files (tests/test_file_inventory.py).
+
+Orchestrators (checklist.py, verify_all.py) build the inventory once, save it
+as JSON and export its path in AGENT_FILE_INVENTORY, so every validator
+subprocess reuses the same listing. A validator run on its own walks the tree
+itself (once per process).
+
+read_text() keeps file contents in a per-process cache, so checkers running
+in the same process (see checkers.py) read each file only once.
+
+Usage:
+    python scripts/file_inventory.py .               # Build and print a summary
+    python scripts/file_inventory.py . --json        # Dump the inventory
+
+    from file_inventory import get_inventory
+    inventory = get_inventory(project_path)
+    for path in inventory.files({'.tsx', '.jsx'}, skip_dirs={'tests'}):
+        ...
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+INVENTORY_VERSION = 1
+ENV_VAR = "AGENT_FILE_INVENTORY"
+CACHE_DIR = Path(".agent") / "cache"
+INVENTORY_FILE = "file_inventory.json"
+
+# Never part of the project's own files (union of the validators' skip lists)
+IGNORE_DIRS = {
+    'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv',
+    '.next', '.nuxt', '.svelte-kit', '.turbo', '.vercel', '.cache',
+    '.pytest_cache', '.mypy_cache', 'coverage', '.idea', '.vscode'
+}
+# Relative paths ignored as a whole (the kit's own caches)
+IGNORE_PATHS = {CACHE_DIR.as_posix()}
+# Larger files are read on every call instead of being kept in memory
+MAX_CACHED_BYTES = 1024 * 1024
+
+# ============ CLASSIFICATION ============
+ROLE_BY_EXTENSION = {
+    **dict.fromkeys(['.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs', '.vue', '.svelte', '.astro',
+                     '.py', '.go', '.java', '.rb', '.php', '.dart', '.rs', '.kt', '.swift'], 'source'),
+    **dict.fromkeys(['.css', '.scss', '.sass', '.less'], 'style'),
+    **dict.fromkeys(['.html', '.htm'], 'markup'),
+    **dict.fromkeys(['.md', '.mdx', '.rst', '.txt'], 'doc'),
+    **dict.fromkeys(['.json', '.csv', '.po', '.prisma', '.sql', '.graphql', '.xml'], 'data'),
+    **dict.fromkeys(['.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf', '.env', '.lock'], 'config'),
+    **dict.fromkeys(['.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.avif', '.ico',
+                     '.woff', '.woff2', '.ttf', '.otf', '.mp4', '.webm', '.mp3', '.pdf'], 'asset'),
+}
+CONFIG_NAMES = {
+    'package.json', 'package-lock.json', 'tsconfig.json', 'jsconfig.json', 'composer.json',
+    'requirements.txt', 'pipfile', 'dockerfile', 'makefile', 'nginx.conf', 'vercel.json'
+}
+TEST_DIRS = {'test', 'tests', '__tests__', 'spec', 'e2e'}
+TEST_NAME = re.compile(r'(\.|_)(test|spec)\.[^.]+$|^(test|spec)_', re.IGNORECASE)
+CONFIG_NAME = re.compile(r'\.config\.[^.]+$|^\.[^.]+rc(\.[^.]+)?$|^\.env', re.IGNORECASE)
+
+
+def classify(rel_path: str) -> str:
+    """Role of a file from its relative POSIX path"""
+    parts = rel_path.split("/")
+    name = parts[-1]
+    if TEST_NAME.search(name) or TEST_DIRS.intersection(parts[:-1]):
+        return 'test'
+    if name.lower() in CONFIG_NAMES or CONFIG_NAME.search(name):
+        return 'config'
+    return ROLE_BY_EXTENSION.get(Path(name).suffix.lower(), 'other')
+
+
+# ============ IGNORE RULES ============
+def _segment_regex(segment: str) -> str:
+    """One path segment of a glob: '*', '?' and '[...]' never cross '/'"""
+    regex, i = "", 0
+    while i < len(segment):
+        char = segment[i]
+        if char == "*":
+            regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif char == "[" and "]" in segment[i + 2:]:
+            end = segment.index("]", i + 2)
+            body = segment[i + 1:end].replace("\\", "\\\\")
+            regex += "[" + ("^" + body[1:] if body.startswith("!") else body) + "]"
+            i = end
+        else:
+            regex += re.escape(char)
+        i += 1
+    return regex
+
+
+def glob_regex(pattern: str):
+    """Compile a pathlib-style glob ('**' = any number of directories) for relative POSIX paths"""
+    segments = pattern.strip("/").split("/")
+    regex = ""
+    for i, segment in enumerate(segments):
+        last = i == len(segments) - 1
+        if segment == "**":
+            regex += ".+" if last else "(?:[^/]+/)*"
+        else:
+            regex += _segment_regex(segment) + ("" if last else "/")
+    return re.compile(regex + "$")
+
+
+def parse_gitignore(text: str) -> list:
+    """.gitignore lines -> [(regex, negate, dir_only, anchored)]"""
+    rules = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith('#'):
+            continue
+        negate = line.startswith('!')
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        anchored = '/' in line
+        if line:
+            rules.append((glob_regex(line.lstrip('/')), negate, dir_only, anchored))
+    return rules
+
+
+def is_ignored(rel_path: str, is_dir: bool, gitignores: list) -> bool:
+    """Apply [(base_dir, rules)] from the root down; the last matching rule wins"""
+    ignored = False
+    for base, rules in gitignores:
+        if base:
+            if not rel_path.startswith(base + "/"):
+                continue
+            local = rel_path[len(base) + 1:]
+        else:
+            local = rel_path
+        name = local.rsplit("/", 1)[-1]
+        for regex, negate, dir_only, anchored in rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(local if anchored else name):
+                ignored = not negate
+    return ignored
+
+
+# ============ INVENTORY ============
+class FileInventory:
+    """
+    Project files as (relative path, extension, role, size, mtime) entries.
+    Paths are returned under `base` - the project path as the caller spelled
+    it - so reports read the same as with a direct os.walk / glob.
+    """
+
+    def __init__(self, root: Path, entries: List[list], created: Optional[float] = None, base=None):
+        self.root = Path(root).resolve()
+        self.base = Path(base) if base is not None else self.root
+        self.entries = entries
+        self.created = created or time.time()
+        self._stats = {}  # rel -> (size, mtime), filled on first stat() and shared with views
+
+    def at(self, base) -> "FileInventory":
+        """Same entries, paths returned under another spelling of the root"""
+        view = FileInventory(self.root, self.entries, self.created, base)
+        view._stats = self._stats
+        return view
+
+    def __len__(self):
+        return len(self.entries)
+
+    def files(self, extensions: Optional[Iterable[str]] = None, roles: Optional[Iterable[str]] = None,
+              names: Optional[Iterable[str]] = None, skip_dirs: Optional[Iterable[str]] = None,
+              exclude_roles: Optional[Iterable[str]] = None, ordered: bool = False) -> List[Path]:
+        """
+        Absolute paths in walk order: sorted by name, a directory's files before
+        its subdirectories, independent of the filesystem's listing order. A file
+        is selected when its extension is in `extensions`, its role in `roles` or
+        its name in `names` (no filters = every file); `skip_dirs` drops files
+        under directories with those names. ordered=True groups the files by the
+        order of `extensions` (like one glob per extension), for checkers that
+        only sample the first N files.
+        """
+        order = list(extensions) if extensions is not None else []
+        extensions = set(extensions) if extensions is not None else None
+        roles = set(roles) if roles is not None else None
+        names = set(names) if names is not None else None
+        skip_dirs = set(skip_dirs or ())
+        exclude_roles = set(exclude_roles or ())
+        everything = extensions is None and roles is None and names is None
+
+        selected = []
+        for rel, ext, role, _, _ in self.entries:
+            if role in exclude_roles:
+                continue
+            if not everything:
+                name = rel.rsplit("/", 1)[-1]
+                if not ((extensions and ext in extensions) or (roles and role in roles) or (names and name in names)):
+                    continue
+            if skip_dirs and skip_dirs.intersection(rel.split("/")[:-1]):
+                continue
+            selected.append(self.base / rel)
+        if ordered:
+            rank = {ext: i for i, ext in enumerate(order)}
+            selected.sort(key=lambda path: rank.get(path.suffix.lower(), len(rank)))
+        return selected
+
+    def relative(self, path) -> str:
+        """Path relative to the project root, for reports"""
+        return str(Path(path).relative_to(self.base))
+
+    def stat(self, path) -> Optional[tuple]:
+        """(size, mtime) recorded by the walk, None for files outside the inventory"""
+        if not self._stats:
+            self._stats.update((rel, (size, mtime)) for rel, _, _, size, mtime in self.entries)
+        try:
+            return self._stats.get(Path(path).relative_to(self.base).as_posix())
+        except ValueError:
+            return None
+
+    def glob(self, *patterns: str, skip_dirs: Optional[Iterable[str]] = None) -> List[Path]:
+        """Files matching any pathlib-style glob, relative to the root"""
+        regexes = [glob_regex(pattern) for pattern in patterns]
+        skip_dirs = set(skip_dirs or ())
+        return [
+            self.base / rel for rel, _, _, _, _ in self.entries
+            if any(regex.match(rel) for regex in regexes)
+            and not skip_dirs.intersection(rel.split("/")[:-1])
+        ]
+
+    def summary(self) -> Dict[str, int]:
+        """File count per role"""
+        counts = {}
+        for _, _, role, _, _ in self.entries:
+            counts[role] = counts.get(role, 0) + 1
+        return dict(sorted(counts.items()))
+
+    def to_dict(self) -> dict:
+        return {"version": INVENTORY_VERSION, "root": str(self.root), "created": self.created, "files": self.entries}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FileInventory":
+        return cls(data["root"], data["files"], data.get("created"))
+
+
+def build_inventory(project_path) -> FileInventory:
+    """Walk the project once, honouring IGNORE_DIRS and every .gitignore"""
+    root = Path(project_path).resolve()
+    entries = []
+    gitignores = []  # (base_dir, rules), parents before children
+    for current, dirs, files in os.walk(root):
+        rel_dir = Path(current).relative_to(root).as_posix()
+        rel_dir = "" if rel_dir == "." else rel_dir
+        gitignores = [(base, rules) for base, rules in gitignores
+                      if not base or rel_dir == base or rel_dir.startswith(base + "/")]
+        if ".gitignore" in files:
+            try:
+                text = (Path(current) / ".gitignore").read_text(encoding="utf-8", errors="ignore")
+                gitignores.append((rel_dir, parse_gitignore(text)))
+            except OSError:
+                pass
+
+        prefix = rel_dir + "/" if rel_dir else ""
+        dirs[:] = sorted(
+            d for d in dirs
+            if d not in IGNORE_DIRS and prefix + d not in IGNORE_PATHS
+            and not is_ignored(prefix + d, True, gitignores)
+        )
+        for name in sorted(files):
+            rel = prefix + name
+            if is_ignored(rel, False, gitignores):
+                continue
+            try:
+                stat = os.stat(os.path.join(current, name))
+            except OSError:
+                continue
+            entries.append([rel, Path(name).suffix.lower(), classify(rel), stat.st_size, stat.st_mtime])
+    return FileInventory(root, entries)
+
+
+_CONTENTS = {}
+
+
+def read_text(path) -> str:
+    """File contents as text (undecodable bytes dropped), cached per process"""
+    key = os.path.abspath(path)
+    content = _CONTENTS.get(key)
+    if content is None:
+        with open(key, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+        if len(content) <= MAX_CACHED_BYTES:
+            _CONTENTS[key] = content
+    return content
+
+
+def save_inventory(inventory: FileInventory, path: Optional[Path] = None) -> Path:
+    """Write the inventory as JSON (default: <project>/.agent/cache/file_inventory.json)"""
+    path = Path(path) if path else inventory.root / CACHE_DIR / INVENTORY_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(inventory.to_dict()), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def share_inventory(project_path) -> FileInventory:
+    """Build and save the inventory, and export it to child processes via ENV_VAR"""
+    inventory = build_inventory(project_path)
+    _INVENTORIES[inventory.root] = inventory
+    try:
+        os.environ[ENV_VAR] = str(save_inventory(inventory))
+    except OSError:
+        pass  # read-only project: children walk the tree themselves
+    return inventory
+
+
+_INVENTORIES = {}
+
+
+def get_inventory(project_path) -> FileInventory:
+    """The shared inventory for a project: from ENV_VAR when it matches, else one walk per process"""
+    root = Path(project_path).resolve()
+    if root in _INVENTORIES:
+        return _INVENTORIES[root].at(project_path)
+    inventory = None
+    shared = os.environ.get(ENV_VAR)
+    if shared:
+        try:
+            data = json.loads(Path(shared).read_text(encoding="utf-8"))
+            if data.get("version") == INVENTORY_VERSION and Path(data.get("root", "")) == root:
+                inventory = FileInventory.from_dict(data)
+        except (OSError, ValueError, KeyError):
+            pass
+    if inventory is None:
+        inventory = build_inventory(root)
+    _INVENTORIES[root] = inventory
+    return inventory.at(project_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the shared project file inventory")
+    parser.add_argument("project", help="Project path")
+    parser.add_argument("--json", action="store_true", help="Print the full inventory as JSON")
+    parser.add_argument("--save", action="store_true", help=f"Write it to {CACHE_DIR.as_posix()}/{INVENTORY_FILE}")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    inventory = build_inventory(args.project)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if args.json:
+        print(json.dumps(inventory.to_dict(), indent=2))
+    else:
+        print(f"{len(inventory)} files in {inventory.root} ({elapsed:.0f} ms)")
+        for role, count in inventory.summary().items():
+            print(f"  {role:8} {count}")
+    if args.save:
+        print(f"Saved to {save_inventory(inventory)}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Result Cache - Antigravity Kit
+==============================
+
+Per-file, per-checker cache of validation findings.
+
+A checker wraps its per-file step in a ResultCache; findings are stored in
+<project>/.agent/cache/results/<checker>.json together with the file's
+content hash. An entry is reused while
+
+  - the file's content hash is unchanged (sha256 of the text the checker sees)
+  - the checker's CHECKER_VERSION is unchanged
+  - the ruleset hash is unchanged: the checker's own source plus the shared
+    modules (file_inventory.py, result_cache.py), so editing a rule, the
+    text decoding or the cache format invalidates the cached findings
+
+Each cached checker defines CHECKER_VERSION = "1". Source edits already
+invalidate its cache; bump the version only when findings change without an
+edit to the checker's file (e.g. a rule table loaded from data).
+
+Size and mtime from the FileInventory are a fast path in front of the hash,
+as in git's index: a file whose stat matches the stored entry is not read at
+all, so an incremental run only reads and re-checks the files that changed.
+Entries stored less than RACY_SECONDS after the file's mtime are re-hashed
+next time.
+
+Findings must be JSON-serializable and not None. Set AGENT_RESULT_CACHE=0
+(or pass --no-cache to checklist.py / verify_all.py) to bypass the cache.
+
+Usage:
+    from result_cache import open_cache
+
+    with open_cache(inventory, "seo_checker", CHECKER_VERSION, __file__) as cache:
+        for path in inventory.files({'.html'}):
+            result = cache.get(path)
+            if result is None:
+                result = check_page(path)
+                cache.put(path, result)
+
+    python scripts/result_cache.py .            # Show cached checkers
+    python scripts/result_cache.py . --clear    # Delete the result cache
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import argparse
+from pathlib import Path
+from typing import Any, Optional
+
+import file_inventory
+from file_inventory import CACHE_DIR, FileInventory, read_text
+
+CACHE_VERSION = 1
+ENV_VAR = "AGENT_RESULT_CACHE"
+RESULTS_DIR = CACHE_DIR / "results"
+# mtime granularity margin: younger entries are not trusted on stat alone
+RACY_SECONDS = 2.0
+# Modules whose behaviour is part of every cached finding
+SHARED_SOURCES = (Path(__file__).resolve(), Path(file_inventory.__file__).resolve())
+
+
+def cache_enabled() -> bool:
+    return os.environ.get(ENV_VAR, "1").lower() not in ("0", "false", "no", "off")
+
+
+def ruleset_hash(*sources) -> str:
+    """sha256 over rule sources: file paths are hashed by content, anything else by repr()"""
+    digest = hashlib.sha256()
+    for source in sources:
+        if isinstance(source, (str, Path)) and Path(source).is_file():
+            digest.update(Path(source).read_bytes())
+        else:
+            digest.update(repr(source).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Findings of one checker keyed by relative path, valid while the content hash matches"""
+
+    def __init__(self, inventory: FileInventory, checker: str, version: str, ruleset: str, enabled: bool = True):
+        self.inventory = inventory
+        self.checker = checker
+        self.version = str(version)
+        self.ruleset = ruleset
+        self.enabled = enabled
+        self.path = inventory.root / RESULTS_DIR / f"{checker}.json"
+        self.entries = {}  # rel -> [sha256, size, mtime, findings]
+        self.seen = set()
+        self.hits = 0
+        self.misses = 0
+        self._pending = {}  # rel -> (sha256, stat) of files looked up but not cached
+        self._dirty = False
+        if enabled:
+            self._load()
+
+    def _load(self):
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (data.get("cache_version") == CACHE_VERSION and data.get("version") == self.version
+                and data.get("ruleset") == self.ruleset):
+            self.entries = data.get("files", {})
+
+    def _key(self, path) -> str:
+        return Path(self.inventory.relative(path)).as_posix()
+
+    def _entry(self, digest: str, stat: Optional[tuple], findings: Any) -> list:
+        size, mtime = stat or (-1, 0)
+        if time.time() - mtime < RACY_SECONDS:
+            size = -1  # same-second edits keep size and mtime: force a re-hash
+        return [digest, size, mtime, findings]
+
+    def get(self, path) -> Optional[Any]:
+        """Cached findings for a file, or None when it has to be checked"""
+        if not self.enabled:
+            return None
+        rel = self._key(path)
+        self.seen.add(rel)
+        stat = self.inventory.stat(path)
+        entry = self.entries.get(rel)
+        if entry and stat and entry[1] == stat[0] and entry[2] == stat[1]:
+            self.hits += 1
+            return entry[3]
+        try:
+            digest = hashlib.sha256(read_text(path).encode("utf-8")).hexdigest()
+        except OSError:
+            self.misses += 1
+            return None
+        if entry and entry[0] == digest:
+            self.entries[rel] = self._entry(digest, stat, entry[3])
+            self._dirty = True
+            self.hits += 1
+            return entry[3]
+        self._pending[rel] = (digest, stat)
+        self.misses += 1
+        return None
+
+    def put(self, path, findings: Any):
+        """Store the findings of a file just checked"""
+        if not self.enabled or findings is None:
+            return
+        rel = self._key(path)
+        self.seen.add(rel)
+        pending = self._pending.pop(rel, None)
+        if pending is None:
+            try:
+                pending = (hashlib.sha256(read_text(path).encode("utf-8")).hexdigest(), self.inventory.stat(path))
+            except OSError:
+                return
+        self.entries[rel] = self._entry(pending[0], pending[1], findings)
+        self._dirty = True
+
+    def save(self):
+        """Write the cache, dropping entries for files this run no longer checked"""
+        if not self.enabled:
+            return
+        stale = set(self.entries) - self.seen
+        if not self._dirty and not stale:
+            return
+        for rel in stale:
+            del self.entries[rel]
+        data = {
+            "cache_version": CACHE_VERSION,
+            "checker": self.checker,
+            "version": self.version,
+            "ruleset": self.ruleset,
+            "files": self.entries
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # read-only project: run uncached
+        self._dirty = False
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.save()
+
+
+def open_cache(inventory: FileInventory, checker: str, version, *rule_sources) -> ResultCache:
+    """Cache for one checker; rule_sources (usually __file__) and SHARED_SOURCES make up the ruleset hash"""
+    return ResultCache(inventory, checker, version, ruleset_hash(*SHARED_SOURCES, *rule_sources), cache_enabled())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear the per-file validation result cache")
+    parser.add_argument("project", help="Project path")
+    parser.add_argument("--clear", action="store_true", help="Delete all cached results")
+    args = parser.parse_args()
+
+    results_dir = Path(args.project).resolve() / RESULTS_DIR
+    if args.clear:
+        shutil.rmtree(results_dir, ignore_errors=True)
+        print(f"Cleared {results_dir}")
+        return
+    if not results_dir.is_dir():
+        print(f"No cached results in {results_dir}")
+        return
+    for path in sorted(results_dir.glob("*.json")):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            print(f"  {path.stem:28} unreadable", file=sys.stderr)
+            continue
+        print(f"  {path.stem:28} v{data.get('version')} {len(data.get('files', {})):>5} files "
+              f"{path.stat().st_size / 1024:>8.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
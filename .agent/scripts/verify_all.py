@@ -6,6 +6,22 @@ Full Verification Suite - Antigravity Kit
 Runs COMPLETE validation including all checks + performance + E2E.
 Use this before deployment or major releases.
 
+The suite is a dependency graph: each check declares the checks it needs and
+the resources it occupies (cpu, browser, localhost). Checks start as soon as
+their dependencies are done and their resources are free, so static analyzers
+overlap with browser-based checks. The report includes the critical path
+next to total wall time: the chain of checks, each started by the previous
+one finishing, whether it waited on a dependency, a resource limit or a
+worker slot.
+
+Skill scripts that implement the checker plugin interface (see checkers.py)
+run in-process against the shared file inventory and content cache. With
+--stop-on-fail or --isolate every check runs as a subprocess instead, so that
+in-flight checks can be killed.
+
+Per-file findings are reused from .agent/cache/results/ (see result_cache.py)
+unless --no-cache is given.
+
 Usage:
     python scripts/verify_all.py . --url <URL>
 
@@ -22,13 +38,22 @@ Includes ALL checks:
     ✅ Mobile Audit (if applicable)
 """
 
+import os
 import sys
+import time
+import threading
 import subprocess
 import argparse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from file_inventory import FileInventory, share_inventory
+from checkers import load_checker, run_checker, summarize
+from result_cache import ENV_VAR as RESULT_CACHE_VAR
+
 # ANSI colors
 class Colors:
     HEADER = '\033[95m'
@@ -57,14 +82,27 @@ def print_warning(text: str):
 def print_error(text: str):
     print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
 
-# Complete verification suite
+# Resources a check can occupy, and how many of each exist
+CPU = {"cpu": 1}
+BROWSER = {"browser": 1, "localhost": 1}
+RESOURCE_LIMITS = {
+    "cpu": os.cpu_count() or 1,
+    "browser": 1,      # one headless browser at a time keeps timings stable
+    "localhost": 2,    # concurrent clients of the dev server
+}
+DEFAULT_JOBS = min(12, (os.cpu_count() or 1) + 4)
+# A check starting within this many seconds of another's end was waiting for it
+SCHEDULING_SLACK = 0.05
+
+# Complete verification suite:
+# (name, script, required, depends_on, resources)
 VERIFICATION_SUITE = [
     # P0: Security (CRITICAL)
     {
         "category": "Security",
         "checks": [
-            ("Security Scan", ".agent/skills/vulnerability-scanner/scripts/security_scan.py", True),
-            ("Dependency Analysis", ".agent/skills/vulnerability-scanner/scripts/dependency_analyzer.py", False),
+            ("Security Scan", ".agent/skills/vulnerability-scanner/scripts/security_scan.py", True, (), CPU),
+            ("Dependency Analysis", ".agent/skills/vulnerability-scanner/scripts/dependency_analyzer.py", False, (), CPU),
         ]
     },
     
@@ -72,8 +110,8 @@ VERIFICATION_SUITE = [
     {
         "category": "Code Quality",
         "checks": [
-            ("Lint Check", ".agent/skills/lint-and-validate/scripts/lint_runner.py", True),
-            ("Type Coverage", ".agent/skills/lint-and-validate/scripts/type_coverage.py", False),
+            ("Lint Check", ".agent/skills/lint-and-validate/scripts/lint_runner.py", True, (), CPU),
+            ("Type Coverage", ".agent/skills/lint-and-validate/scripts/type_coverage.py", False, (), CPU),
         ]
     },
     
@@ -81,7 +119,7 @@ VERIFICATION_SUITE = [
     {
         "category": "Data Layer",
         "checks": [
-            ("Schema Validation", ".agent/skills/database-design/scripts/schema_validator.py", False),
+            ("Schema Validation", ".agent/skills/database-design/scripts/schema_validator.py", False, (), CPU),
         ]
     },
     
@@ -89,7 +127,7 @@ VERIFICATION_SUITE = [
     {
         "category": "Testing",
         "checks": [
-            ("Test Suite", ".agent/skills/testing-patterns/scripts/test_runner.py", False),
+            ("Test Suite", ".agent/skills/testing-patterns/scripts/test_runner.py", False, ("Lint Check",), CPU),
         ]
     },
     
@@ -97,8 +135,8 @@ VERIFICATION_SUITE = [
     {
         "category": "UX & Accessibility",
         "checks": [
-            ("UX Audit", ".agent/skills/frontend-design/scripts/ux_audit.py", False),
-            ("Accessibility Check", ".agent/skills/frontend-design/scripts/accessibility_checker.py", False),
+            ("UX Audit", ".agent/skills/frontend-design/scripts/ux_audit.py", False, (), CPU),
+            ("Accessibility Check", ".agent/skills/frontend-design/scripts/accessibility_checker.py", False, (), CPU),
         ]
     },
     
@@ -106,8 +144,8 @@ VERIFICATION_SUITE = [
     {
         "category": "SEO & Content",
         "checks": [
-            ("SEO Check", ".agent/skills/seo-fundamentals/scripts/seo_checker.py", False),
-            ("GEO Check", ".agent/skills/geo-fundamentals/scripts/geo_checker.py", False),
+            ("SEO Check", ".agent/skills/seo-fundamentals/scripts/seo_checker.py", False, (), CPU),
+            ("GEO Check", ".agent/skills/geo-fundamentals/scripts/geo_checker.py", False, (), CPU),
         ]
     },
     
@@ -116,8 +154,8 @@ VERIFICATION_SUITE = [
         "category": "Performance",
         "requires_url": True,
         "checks": [
-            ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True),
-            ("Bundle Analysis", ".agent/skills/performance-profiling/scripts/bundle_analyzer.py", False),
+            ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True, (), BROWSER),
+            ("Bundle Analysis", ".agent/skills/performance-profiling/scripts/bundle_analyzer.py", False, (), CPU),
         ]
     },
     
@@ -126,7 +164,7 @@ VERIFICATION_SUITE = [
         "category": "E2E Testing",
         "requires_url": True,
         "checks": [
-            ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False),
+            ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False, (), BROWSER),
         ]
     },
     
@@ -134,7 +172,7 @@ VERIFICATION_SUITE = [
     {
         "category": "Mobile",
         "checks": [
-            ("Mobile Audit", ".agent/skills/mobile-design/scripts/mobile_audit.py", False),
+            ("Mobile Audit", ".agent/skills/mobile-design/scripts/mobile_audit.py", False, (), CPU),
         ]
     },
     
@@ -142,13 +180,14 @@ VERIFICATION_SUITE = [
     {
         "category": "Internationalization",
         "checks": [
-            ("i18n Check", ".agent/skills/i18n-localization/scripts/i18n_checker.py", False),
+            ("i18n Check", ".agent/skills/i18n-localization/scripts/i18n_checker.py", False, (), CPU),
         ]
     },
 ]
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
-    """Run validation script"""
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               cancel: Optional[threading.Event] = None) -> dict:
+    """Run validation script; killed early if `cancel` is set"""
     if not script_path.exists():
         print_warning(f"{name}: Script not found, skipping")
         return {"name": name, "passed": True, "skipped": True, "duration": 0}
@@ -163,28 +202,40 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
     
     # Run
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout for slow checks
-        )
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        deadline = time.monotonic() + 600  # 10 minute timeout for slow checks
+        while True:
+            try:
+                stdout, stderr = proc.communicate(timeout=0.2)
+                break
+            except subprocess.TimeoutExpired:
+                if cancel is not None and cancel.is_set():
+                    proc.kill()
+                    proc.communicate()
+                    duration = (datetime.now() - start_time).total_seconds()
+                    print_warning(f"{name}: CANCELLED after {duration:.1f}s")
+                    return {"name": name, "passed": False, "skipped": True, "cancelled": True,
+                            "duration": duration, "error": "Cancelled (--stop-on-fail)"}
+                if time.monotonic() > deadline:
+                    proc.kill()
+                    proc.communicate()
+                    raise subprocess.TimeoutExpired(cmd, 600)
         
         duration = (datetime.now() - start_time).total_seconds()
-        passed = result.returncode == 0
+        passed = proc.returncode == 0
         
         if passed:
             print_success(f"{name}: PASSED ({duration:.1f}s)")
         else:
             print_error(f"{name}: FAILED ({duration:.1f}s)")
-            if result.stderr:
-                print(f"  {result.stderr[:300]}")
+            if stderr:
+                print(f"  {stderr[:300]}")
         
         return {
             "name": name,
             "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
+            "output": stdout,
+            "error": stderr,
             "skipped": False,
             "duration": duration
         }
@@ -199,7 +250,186 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
         print_error(f"{name}: ERROR - {str(e)}")
         return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e)}
 
-def print_final_report(results: List[dict], start_time: datetime):
+def run_plugin(name: str, module, project_path: Path, inventory: FileInventory, url: Optional[str] = None) -> dict:
+    """Run a checker plugin in-process; same result shape as run_script plus the structured report"""
+    print_step(f"Running: {name}")
+    start_time = datetime.now()
+    try:
+        report = run_checker(module, project_path, inventory, url)
+    except Exception as e:
+        duration = (datetime.now() - start_time).total_seconds()
+        print_error(f"{name}: ERROR - {str(e)}")
+        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e)}
+    
+    duration = (datetime.now() - start_time).total_seconds()
+    passed = bool(report["passed"])
+    summary = summarize(report)
+    if passed:
+        print_success(f"{name}: PASSED ({duration:.1f}s)")
+    else:
+        print_error(f"{name}: FAILED ({duration:.1f}s)")
+        if summary:
+            print(f"  {summary[:300]}")
+    
+    return {
+        "name": name,
+        "passed": passed,
+        "output": summary,
+        "error": "" if passed else summary,
+        "skipped": False,
+        "duration": duration,
+        "report": report
+    }
+
+def build_dag(url: Optional[str], no_e2e: bool) -> List[dict]:
+    """Flatten VERIFICATION_SUITE into check nodes, applying the URL / E2E filters"""
+    nodes = []
+    for suite in VERIFICATION_SUITE:
+        category = suite["category"]
+        if suite.get("requires_url", False) and not url:
+            continue
+        if no_e2e and category == "E2E Testing":
+            continue
+        for name, script_path, required, depends_on, resources in suite["checks"]:
+            nodes.append({
+                "name": name,
+                "script": script_path,
+                "required": required,
+                "depends_on": depends_on,
+                "resources": resources,
+                "category": category,
+            })
+    return nodes
+
+def run_dag(nodes: List[dict], project_path: Path, url: Optional[str], stop_on_fail: bool = False,
+            jobs: int = DEFAULT_JOBS, inventory: Optional[FileInventory] = None) -> List[dict]:
+    """
+    Execute check nodes as a DAG under RESOURCE_LIMITS
+
+    Ready checks start in suite order whenever their resources are free.
+    Dependents of a failed required check are cancelled; with stop_on_fail,
+    a failed required check also kills running checks and cancels the rest.
+    Each result records start/end offsets (seconds) for critical-path analysis.
+    Given an inventory (and no stop_on_fail), checker plugins run in-process.
+    """
+    names = {node["name"] for node in nodes}
+    pending = list(nodes)
+    results = {}
+    failed_required = set()
+    in_use = defaultdict(int)
+    running = {}  # future -> node
+    cancel = threading.Event()
+    origin = time.monotonic()
+
+    def demand(node):
+        return {res: min(n, RESOURCE_LIMITS.get(res, n)) for res, n in node["resources"].items()}
+
+    def cancel_node(node, reason):
+        print_warning(f"{node['name']}: CANCELLED ({reason})")
+        results[node["name"]] = {"name": node["name"], "passed": False, "skipped": True, "cancelled": True,
+                                 "duration": 0, "error": reason, "category": node["category"]}
+
+    def execute(node):
+        start = time.monotonic() - origin
+        script_path = project_path / node["script"]
+        in_process = inventory is not None and not stop_on_fail and script_path.exists()
+        module = load_checker(script_path) if in_process else None
+        if module is not None:
+            result = run_plugin(node["name"], module, project_path, inventory, url)
+        else:
+            result = run_script(node["name"], script_path, str(project_path), url, cancel)
+        result.update(category=node["category"], start=start, end=time.monotonic() - origin)
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        while pending or running:
+            for node in list(pending):
+                if cancel.is_set():
+                    pending.remove(node)
+                    cancel_node(node, "--stop-on-fail")
+                    continue
+                blocked = [dep for dep in node["depends_on"] if dep in failed_required]
+                if blocked:
+                    pending.remove(node)
+                    cancel_node(node, f"{', '.join(blocked)} failed")
+                    failed_required.add(node["name"])
+
+            for node in list(pending):
+                if len(running) >= jobs:
+                    break
+                if any(dep in names and dep not in results for dep in node["depends_on"]):
+                    continue
+                need = demand(node)
+                if any(in_use[res] + n > RESOURCE_LIMITS.get(res, n) for res, n in need.items()):
+                    continue
+                for res, n in need.items():
+                    in_use[res] += n
+                pending.remove(node)
+                running[executor.submit(execute, node)] = node
+
+            if not running:
+                for node in pending:  # unsatisfiable (e.g. dependency cycle)
+                    cancel_node(node, "dependencies never completed")
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = running.pop(future)
+                for res, n in demand(node).items():
+                    in_use[res] -= n
+                result = future.result()
+                results[node["name"]] = result
+                if node["required"] and not result["passed"] and not result.get("skipped"):
+                    failed_required.add(node["name"])
+                    if stop_on_fail:
+                        print_error(f"CRITICAL: {node['name']} failed. Stopping verification.")
+                        cancel.set()
+
+    return [results[node["name"]] for node in nodes if node["name"] in results]
+
+def critical_path(nodes: List[dict], results: List[dict]):
+    """
+    Chain of checks that set the suite's wall time: (seconds, [(name, waited_on)])
+
+    Walks back from the last check to finish. A check that did not start
+    right away was started by the completion of the latest check to end
+    before it: a declared dependency, a check holding a RESOURCE_LIMITS
+    resource it needed, or one holding a worker slot. waited_on names that
+    reason ("" for the first check of the chain).
+    """
+    timed = {r["name"]: r for r in results if "start" in r}
+    if not timed:
+        return 0.0, []
+    by_name = {node["name"]: node for node in nodes}
+    current = max(timed.values(), key=lambda r: r["end"])
+    chain = []
+    while True:
+        earlier = [r for r in timed.values()
+                   if r["start"] < current["start"] and r["end"] <= current["start"] + SCHEDULING_SLACK]
+        if not earlier:
+            chain.append((current["name"], ""))
+            break
+        previous = max(earlier, key=lambda r: r["end"])
+        node, blocker = by_name.get(current["name"], {}), by_name.get(previous["name"], {})
+        if previous["name"] in node.get("depends_on", ()):
+            reason = "dependency"
+        else:
+            # A shared resource counts if it was at its limit until previous released it
+            holders = [by_name.get(r["name"], {}) for r in timed.values() if r["start"] < previous["end"] <= r["end"]]
+            reason = "worker slot"
+            for res, n in node.get("resources", {}).items():
+                limit = RESOURCE_LIMITS.get(res, n)
+                held = sum(min(h.get("resources", {}).get(res, 0), limit) for h in holders)
+                if res in blocker.get("resources", {}) and held + min(n, limit) > limit:
+                    reason = res
+                    break
+        chain.append((current["name"], reason))
+        current = previous
+    chain.reverse()
+    end = max(r["end"] for r in timed.values())
+    return end - timed[chain[0][0]]["start"], chain
+
+def print_final_report(results: List[dict], start_time: datetime, nodes: Optional[List[dict]] = None):
     """Print comprehensive final report"""
     total_duration = (datetime.now() - start_time).total_seconds()
     
@@ -209,13 +439,23 @@ def print_final_report(results: List[dict], start_time: datetime):
     total = len(results)
     passed = sum(1 for r in results if r["passed"] and not r.get("skipped"))
     failed = sum(1 for r in results if not r["passed"] and not r.get("skipped"))
-    skipped = sum(1 for r in results if r.get("skipped"))
+    skipped = sum(1 for r in results if r.get("skipped") and not r.get("cancelled"))
+    cancelled = sum(1 for r in results if r.get("cancelled"))
     
-    print(f"Total Duration: {total_duration:.1f}s")
+    print(f"Total Duration: {total_duration:.1f}s (wall time)")
+    if nodes:
+        path_time, path = critical_path(nodes, results)
+        serial_time = sum(r.get("duration", 0) for r in results)
+        steps = [f"{name} [{reason}]" if reason else name for name, reason in path]
+        print(f"Critical Path: {path_time:.1f}s ({' → '.join(steps)})")
+        print("  [reason] = what the check waited for: a dependency, a resource or a worker slot")
+        print(f"Serial Time: {serial_time:.1f}s (sum of all checks)")
     print(f"Total Checks: {total}")
     print(f"{Colors.GREEN}✅ Passed: {passed}{Colors.ENDC}")
     print(f"{Colors.RED}❌ Failed: {failed}{Colors.ENDC}")
     print(f"{Colors.YELLOW}⏭️  Skipped: {skipped}{Colors.ENDC}")
+    if cancelled:
+        print(f"{Colors.YELLOW}🚫 Cancelled: {cancelled}{Colors.ENDC}")
     print()
     
     # Category breakdown
@@ -228,7 +468,9 @@ def print_final_report(results: List[dict], start_time: datetime):
             print(f"\n{Colors.BOLD}{Colors.CYAN}{current_category}:{Colors.ENDC}")
         
         # Print result
-        if r.get("skipped"):
+        if r.get("cancelled"):
+            status = f"{Colors.YELLOW}🚫{Colors.ENDC}"
+        elif r.get("skipped"):
             status = f"{Colors.YELLOW}⏭️ {Colors.ENDC}"
         elif r["passed"]:
             status = f"{Colors.GREEN}✅{Colors.ENDC}"
@@ -252,7 +494,7 @@ def print_final_report(results: List[dict], start_time: datetime):
         print()
     
     # Final verdict
-    if failed > 0:
+    if failed > 0 or cancelled > 0:
         print_error(f"VERIFICATION FAILED - {failed} check(s) need attention")
         print(f"\n{Colors.YELLOW}💡 Tip: Fix critical (security, lint) issues first{Colors.ENDC}")
         return False
@@ -268,12 +510,16 @@ def main():
 Examples:
   python scripts/verify_all.py . --url http://localhost:3000
   python scripts/verify_all.py . --url https://staging.example.com --no-e2e
+  python scripts/verify_all.py . --url http://localhost:3000 --no-cache
         """
     )
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", required=True, help="URL for performance & E2E checks")
     parser.add_argument("--no-e2e", action="store_true", help="Skip E2E tests")
-    parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first failure")
+    parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first required failure, killing checks in flight")
+    parser.add_argument("--isolate", action="store_true", help="Run every check in its own Python process")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS, help=f"Checks to run concurrently (default: {DEFAULT_JOBS})")
+    parser.add_argument("--no-cache", action="store_true", help="Re-check every file instead of reusing cached per-file results")
     
     args = parser.parse_args()
     
@@ -288,38 +534,24 @@ Examples:
     print(f"URL: {args.url}")
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
+    if args.no_cache:
+        os.environ[RESULT_CACHE_VAR] = "0"  # read by the checks, in-process and in subprocesses
+    
+    # One directory walk, shared with every check via AGENT_FILE_INVENTORY
+    inventory = share_inventory(project_path)
+    print(f"Inventory: {len(inventory)} files")
+    
     start_time = datetime.now()
-    results = []
+    nodes = build_dag(args.url, args.no_e2e)
     
-    # Run all verification categories
-    for suite in VERIFICATION_SUITE:
-        category = suite["category"]
-        requires_url = suite.get("requires_url", False)
-        
-        # Skip if requires URL and not provided
-        if requires_url and not args.url:
-            continue
-        
-        # Skip E2E if flag set
-        if args.no_e2e and category == "E2E Testing":
-            continue
-        
-        print_header(f"📋 {category.upper()}")
-        
-        for name, script_path, required in suite["checks"]:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            result["category"] = category
-            results.append(result)
-            
-            # Stop on critical failure if flag set
-            if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
-                print_error(f"CRITICAL: {name} failed. Stopping verification.")
-                print_final_report(results, start_time)
-                sys.exit(1)
+    print_header("📋 VERIFICATION DAG")
+    limits = ", ".join(f"{res}={n}" for res, n in RESOURCE_LIMITS.items())
+    print(f"{len(nodes)} checks | up to {max(1, args.jobs)} in parallel | resources: {limits}\n")
+    results = run_dag(nodes, project_path, args.url, args.stop_on_fail, max(1, args.jobs),
+                      inventory=None if args.isolate else inventory)
     
     # Print final report
-    all_passed = print_final_report(results, start_time)
+    all_passed = print_final_report(results, start_time, nodes)
     
     sys.exit(0 if all_passed else 1)
 
@@ -15,7 +15,13 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
-def find_api_files(project_path: Path) -> list:
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory, read_text
+from result_cache import open_cache
+
+CHECKER_VERSION = "1"
+
+def find_api_files(project_path: Path, inventory=None) -> list:
     """Find API-related files."""
     patterns = [
         "**/*api*.ts", "**/*api*.js", "**/*api*.py",
@@ -27,12 +33,7 @@ def find_api_files(project_path: Path) -> list:
         "**/openapi.json", "**/openapi.yaml"
     ]
     
-    files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
-    
-    # Exclude node_modules, etc.
-    return [f for f in files if not any(x in str(f) for x in ['node_modules', '.git', 'dist', 'build', '__pycache__'])]
+    return (inventory or get_inventory(project_path)).glob(*patterns)
 
 def check_openapi_spec(file_path: Path) -> dict:
     """Check OpenAPI/Swagger specification."""
@@ -40,7 +41,7 @@ def check_openapi_spec(file_path: Path) -> dict:
     passed = []
     
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = read_text(file_path)
         
         if file_path.suffix == '.json':
             spec = json.loads(content)
@@ -88,6 +89,7 @@ def check_openapi_spec(file_path: Path) -> dict:
         
     except Exception as e:
         issues.append(f"[X] Parse error: {e}")
+        return {'file': str(file_path), 'passed': passed, 'issues': issues, 'type': 'openapi', 'error': str(e)}
     
     return {'file': str(file_path), 'passed': passed, 'issues': issues, 'type': 'openapi'}
 
@@ -97,7 +99,7 @@ def check_api_code(file_path: Path) -> dict:
     passed = []
     
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = read_text(file_path)
         
         # Check for error handling
         error_patterns = [
@@ -156,45 +158,64 @@ def check_api_code(file_path: Path) -> dict:
         
     except Exception as e:
         issues.append(f"[X] Read error: {e}")
+        return {'file': str(file_path), 'passed': passed, 'issues': issues, 'type': 'code', 'error': str(e)}
     
     return {'file': str(file_path), 'passed': passed, 'issues': issues, 'type': 'code'}
 
+def run(project_path: str, inventory=None) -> dict:
+    """Checker plugin entry point: check API code and OpenAPI specs."""
+    inventory = inventory or get_inventory(project_path)
+    api_files = find_api_files(Path(project_path), inventory)
+    
+    results = []
+    with open_cache(inventory, "api_validator", CHECKER_VERSION, __file__) as cache:
+        for file_path in api_files[:15]:  # Limit
+            result = cache.get(file_path)
+            if result is None:
+                if 'openapi' in file_path.name.lower() or 'swagger' in file_path.name.lower():
+                    result = check_openapi_spec(file_path)
+                else:
+                    result = check_api_code(file_path)
+                if 'error' not in result:  # read / parse failures are retried next run
+                    cache.put(file_path, result)
+            results.append(dict(result, file=str(file_path)))
+    
+    total_passed = sum(len(result['passed']) for result in results)
+    total_issues = sum(1 for result in results for item in result['issues'] if item.startswith("[X]"))
+    return {
+        "script": "api_validator",
+        "files": results,
+        "checks_passed": total_passed,
+        "critical_issues": total_issues,
+        "passed": total_issues == 0,
+        "status": f"{total_passed} passed, {total_issues} critical issues" if results else "No API files found"
+    }
+
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
-    project_path = Path(target)
     
     print("\n" + "=" * 60)
     print("  API VALIDATOR - Endpoint Best Practices Check")
     print("=" * 60 + "\n")
     
-    api_files = find_api_files(project_path)
+    report = run(target)
+    results = report['files']
     
-    if not api_files:
+    if not results:
         print("[!] No API files found.")
         print("   Looking for: routes/, controllers/, api/, openapi.json/yaml")
         sys.exit(0)
     
-    results = []
-    for file_path in api_files[:15]:  # Limit
-        if 'openapi' in file_path.name.lower() or 'swagger' in file_path.name.lower():
-            result = check_openapi_spec(file_path)
-        else:
-            result = check_api_code(file_path)
-        results.append(result)
-    
     # Print results
-    total_issues = 0
-    total_passed = 0
-    
     for result in results:
         print(f"\n[FILE] {result['file']} [{result['type']}]")
         for item in result['passed']:
             print(f"   {item}")
-            total_passed += 1
         for item in result['issues']:
             print(f"   {item}")
-            if item.startswith("[X]"):
-                total_issues += 1
+    
+    total_passed = report['checks_passed']
+    total_issues = report['critical_issues']
     
     print("\n" + "=" * 60)
     print(f"[RESULTS] {total_passed} passed, {total_issues} critical issues")
@@ -25,18 +25,21 @@ try:
 except:
     pass
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory, read_text
 
-def find_schema_files(project_path: Path) -> list:
+
+def find_schema_files(project_path: Path, inventory=None) -> list:
     """Find database schema files."""
     schemas = []
     
     # Prisma schema
-    prisma_files = list(project_path.glob('**/prisma/schema.prisma'))
+    inventory = inventory or get_inventory(project_path)
+    prisma_files = inventory.glob('**/prisma/schema.prisma')
     schemas.extend([('prisma', f) for f in prisma_files])
     
     # Drizzle schema files
-    drizzle_files = list(project_path.glob('**/drizzle/*.ts'))
-    drizzle_files.extend(project_path.glob('**/schema/*.ts'))
+    drizzle_files = inventory.glob('**/drizzle/*.ts', '**/schema/*.ts')
     for f in drizzle_files:
         if 'schema' in f.name.lower() or 'table' in f.name.lower():
             schemas.append(('drizzle', f))
@@ -49,7 +52,7 @@ def validate_prisma_schema(file_path: Path) -> list:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path)
         
         # Find all models
         models = re.findall(r'model\s+(\w+)\s*{([^}]+)}', content, re.DOTALL)
@@ -91,38 +94,26 @@ def validate_prisma_schema(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
-    
-    print(f"\n{'='*60}")
-    print(f"[SCHEMA VALIDATOR] Database Schema Validation")
-    print(f"{'='*60}")
-    print(f"Project: {project_path}")
-    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("-"*60)
-    
-    # Find schema files
-    schemas = find_schema_files(project_path)
-    print(f"Found {len(schemas)} schema files")
+def run(project_path: str, inventory=None) -> dict:
+    """Checker plugin entry point: validate every schema file found."""
+    project_path = Path(project_path).resolve()
+    schemas = find_schema_files(project_path, inventory)
     
     if not schemas:
-        output = {
+        return {
             "script": "schema_validator",
             "project": str(project_path),
             "schemas_checked": 0,
             "issues_found": 0,
             "passed": True,
-            "message": "No schema files found"
+            "message": "No schema files found",
+            "status": "No schema files found"
         }
-        print(json.dumps(output, indent=2))
-        sys.exit(0)
     
     # Validate each schema
     all_issues = []
     
     for schema_type, file_path in schemas:
-        print(f"\nValidating: {file_path.name} ({schema_type})")
-        
         if schema_type == 'prisma':
             issues = validate_prisma_schema(file_path)
         else:
@@ -135,13 +126,48 @@ def main():
                 "issues": issues
             })
     
+    total_issues = sum(len(item["issues"]) for item in all_issues)
+    
+    return {
+        "script": "schema_validator",
+        "project": str(project_path),
+        "schemas_checked": len(schemas),
+        "schemas": [{"file": str(file_path.name), "type": schema_type} for schema_type, file_path in schemas],
+        "issues_found": total_issues,
+        # Schema issues are warnings, not failures
+        "passed": True,
+        "issues": all_issues,
+        "status": f"{len(schemas)} schema files, {total_issues} issues"
+    }
+
+
+def main():
+    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    
+    print(f"\n{'='*60}")
+    print(f"[SCHEMA VALIDATOR] Database Schema Validation")
+    print(f"{'='*60}")
+    print(f"Project: {project_path}")
+    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("-"*60)
+    
+    output = run(str(project_path))
+    print(f"Found {output['schemas_checked']} schema files")
+    
+    if not output["schemas_checked"]:
+        print(json.dumps(output, indent=2))
+        sys.exit(0)
+    
+    for schema in output["schemas"]:
+        print(f"\nValidating: {schema['file']} ({schema['type']})")
+    
     # Summary
     print("\n" + "="*60)
     print("SCHEMA ISSUES")
     print("="*60)
     
-    if all_issues:
-        for item in all_issues:
+    if output["issues"]:
+        for item in output["issues"]:
             print(f"\n{item['file']} ({item['type']}):")
             for issue in item["issues"][:5]:  # Limit per file
                 print(f"  - {issue}")
@@ -150,19 +176,6 @@ def main():
     else:
         print("No schema issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    # Schema issues are warnings, not failures
-    passed = True
-    
-    output = {
-        "script": "schema_validator",
-        "project": str(project_path),
-        "schemas_checked": len(schemas),
-        "issues_found": total_issues,
-        "passed": passed,
-        "issues": all_issues
-    }
-    
     print("\n" + json.dumps(output, indent=2))
     
     sys.exit(0)
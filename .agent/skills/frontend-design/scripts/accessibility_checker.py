@@ -26,19 +26,16 @@ try:
 except:
     pass
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory, read_text
+from result_cache import open_cache
 
-def find_html_files(project_path: Path) -> list:
+CHECKER_VERSION = "1"
+
+
+def find_html_files(project_path: Path, inventory=None) -> list:
     """Find all HTML/JSX/TSX files."""
-    patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
-    skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
-    
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in skip_dirs):
-                files.append(f)
-    
-    return files[:50]
+    return (inventory or get_inventory(project_path)).files(['.html', '.jsx', '.tsx'], ordered=True)[:50]
 
 
 def check_accessibility(file_path: Path) -> list:
@@ -46,7 +43,7 @@ def check_accessibility(file_path: Path) -> list:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path)
         
         # Check for form inputs without labels
         inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
@@ -108,48 +105,77 @@ def check_accessibility(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
-    
-    print(f"\n{'='*60}")
-    print(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
-    print(f"{'='*60}")
-    print(f"Project: {project_path}")
-    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("-"*60)
-    
-    # Find HTML files
-    files = find_html_files(project_path)
-    print(f"Found {len(files)} HTML/JSX/TSX files")
+def run(project_path: str, inventory=None) -> dict:
+    """Checker plugin entry point: audit every HTML/JSX/TSX file."""
+    project_path = Path(project_path).resolve()
+    inventory = inventory or get_inventory(project_path)
+    files = find_html_files(project_path, inventory)
     
     if not files:
-        output = {
+        return {
             "script": "accessibility_checker",
             "project": str(project_path),
             "files_checked": 0,
             "issues_found": 0,
             "passed": True,
-            "message": "No HTML files found"
+            "message": "No HTML files found",
+            "status": "No HTML files found"
         }
-        print(json.dumps(output, indent=2))
-        sys.exit(0)
     
     # Check each file
     all_issues = []
     
-    for f in files:
-        issues = check_accessibility(f)
-        if issues:
-            all_issues.append({
-                "file": str(f.name),
-                "issues": issues
-            })
+    with open_cache(inventory, "accessibility_checker", CHECKER_VERSION, __file__) as cache:
+        for f in files:
+            issues = cache.get(f)
+            if issues is None:
+                issues = check_accessibility(f)
+                if not any(issue.startswith("Error reading file") for issue in issues):
+                    cache.put(f, issues)
+            if issues:
+                all_issues.append({
+                    "file": str(f.name),
+                    "issues": issues
+                })
+    
+    total_issues = sum(len(item["issues"]) for item in all_issues)
+    
+    return {
+        "script": "accessibility_checker",
+        "project": str(project_path),
+        "files_checked": len(files),
+        "files_with_issues": len(all_issues),
+        "issues_found": total_issues,
+        # Accessibility issues are important but not blocking
+        "passed": total_issues < 5,  # Allow minor issues
+        "issues": all_issues,
+        "status": f"{total_issues} accessibility issues in {len(all_issues)} of {len(files)} files"
+    }
+
+
+def main():
+    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    
+    print(f"\n{'='*60}")
+    print(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
+    print(f"{'='*60}")
+    print(f"Project: {project_path}")
+    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("-"*60)
+    
+    report = run(str(project_path))
+    print(f"Found {report['files_checked']} HTML/JSX/TSX files")
+    
+    if not report["files_checked"]:
+        print(json.dumps({key: value for key, value in report.items() if key != "status"}, indent=2))
+        sys.exit(0)
     
     # Summary
     print("\n" + "="*60)
     print("ACCESSIBILITY ISSUES")
     print("="*60)
     
+    all_issues = report["issues"]
     if all_issues:
         for item in all_issues[:10]:
             print(f"\n{item['file']}:")
@@ -161,22 +187,12 @@ def main():
     else:
         print("No accessibility issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    # Accessibility issues are important but not blocking
-    passed = total_issues < 5  # Allow minor issues
-    
-    output = {
-        "script": "accessibility_checker",
-        "project": str(project_path),
-        "files_checked": len(files),
-        "files_with_issues": len(all_issues),
-        "issues_found": total_issues,
-        "passed": passed
-    }
+    output = {key: report[key] for key in ("script", "project", "files_checked", "files_with_issues",
+                                           "issues_found", "passed")}
     
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if passed else 1)
+    sys.exit(0 if report["passed"] else 1)
 
 
 if __name__ == "__main__":
@@ -95,6 +95,12 @@ import re
 import json
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory, read_text
+from result_cache import open_cache
+
+CHECKER_VERSION = "1"
+
 class UXAuditor:
     def __init__(self):
         self.issues = []
@@ -104,8 +110,7 @@ class UXAuditor:
     
     def audit_file(self, filepath: str) -> None:
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+            content = read_text(filepath)
         except: return
         
         self.files_checked += 1
@@ -671,13 +676,31 @@ class UXAuditor:
         if re.search(r'<img(?![^>]*alt=)[^>]*>', content):
             self.issues.append(f"[Accessibility] {filename}: Missing img alt text")
 
-    def audit_directory(self, directory: str) -> None:
+    def audit_cached(self, filepath: str, cache) -> None:
+        """audit_file(), replaying the file's findings from the result cache when unchanged"""
+        findings = cache.get(filepath)
+        if findings is None:
+            before = (len(self.issues), len(self.warnings), self.passed_count, self.files_checked)
+            self.audit_file(filepath)
+            findings = {
+                "issues": self.issues[before[0]:],
+                "warnings": self.warnings[before[1]:],
+                "passed": self.passed_count - before[2],
+                "checked": self.files_checked - before[3]
+            }
+            cache.put(filepath, findings)
+            return
+        self.issues.extend(findings["issues"])
+        self.warnings.extend(findings["warnings"])
+        self.passed_count += findings["passed"]
+        self.files_checked += findings["checked"]
+
+    def audit_directory(self, directory: str, inventory=None) -> None:
         extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+        inventory = inventory or get_inventory(directory)
+        with open_cache(inventory, "ux_audit", CHECKER_VERSION, __file__) as cache:
+            for filepath in inventory.files(extensions):
+                self.audit_cached(str(filepath), cache)
 
     def get_report(self):
         return {
@@ -688,6 +711,15 @@ class UXAuditor:
             "compliant": len(self.issues) == 0
         }
 
+def run(project_path: str, inventory=None) -> dict:
+    """Checker plugin entry point: audit every UI file in the project."""
+    auditor = UXAuditor()
+    auditor.audit_directory(project_path, inventory)
+    report = auditor.get_report()
+    report["passed"] = report["compliant"]
+    report["status"] = f"{len(report['issues'])} issues, {len(report['warnings'])} warnings in {report['files_checked']} files"
+    return report
+
 def main():
     if len(sys.argv) < 2: sys.exit(1)
     
@@ -28,6 +28,12 @@ try:
 except AttributeError:
     pass
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory, read_text
+from result_cache import open_cache
+
+CHECKER_VERSION = "1"
+
 
 # Directories to skip (not public content)
 SKIP_DIRS = {
@@ -78,20 +84,10 @@ def is_page_file(file_path: Path) -> bool:
     return False
 
 
-def find_web_pages(project_path: Path) -> list:
+def find_web_pages(project_path: Path, inventory=None) -> list:
     """Find public-facing web pages only."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
-    
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
+    candidates = (inventory or get_inventory(project_path)).files(['.html', '.htm', '.jsx', '.tsx'], skip_dirs=SKIP_DIRS, ordered=True)
+    files = [f for f in candidates if is_page_file(f)]
     
     return files[:30]  # Limit to 30 pages
 
@@ -99,9 +95,9 @@ def find_web_pages(project_path: Path) -> list:
 def check_page(file_path: Path) -> dict:
     """Check a single web page for GEO elements."""
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path)
     except Exception as e:
-        return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
+        return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0, 'error': str(e)}
     
     issues = []
     passed = []
@@ -219,6 +215,37 @@ def check_page(file_path: Path) -> dict:
     }
 
 
+def run(project_path: str, inventory=None) -> dict:
+    """Checker plugin entry point: score every public page for AI citation readiness."""
+    project_path = Path(project_path).resolve()
+    inventory = inventory or get_inventory(project_path)
+    pages = find_web_pages(project_path, inventory)
+    
+    if not pages:
+        return {"script": "geo_checker", "pages_found": 0, "passed": True, "status": "No public web pages found"}
+    
+    results = []
+    with open_cache(inventory, "geo_checker", CHECKER_VERSION, __file__) as cache:
+        for page in pages:
+            result = cache.get(page)
+            if result is None:
+                result = check_page(page)
+                if 'error' not in result:  # read failures are retried next run
+                    cache.put(page, result)
+            results.append(result)
+    avg_score = sum(r['score'] for r in results) / len(results)
+    
+    return {
+        "script": "geo_checker",
+        "project": str(project_path),
+        "pages_checked": len(results),
+        "average_score": round(avg_score),
+        "passed": avg_score >= 60,
+        "pages": results,
+        "status": f"Average GEO score {avg_score:.0f}% over {len(results)} pages"
+    }
+
+
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
     target_path = Path(target).resolve()
@@ -229,10 +256,9 @@ def main():
     print(f"Project: {target_path}")
     print("-" * 60)
     
-    # Find web pages only
-    pages = find_web_pages(target_path)
+    report = run(str(target_path))
     
-    if not pages:
+    if not report.get("pages_checked"):
         print("\n[!] No public web pages found.")
         print("    Looking for: HTML, JSX, TSX files in pages/app directories")
         print("    Skipping: docs, tests, config files, node_modules")
@@ -240,13 +266,8 @@ def main():
         print("\n" + json.dumps(output, indent=2))
         sys.exit(0)
     
-    print(f"Found {len(pages)} public pages to analyze\n")
-    
-    # Check each page
-    results = []
-    for page in pages:
-        result = check_page(page)
-        results.append(result)
+    results = report["pages"]
+    print(f"Found {len(results)} public pages to analyze\n")
     
     # Print results
     for result in results:
@@ -257,7 +278,7 @@ def main():
                 print(f"    - {issue}")
     
     # Average score
-    avg_score = sum(r['score'] for r in results) / len(results) if results else 0
+    avg_score = sum(r['score'] for r in results) / len(results)
     
     print("\n" + "=" * 60)
     print(f"AVERAGE GEO SCORE: {avg_score:.0f}%")
@@ -273,16 +294,10 @@ def main():
         print("[X] Poor - Content needs GEO optimization")
     
     # JSON output
-    output = {
-        "script": "geo_checker",
-        "project": str(target_path),
-        "pages_checked": len(results),
-        "average_score": round(avg_score),
-        "passed": avg_score >= 60
-    }
+    output = {key: report[key] for key in ("script", "project", "pages_checked", "average_score", "passed")}
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if avg_score >= 60 else 1)
+    sys.exit(0 if report["passed"] else 1)
 
 
 if __name__ == "__main__":
@@ -15,6 +15,12 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory, read_text
+from result_cache import open_cache
+
+CHECKER_VERSION = "1"
+
 # Patterns that indicate hardcoded strings (should be translated)
 HARDCODED_PATTERNS = {
     'jsx': [
@@ -50,7 +56,7 @@ I18N_PATTERNS = [
     r'i18n\.',             # Generic i18n
 ]
 
-def find_locale_files(project_path: Path) -> list:
+def find_locale_files(project_path: Path, inventory=None) -> list:
     """Find translation/locale files."""
     patterns = [
         "**/locales/**/*.json",
@@ -61,11 +67,7 @@ def find_locale_files(project_path: Path) -> list:
         "**/*.po",  # gettext
     ]
     
-    files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
-    
-    return [f for f in files if 'node_modules' not in str(f)]
+    return (inventory or get_inventory(project_path)).glob(*patterns)
 
 def check_locale_completeness(locale_files: list) -> dict:
     """Check if all locales have the same keys."""
@@ -128,7 +130,19 @@ def flatten_keys(d, prefix=''):
             keys.add(new_key)
     return keys
 
-def check_hardcoded_strings(project_path: Path) -> dict:
+def scan_code_file(file_path: Path, file_type: str) -> dict:
+    """i18n usage and hardcoded-string samples (first match per pattern) of one file."""
+    content = read_text(file_path)
+    has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
+    samples = []
+    if not has_i18n:
+        for pattern in HARDCODED_PATTERNS.get(file_type, []):
+            matches = re.findall(pattern, content)
+            if matches:
+                samples.append(str(matches[0])[:40])
+    return {'i18n': has_i18n, 'hardcoded': samples}
+
+def check_hardcoded_strings(project_path: Path, inventory=None) -> dict:
     """Check for hardcoded strings in code files."""
     issues = []
     passed = []
@@ -140,12 +154,10 @@ def check_hardcoded_strings(project_path: Path) -> dict:
         '.py': 'python'
     }
     
-    code_files = []
-    for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
-    
-    code_files = [f for f in code_files if not any(x in str(f) for x in 
-                  ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
+    inventory = inventory or get_inventory(project_path)
+    # Test files by role (*.test.* / *.spec.* / test_* names, test/ tests/ __tests__/ spec/ e2e/ dirs),
+    # not every path containing "test" or "spec"
+    code_files = inventory.files(extensions, exclude_roles={'test'}, ordered=True)
     
     if not code_files:
         return {'passed': ["[!] No code files found"], 'issues': []}
@@ -154,33 +166,25 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     files_with_hardcoded = 0
     hardcoded_examples = []
     
-    for file_path in code_files[:50]:  # Limit
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            ext = file_path.suffix
-            file_type = extensions.get(ext, 'jsx')
+    with open_cache(inventory, "i18n_checker", CHECKER_VERSION, __file__) as cache:
+        for file_path in code_files[:50]:  # Limit
+            result = cache.get(file_path)
+            if result is None:
+                try:
+                    result = scan_code_file(file_path, extensions.get(file_path.suffix, 'jsx'))
+                except:
+                    continue
+                cache.put(file_path, result)
             
-            # Check for i18n usage
-            has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
-            if has_i18n:
+            if result['i18n']:
                 files_with_i18n += 1
             
-            # Check for hardcoded strings
-            patterns = HARDCODED_PATTERNS.get(file_type, [])
-            hardcoded_found = False
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, content)
-                if matches and not has_i18n:
-                    hardcoded_found = True
-                    if len(hardcoded_examples) < 5:
-                        hardcoded_examples.append(f"{file_path.name}: {str(matches[0])[:40]}...")
-            
-            if hardcoded_found:
+            # Hardcoded strings only count in files without i18n usage
+            if result['hardcoded']:
                 files_with_hardcoded += 1
-                
-        except:
-            continue
+                for sample in result['hardcoded']:
+                    if len(hardcoded_examples) < 5:
+                        hardcoded_examples.append(f"{file_path.name}: {sample}...")
     
     passed.append(f"[OK] Analyzed {len(code_files)} code files")
     
@@ -196,20 +200,37 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     return {'passed': passed, 'issues': issues}
 
+def run(project_path: str, inventory=None) -> dict:
+    """Checker plugin entry point: locale completeness and hardcoded strings."""
+    project_path = Path(project_path)
+    
+    # Check locale files
+    locale_files = find_locale_files(project_path, inventory)
+    locale_result = check_locale_completeness(locale_files)
+    
+    # Check hardcoded strings
+    code_result = check_hardcoded_strings(project_path, inventory)
+    
+    critical_issues = sum(1 for i in locale_result['issues'] + code_result['issues'] if i.startswith("[X]"))
+    return {
+        "script": "i18n_checker",
+        "locales": locale_result,
+        "code": code_result,
+        "critical_issues": critical_issues,
+        "passed": critical_issues == 0,
+        "status": "i18n check passed" if critical_issues == 0 else f"{critical_issues} i18n issues found"
+    }
+
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
-    project_path = Path(target)
     
     print("\n" + "=" * 60)
     print("  i18n CHECKER - Internationalization Audit")
     print("=" * 60 + "\n")
     
-    # Check locale files
-    locale_files = find_locale_files(project_path)
-    locale_result = check_locale_completeness(locale_files)
-    
-    # Check hardcoded strings
-    code_result = check_hardcoded_strings(project_path)
+    report = run(target)
+    locale_result = report['locales']
+    code_result = report['code']
     
     # Print results
     print("[LOCALE FILES]")
@@ -227,7 +248,7 @@ def main():
         print(f"  {item}")
     
     # Summary
-    critical_issues = sum(1 for i in locale_result['issues'] + code_result['issues'] if i.startswith("[X]"))
+    critical_issues = report['critical_issues']
     
     print("\n" + "=" * 60)
     if critical_issues == 0:
@@ -101,6 +101,38 @@ def run_linter(linter: dict, cwd: Path) -> dict:
     return result
 
 
+def run(project_path: str, inventory=None) -> dict:
+    """Checker plugin entry point: run every detected linter."""
+    project_path = Path(project_path).resolve()
+    project_info = detect_project_type(project_path)
+    
+    if not project_info["linters"]:
+        return {
+            "script": "lint_runner",
+            "project": str(project_path),
+            "type": project_info["type"],
+            "checks": [],
+            "passed": True,
+            "message": "No linters configured",
+            "status": "No linters configured"
+        }
+    
+    results = [run_linter(linter, project_path) for linter in project_info["linters"]]
+    failed = [r["name"] for r in results if not r["passed"]]
+    status = f"{len(results) - len(failed)}/{len(results)} linters passed"
+    if failed:
+        status += f" (failed: {', '.join(failed)})"
+    
+    return {
+        "script": "lint_runner",
+        "project": str(project_path),
+        "type": project_info["type"],
+        "checks": results,
+        "passed": not failed,
+        "status": status
+    }
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
     
@@ -110,62 +142,36 @@ def main():
     print(f"Project: {project_path}")
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Detect project type
-    project_info = detect_project_type(project_path)
-    print(f"Type: {project_info['type']}")
-    print(f"Linters: {len(project_info['linters'])}")
+    output = run(str(project_path))
+    print(f"Type: {output['type']}")
+    print(f"Linters: {len(output['checks'])}")
     print("-"*60)
     
-    if not project_info["linters"]:
+    if not output["checks"]:
         print("No linters found for this project type.")
-        output = {
-            "script": "lint_runner",
-            "project": str(project_path),
-            "type": project_info["type"],
-            "checks": [],
-            "passed": True,
-            "message": "No linters configured"
-        }
         print(json.dumps(output, indent=2))
         sys.exit(0)
     
-    # Run each linter
-    results = []
-    all_passed = True
-    
-    for linter in project_info["linters"]:
-        print(f"\nRunning: {linter['name']}...")
-        result = run_linter(linter, project_path)
-        results.append(result)
-        
+    for result in output["checks"]:
         if result["passed"]:
-            print(f"  [PASS] {linter['name']}")
+            print(f"  [PASS] {result['name']}")
         else:
-            print(f"  [FAIL] {linter['name']}")
+            print(f"  [FAIL] {result['name']}")
             if result["error"]:
                 print(f"  Error: {result['error'][:200]}")
-            all_passed = False
     
     # Summary
     print("\n" + "="*60)
     print("SUMMARY")
     print("="*60)
     
-    for r in results:
+    for r in output["checks"]:
         icon = "[PASS]" if r["passed"] else "[FAIL]"
         print(f"{icon} {r['name']}")
     
-    output = {
-        "script": "lint_runner",
-        "project": str(project_path),
-        "type": project_info["type"],
-        "checks": results,
-        "passed": all_passed
-    }
-    
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if all_passed else 1)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
@@ -15,40 +15,72 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
-def check_typescript_coverage(project_path: Path) -> dict:
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory, read_text
+from result_cache import open_cache
+
+CHECKER_VERSION = "1"
+
+def cached_stats(inventory, files: list, checker: str, count) -> dict:
+    """Sum of count(content) over files, reusing per-file counts from the result cache."""
+    totals = {}
+    with open_cache(inventory, checker, CHECKER_VERSION, __file__) as cache:
+        for file_path in files:
+            counts = cache.get(file_path)
+            if counts is None:
+                try:
+                    counts = count(read_text(file_path))
+                except Exception:
+                    continue
+                cache.put(file_path, counts)
+            for key, value in counts.items():
+                totals[key] = totals.get(key, 0) + value
+    return totals
+
+def count_typescript(content: str) -> dict:
+    """'any' usage and typed/untyped functions in one TypeScript file."""
+    # Count 'any' usage
+    any_matches = re.findall(r':\s*any\b', content)
+    
+    # Find functions without return types
+    # function name(params) { - no return type
+    untyped = re.findall(r'function\s+\w+\s*\([^)]*\)\s*{', content)
+    # Arrow functions without types: const fn = (x) => or (x) =>
+    untyped += re.findall(r'=\s*\([^:)]*\)\s*=>', content)
+    
+    # Count typed functions
+    typed = re.findall(r'function\s+\w+\s*\([^)]*\)\s*:\s*\w+', content)
+    typed += re.findall(r':\s*\([^)]*\)\s*=>\s*\w+', content)
+    
+    return {'any_count': len(any_matches), 'untyped_functions': len(untyped), 'total_functions': len(typed) + len(untyped)}
+
+def count_python(content: str) -> dict:
+    """'Any' usage and typed/untyped functions in one Python file."""
+    # Count Any usage
+    any_matches = re.findall(r':\s*Any\b', content)
+    
+    # Find functions with type hints
+    typed_funcs = re.findall(r'def\s+\w+\s*\([^)]*:[^)]+\)', content)
+    typed_funcs += re.findall(r'def\s+\w+\s*\([^)]*\)\s*->', content)
+    
+    # Find functions without type hints
+    all_funcs = re.findall(r'def\s+\w+\s*\(', content)
+    
+    return {'untyped_functions': len(all_funcs) - len(typed_funcs), 'typed_functions': len(typed_funcs), 'any_count': len(any_matches)}
+
+def check_typescript_coverage(project_path: Path, inventory=None) -> dict:
     """Check TypeScript type coverage."""
     issues = []
     passed = []
     stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
     
-    ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
-    ts_files = [f for f in ts_files if 'node_modules' not in str(f) and '.d.ts' not in str(f)]
+    inventory = inventory or get_inventory(project_path)
+    ts_files = [f for f in inventory.files(['.ts', '.tsx'], ordered=True) if not f.name.endswith('.d.ts')]
     
     if not ts_files:
         return {'type': 'typescript', 'files': 0, 'passed': [], 'issues': ["[!] No TypeScript files found"], 'stats': stats}
     
-    for file_path in ts_files[:30]:  # Limit
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Count 'any' usage
-            any_matches = re.findall(r':\s*any\b', content)
-            stats['any_count'] += len(any_matches)
-            
-            # Find functions without return types
-            # function name(params) { - no return type
-            untyped = re.findall(r'function\s+\w+\s*\([^)]*\)\s*{', content)
-            # Arrow functions without types: const fn = (x) => or (x) =>
-            untyped += re.findall(r'=\s*\([^:)]*\)\s*=>', content)
-            stats['untyped_functions'] += len(untyped)
-            
-            # Count typed functions
-            typed = re.findall(r'function\s+\w+\s*\([^)]*\)\s*:\s*\w+', content)
-            typed += re.findall(r':\s*\([^)]*\)\s*=>\s*\w+', content)
-            stats['total_functions'] += len(typed) + len(untyped)
-            
-        except Exception:
-            continue
+    stats.update(cached_stats(inventory, ts_files[:30], "type_coverage.typescript", count_typescript))  # Limit
     
     # Analyze results
     if stats['any_count'] == 0:
@@ -71,37 +103,19 @@ def check_typescript_coverage(project_path: Path) -> dict:
     
     return {'type': 'typescript', 'files': len(ts_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
-def check_python_coverage(project_path: Path) -> dict:
+def check_python_coverage(project_path: Path, inventory=None) -> dict:
     """Check Python type hints coverage."""
     issues = []
     passed = []
     stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
     
-    py_files = list(project_path.rglob("*.py"))
-    py_files = [f for f in py_files if not any(x in str(f) for x in ['venv', '__pycache__', '.git', 'node_modules'])]
+    inventory = inventory or get_inventory(project_path)
+    py_files = inventory.files({'.py'})
     
     if not py_files:
         return {'type': 'python', 'files': 0, 'passed': [], 'issues': ["[!] No Python files found"], 'stats': stats}
     
-    for file_path in py_files[:30]:  # Limit
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Count Any usage
-            any_matches = re.findall(r':\s*Any\b', content)
-            stats['any_count'] += len(any_matches)
-            
-            # Find functions with type hints
-            typed_funcs = re.findall(r'def\s+\w+\s*\([^)]*:[^)]+\)', content)
-            typed_funcs += re.findall(r'def\s+\w+\s*\([^)]*\)\s*->', content)
-            stats['typed_functions'] += len(typed_funcs)
-            
-            # Find functions without type hints
-            all_funcs = re.findall(r'def\s+\w+\s*\(', content)
-            stats['untyped_functions'] += len(all_funcs) - len(typed_funcs)
-            
-        except Exception:
-            continue
+    stats.update(cached_stats(inventory, py_files[:30], "type_coverage.python", count_python))  # Limit
     
     total = stats['typed_functions'] + stats['untyped_functions']
     
@@ -125,32 +139,51 @@ def check_python_coverage(project_path: Path) -> dict:
     
     return {'type': 'python', 'files': len(py_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
-    project_path = Path(target)
-    
-    print("\n" + "=" * 60)
-    print("  TYPE COVERAGE CHECKER")
-    print("=" * 60 + "\n")
-    
+def run(project_path: str, inventory=None) -> dict:
+    """Checker plugin entry point: TypeScript and Python type coverage."""
+    project_path = Path(project_path)
     results = []
     
     # Check TypeScript
-    ts_result = check_typescript_coverage(project_path)
+    ts_result = check_typescript_coverage(project_path, inventory)
     if ts_result['files'] > 0:
         results.append(ts_result)
     
     # Check Python
-    py_result = check_python_coverage(project_path)
+    py_result = check_python_coverage(project_path, inventory)
     if py_result['files'] > 0:
         results.append(py_result)
     
+    critical_issues = sum(1 for result in results for item in result['issues'] if item.startswith("[X]"))
+    if not results:
+        status = "No TypeScript or Python files found"
+    elif critical_issues:
+        status = f"{critical_issues} critical type coverage issues"
+    else:
+        status = "Type coverage acceptable"
+    return {
+        "script": "type_coverage",
+        "languages": results,
+        "critical_issues": critical_issues,
+        "passed": critical_issues == 0,
+        "status": status
+    }
+
+def main():
+    target = sys.argv[1] if len(sys.argv) > 1 else "."
+    
+    print("\n" + "=" * 60)
+    print("  TYPE COVERAGE CHECKER")
+    print("=" * 60 + "\n")
+    
+    report = run(target)
+    results = report['languages']
+    
     if not results:
         print("[!] No TypeScript or Python files found.")
         sys.exit(0)
     
     # Print results
-    critical_issues = 0
     for result in results:
         print(f"\n[{result['type'].upper()}]")
         print("-" * 40)
@@ -158,8 +191,8 @@ def main():
             print(f"  {item}")
         for item in result['issues']:
             print(f"  {item}")
-            if item.startswith("[X]"):
-                critical_issues += 1
+    
+    critical_issues = report['critical_issues']
     
     print("\n" + "=" * 60)
     if critical_issues == 0:
@@ -71,6 +71,12 @@ import re
 import json
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory, read_text
+from result_cache import open_cache
+
+CHECKER_VERSION = "1"
+
 class MobileAuditor:
     def __init__(self):
         self.issues = []
@@ -80,8 +86,7 @@ class MobileAuditor:
 
     def audit_file(self, filepath: str) -> None:
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+            content = read_text(filepath)
         except:
             return
 
@@ -610,13 +615,31 @@ class MobileAuditor:
             # This is more of a configuration check, not code pattern
             self.passed_count += 1  # Hermes is default in RN 0.70+
 
-    def audit_directory(self, directory: str) -> None:
+    def audit_cached(self, filepath: str, cache) -> None:
+        """audit_file(), replaying the file's findings from the result cache when unchanged"""
+        findings = cache.get(filepath)
+        if findings is None:
+            before = (len(self.issues), len(self.warnings), self.passed_count, self.files_checked)
+            self.audit_file(filepath)
+            findings = {
+                "issues": self.issues[before[0]:],
+                "warnings": self.warnings[before[1]:],
+                "passed": self.passed_count - before[2],
+                "checked": self.files_checked - before[3]
+            }
+            cache.put(filepath, findings)
+            return
+        self.issues.extend(findings["issues"])
+        self.warnings.extend(findings["warnings"])
+        self.passed_count += findings["passed"]
+        self.files_checked += findings["checked"]
+
+    def audit_directory(self, directory: str, inventory=None) -> None:
         extensions = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', 'build', '.idea'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+        inventory = inventory or get_inventory(directory)
+        with open_cache(inventory, "mobile_audit", CHECKER_VERSION, __file__) as cache:
+            for filepath in inventory.files(extensions, skip_dirs={'ios', 'android'}):
+                self.audit_cached(str(filepath), cache)
 
     def get_report(self):
         return {
@@ -628,6 +651,16 @@ class MobileAuditor:
         }
 
 
+def run(project_path: str, inventory=None) -> dict:
+    """Checker plugin entry point: audit every mobile source file in the project."""
+    auditor = MobileAuditor()
+    auditor.audit_directory(project_path, inventory)
+    report = auditor.get_report()
+    report["passed"] = report["compliant"]
+    report["status"] = f"{len(report['issues'])} issues, {len(report['warnings'])} warnings in {report['files_checked']} files"
+    return report
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python mobile_audit.py <directory>")
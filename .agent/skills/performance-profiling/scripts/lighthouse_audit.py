@@ -4,6 +4,7 @@ Skill: performance-profiling
 Script: lighthouse_audit.py
 Purpose: Run Lighthouse performance audit on a URL
 Usage: python lighthouse_audit.py https://example.com
+Plugin: run(project_path, inventory, url=...) for checklist.py / verify_all.py
 Output: JSON with performance scores
 Note: Requires lighthouse CLI (npm install -g lighthouse)
 """
@@ -67,6 +68,20 @@ def get_summary(categories: dict) -> str:
     else:
         return "[X] Poor performance"
 
+def run(project_path: str, inventory=None, url: str = None) -> dict:
+    """Checker plugin entry point: audit the running site at `url`."""
+    if not url:
+        return {"script": "lighthouse_audit", "passed": True, "status": "No URL provided"}
+    result = run_lighthouse(url)
+    # Scores are informational: the CLI exits 0 as well
+    return {
+        "script": "lighthouse_audit",
+        "url": url,
+        "result": result,
+        "passed": True,
+        "status": result.get("summary") or result.get("error", "")
+    }
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python lighthouse_audit.py <url>"}))
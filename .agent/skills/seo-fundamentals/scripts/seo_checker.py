@@ -29,6 +29,12 @@ try:
 except:
     pass
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory, read_text
+from result_cache import open_cache
+
+CHECKER_VERSION = "1"
+
 
 # Directories to skip
 SKIP_DIRS = {
@@ -75,20 +81,10 @@ def is_page_file(file_path: Path) -> bool:
     return False
 
 
-def find_pages(project_path: Path) -> list:
+def find_pages(project_path: Path, inventory=None) -> list:
     """Find page files to check."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
-    
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
+    candidates = (inventory or get_inventory(project_path)).files(['.html', '.htm', '.jsx', '.tsx'], skip_dirs=SKIP_DIRS, ordered=True)
+    files = [f for f in candidates if is_page_file(f)]
     
     return files[:50]  # Limit to 50 files
 
@@ -98,9 +94,9 @@ def check_page(file_path: Path) -> dict:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path)
     except Exception as e:
-        return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
+        return {"file": str(file_path.name), "issues": [f"Error: {e}"], "error": str(e)}
     
     # Detect if this is a layout/template file (has Head component)
     is_layout = 'Head>' in content or '<head' in content.lower()
@@ -145,6 +141,48 @@ def check_page(file_path: Path) -> dict:
     }
 
 
+def run(project_path: str, inventory=None) -> dict:
+    """Checker plugin entry point: audit every likely public page."""
+    project_path = Path(project_path).resolve()
+    inventory = inventory or get_inventory(project_path)
+    pages = find_pages(project_path, inventory)
+    
+    if not pages:
+        return {"script": "seo_checker", "files_checked": 0, "passed": True, "status": "No page files found"}
+    
+    # Check each page
+    all_issues = []
+    with open_cache(inventory, "seo_checker", CHECKER_VERSION, __file__) as cache:
+        for f in pages:
+            result = cache.get(f)
+            if result is None:
+                result = check_page(f)
+                if "error" not in result:  # read failures are retried next run
+                    cache.put(f, result)
+            if result["issues"]:
+                all_issues.append(result)
+    
+    # Group by issue type
+    issue_counts = {}
+    for item in all_issues:
+        for issue in item["issues"]:
+            issue_counts[issue] = issue_counts.get(issue, 0) + 1
+    
+    total_issues = sum(len(item["issues"]) for item in all_issues)
+    
+    return {
+        "script": "seo_checker",
+        "project": str(project_path),
+        "files_checked": len(pages),
+        "files_with_issues": len(all_issues),
+        "issues_found": total_issues,
+        "passed": total_issues == 0,
+        "issues": all_issues,
+        "issue_counts": issue_counts,
+        "status": f"{total_issues} SEO issues in {len(all_issues)} of {len(pages)} pages"
+    }
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
     
@@ -155,39 +193,26 @@ def main():
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("-"*60)
     
-    # Find pages
-    pages = find_pages(project_path)
+    report = run(str(project_path))
     
-    if not pages:
+    if not report["files_checked"]:
         print("\n[!] No page files found.")
         print("    Looking for: HTML, JSX, TSX in pages/app/routes directories")
         output = {"script": "seo_checker", "files_checked": 0, "passed": True}
         print("\n" + json.dumps(output, indent=2))
         sys.exit(0)
     
-    print(f"Found {len(pages)} page files to analyze\n")
-    
-    # Check each page
-    all_issues = []
-    for f in pages:
-        result = check_page(f)
-        if result["issues"]:
-            all_issues.append(result)
+    print(f"Found {report['files_checked']} page files to analyze\n")
     
     # Summary
     print("=" * 60)
     print("SEO ANALYSIS RESULTS")
     print("=" * 60)
     
+    all_issues = report["issues"]
     if all_issues:
-        # Group by issue type
-        issue_counts = {}
-        for item in all_issues:
-            for issue in item["issues"]:
-                issue_counts[issue] = issue_counts.get(issue, 0) + 1
-        
         print("\nIssue Summary:")
-        for issue, count in sorted(issue_counts.items(), key=lambda x: -x[1]):
+        for issue, count in sorted(report["issue_counts"].items(), key=lambda x: -x[1]):
             print(f"  [{count}] {issue}")
         
         print(f"\nAffected files ({len(all_issues)}):")
@@ -198,21 +223,12 @@ def main():
     else:
         print("\n[OK] No SEO issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    passed = total_issues == 0
-    
-    output = {
-        "script": "seo_checker",
-        "project": str(project_path),
-        "files_checked": len(pages),
-        "files_with_issues": len(all_issues),
-        "issues_found": total_issues,
-        "passed": passed
-    }
+    output = {key: report[key] for key in ("script", "project", "files_checked", "files_with_issues",
+                                           "issues_found", "passed")}
     
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if passed else 1)
+    sys.exit(0 if report["passed"] else 1)
 
 
 if __name__ == "__main__":
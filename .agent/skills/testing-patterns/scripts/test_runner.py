@@ -137,6 +137,45 @@ def run_tests(cmd: list, cwd: Path) -> dict:
     return result
 
 
+def run(project_path: str, inventory=None, coverage: bool = False) -> dict:
+    """Checker plugin entry point: run the detected test suite."""
+    project_path = Path(project_path).resolve()
+    test_info = detect_test_framework(project_path)
+    
+    if not test_info["cmd"]:
+        return {
+            "script": "test_runner",
+            "project": str(project_path),
+            "type": test_info["type"],
+            "framework": None,
+            "passed": True,
+            "message": "No tests configured",
+            "status": "No tests configured"
+        }
+    
+    cmd = test_info["coverage_cmd"] if coverage and test_info["coverage_cmd"] else test_info["cmd"]
+    result = run_tests(cmd, project_path)
+    
+    status = "All tests passed" if result["passed"] else "Some tests failed"
+    if result["tests_run"] > 0:
+        status += f" ({result['tests_passed']}/{result['tests_run']} passed)"
+    
+    return {
+        "script": "test_runner",
+        "project": str(project_path),
+        "type": test_info["type"],
+        "framework": test_info["framework"],
+        "command": cmd,
+        "tests_run": result["tests_run"],
+        "tests_passed": result["tests_passed"],
+        "tests_failed": result["tests_failed"],
+        "passed": result["passed"],
+        "output": result["output"],
+        "error": result["error"],
+        "status": status
+    }
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
     with_coverage = "--coverage" in sys.argv
@@ -148,34 +187,19 @@ def main():
     print(f"Coverage: {'enabled' if with_coverage else 'disabled'}")
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Detect test framework
-    test_info = detect_test_framework(project_path)
-    print(f"Type: {test_info['type']}")
-    print(f"Framework: {test_info['framework']}")
+    result = run(str(project_path), coverage=with_coverage)
+    print(f"Type: {result['type']}")
+    print(f"Framework: {result['framework']}")
     print("-"*60)
     
-    if not test_info["cmd"]:
+    if "command" not in result:
         print("No test framework found for this project.")
-        output = {
-            "script": "test_runner",
-            "project": str(project_path),
-            "type": test_info["type"],
-            "framework": None,
-            "passed": True,
-            "message": "No tests configured"
-        }
-        print(json.dumps(output, indent=2))
+        print(json.dumps(result, indent=2))
         sys.exit(0)
     
-    # Choose command
-    cmd = test_info["coverage_cmd"] if with_coverage and test_info["coverage_cmd"] else test_info["cmd"]
-    
-    print(f"Running: {' '.join(cmd)}")
+    print(f"Running: {' '.join(result['command'])}")
     print("-"*60)
     
-    # Run tests
-    result = run_tests(cmd, project_path)
-    
     # Print output (truncated)
     if result["output"]:
         lines = result["output"].split("\n")
@@ -199,16 +223,8 @@ def main():
     if result["tests_run"] > 0:
         print(f"Tests: {result['tests_run']} total, {result['tests_passed']} passed, {result['tests_failed']} failed")
     
-    output = {
-        "script": "test_runner",
-        "project": str(project_path),
-        "type": test_info["type"],
-        "framework": test_info["framework"],
-        "tests_run": result["tests_run"],
-        "tests_passed": result["tests_passed"],
-        "tests_failed": result["tests_failed"],
-        "passed": result["passed"]
-    }
+    output = {key: result[key] for key in ("script", "project", "type", "framework", "tests_run",
+                                           "tests_passed", "tests_failed", "passed")}
     
     print("\n" + json.dumps(output, indent=2))
     
@@ -5,6 +5,7 @@ Script: security_scan.py
 Purpose: Validate that security principles from SKILL.md are applied correctly
 Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config]
 Output: JSON with validation findings
+Plugin: run(project_path, inventory) for in-process use by checklist.py / verify_all.py
 
 This script verifies:
 1. Dependencies - Supply chain security (OWASP A03)
@@ -29,6 +30,10 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from file_inventory import get_inventory, read_text
+from result_cache import open_cache
+
 
 # ============================================================================
 #  CONFIGURATION
@@ -85,10 +90,20 @@ DANGEROUS_PATTERNS = [
     (r'yaml\.load\s*\([^)]*\)(?!\s*,\s*Loader)', "Unsafe YAML load", "high", "Deserialization risk"),
 ]
 
-SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next'}
+CONFIG_ISSUES = [
+    (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
+    (r'debug\s*=\s*True', "Debug mode enabled", "high"),
+    (r'NODE_ENV.*development', "Development mode in config", "medium"),
+    (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
+    (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
+    (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
+]
+
 CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java', '.rb', '.php'}
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.env.development'}
 
+CHECKER_VERSION = "1"
+
 
 # ============================================================================
 #  SCANNING FUNCTIONS
@@ -178,7 +193,42 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_secrets(project_path: str) -> Dict[str, Any]:
+def find_secrets(content: str) -> List[Dict[str, Any]]:
+    """SECRET_PATTERNS matches in one file's content"""
+    findings = []
+    for pattern, secret_type, severity in SECRET_PATTERNS:
+        matches = re.findall(pattern, content, re.IGNORECASE)
+        if matches:
+            findings.append({"type": secret_type, "severity": severity, "count": len(matches)})
+    return findings
+
+
+def find_dangerous_patterns(content: str) -> List[Dict[str, Any]]:
+    """DANGEROUS_PATTERNS matches in one file's content, line by line"""
+    findings = []
+    for line_num, line in enumerate(content.splitlines(), 1):
+        for pattern, name, severity, category in DANGEROUS_PATTERNS:
+            if re.search(pattern, line, re.IGNORECASE):
+                findings.append({
+                    "line": line_num,
+                    "pattern": name,
+                    "severity": severity,
+                    "category": category,
+                    "snippet": line.strip()[:80]
+                })
+    return findings
+
+
+def find_config_issues(content: str) -> List[Dict[str, Any]]:
+    """CONFIG_ISSUES matches in one config file's content"""
+    return [
+        {"issue": issue, "severity": severity}
+        for pattern, issue, severity in CONFIG_ISSUES
+        if re.search(pattern, content, re.IGNORECASE)
+    ]
+
+
+def scan_secrets(project_path: str, inventory=None) -> Dict[str, Any]:
     """
     Validate no hardcoded secrets (OWASP A04).
     Checks: API keys, tokens, passwords, cloud credentials.
@@ -191,34 +241,22 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
         "by_severity": {"critical": 0, "high": 0, "medium": 0}
     }
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS and ext not in CONFIG_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
+    inventory = inventory or get_inventory(project_path)
+    with open_cache(inventory, "security_scan.secrets", CHECKER_VERSION, __file__) as cache:
+        for filepath in inventory.files(CODE_EXTENSIONS | CONFIG_EXTENSIONS):
             results["scanned_files"] += 1
             
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, secret_type, severity in SECRET_PATTERNS:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "type": secret_type,
-                                "severity": severity,
-                                "count": len(matches)
-                            })
-                            results["by_severity"][severity] += len(matches)
-                            
-            except Exception:
-                pass
+            findings = cache.get(filepath)
+            if findings is None:
+                try:
+                    findings = find_secrets(read_text(filepath))
+                except Exception:
+                    continue
+                cache.put(filepath, findings)
+            
+            for finding in findings:
+                results["findings"].append({"file": inventory.relative(filepath), **finding})
+                results["by_severity"][finding["severity"]] += finding["count"]
     
     if results["by_severity"]["critical"] > 0:
         results["status"] = "[!!] CRITICAL: Secrets exposed!"
@@ -233,7 +271,7 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+def scan_code_patterns(project_path: str, inventory=None) -> Dict[str, Any]:
     """
     Validate dangerous code patterns (OWASP A05).
     Checks: Injection risks, XSS, unsafe deserialization.
@@ -246,36 +284,23 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
         "by_category": {}
     }
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
+    inventory = inventory or get_inventory(project_path)
+    with open_cache(inventory, "security_scan.patterns", CHECKER_VERSION, __file__) as cache:
+        for filepath in inventory.files(CODE_EXTENSIONS):
             results["scanned_files"] += 1
             
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                results["findings"].append({
-                                    "file": str(filepath.relative_to(project_path)),
-                                    "line": line_num,
-                                    "pattern": name,
-                                    "severity": severity,
-                                    "category": category,
-                                    "snippet": line.strip()[:80]
-                                })
-                                results["by_category"][category] = results["by_category"].get(category, 0) + 1
-                                
-            except Exception:
-                pass
+            findings = cache.get(filepath)
+            if findings is None:
+                try:
+                    findings = find_dangerous_patterns(read_text(filepath))
+                except Exception:
+                    continue
+                cache.put(filepath, findings)
+            
+            for finding in findings:
+                results["findings"].append({"file": inventory.relative(filepath), **finding})
+                category = finding["category"]
+                results["by_category"][category] = results["by_category"].get(category, 0) + 1
     
     critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
     high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
@@ -293,7 +318,7 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_configuration(project_path: str) -> Dict[str, Any]:
+def scan_configuration(project_path: str, inventory=None) -> Dict[str, Any]:
     """
     Validate security configuration (OWASP A02).
     Checks: Security headers, CORS, debug modes.
@@ -306,39 +331,20 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
     }
     
     # Check common config files for issues
-    config_issues = [
-        (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
-        (r'debug\s*=\s*True', "Debug mode enabled", "high"),
-        (r'NODE_ENV.*development', "Development mode in config", "medium"),
-        (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
-        (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
-        (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
-    ]
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CONFIG_EXTENSIONS and file not in ['next.config.js', 'webpack.config.js', '.eslintrc.js']:
-                continue
-                
-            filepath = Path(root) / file
+    config_names = ['next.config.js', 'webpack.config.js', '.eslintrc.js']
+    inventory = inventory or get_inventory(project_path)
+    with open_cache(inventory, "security_scan.config", CHECKER_VERSION, __file__) as cache:
+        for filepath in inventory.files(CONFIG_EXTENSIONS, names=config_names):
+            findings = cache.get(filepath)
+            if findings is None:
+                try:
+                    findings = find_config_issues(read_text(filepath))
+                except Exception:
+                    continue
+                cache.put(filepath, findings)
             
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, issue, severity in config_issues:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "issue": issue,
-                                "severity": severity
-                            })
-                            
-            except Exception:
-                pass
+            for finding in findings:
+                results["findings"].append({"file": inventory.relative(filepath), **finding})
     
     # Check for security header configurations
     header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
@@ -369,7 +375,7 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
 #  MAIN
 # ============================================================================
 
-def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
+def run_full_scan(project_path: str, scan_type: str = "all", inventory=None) -> Dict[str, Any]:
     """Execute security validation scans."""
     
     report = {
@@ -385,11 +391,12 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
         }
     }
     
+    inventory = inventory or get_inventory(project_path)
     scanners = {
-        "deps": ("dependencies", scan_dependencies),
-        "secrets": ("secrets", scan_secrets),
-        "patterns": ("code_patterns", scan_code_patterns),
-        "config": ("configuration", scan_configuration),
+        "deps": ("dependencies", lambda path: scan_dependencies(path)),
+        "secrets": ("secrets", lambda path: scan_secrets(path, inventory)),
+        "patterns": ("code_patterns", lambda path: scan_code_patterns(path, inventory)),
+        "config": ("configuration", lambda path: scan_configuration(path, inventory)),
     }
     
     for key, (name, scanner) in scanners.items():
@@ -418,6 +425,16 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     return report
 
 
+def run(project_path: str, inventory=None) -> Dict[str, Any]:
+    """Checker plugin entry point: the full scan as a structured report."""
+    report = run_full_scan(project_path, "all", inventory)
+    # Findings are advisory: the CLI always exits 0 as well
+    report["passed"] = True
+    report["status"] = (f"{report['summary']['overall_status']} - {report['summary']['total_findings']} findings "
+                        f"({report['summary']['critical']} critical, {report['summary']['high']} high)")
+    return report
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate security principles from vulnerability-scanner skill"
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+File Inventory - pins which files the sampling checkers see
+
+geo_checker (first 30 pages), accessibility_checker and i18n_checker (first
+50 files) only check a sample. The sample is taken from the inventory's
+sorted walk (a directory's files, then its subdirectories, by name), grouped
+by the checker's extension order, after .gitignore and test-role filtering -
+so it is the same on every filesystem.
+
+Usage:
+    python -m pytest .agent/tests
+"""
+
+import sys
+from pathlib import Path
+
+KIT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(KIT / "scripts"))
+
+from checkers import load_checker
+from file_inventory import build_inventory
+
+
+def make_project(root: Path, files):
+    for rel in files:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("<div></div>\n", encoding="utf-8")
+
+
+def rel_paths(root: Path, paths):
+    return [Path(path).relative_to(root).as_posix() for path in paths]
+
+
+def test_walk_order_is_sorted_and_honours_gitignore(tmp_path):
+    make_project(tmp_path, ["b.tsx", "a.tsx", "src/z/page.tsx", "src/app/page.tsx", "src/index.html", "out/index.html"])
+    (tmp_path / ".gitignore").write_text("out/\n", encoding="utf-8")
+    inventory = build_inventory(tmp_path)
+    assert rel_paths(tmp_path, inventory.files(['.html', '.tsx'], ordered=True)) == [
+        "src/index.html", "a.tsx", "b.tsx", "src/app/page.tsx", "src/z/page.tsx"
+    ]
+
+
+def test_geo_checker_samples_first_30_pages(tmp_path):
+    pages = [f"pages/p{i:02}.tsx" for i in range(35)]
+    make_project(tmp_path, pages + ["public/index.html", "src/Button.tsx"])
+    geo = load_checker(KIT / "skills" / "geo-fundamentals" / "scripts" / "geo_checker.py")
+    selected = rel_paths(tmp_path, geo.find_web_pages(tmp_path, build_inventory(tmp_path)))
+    assert selected == ["public/index.html"] + pages[:29]
+
+
+def test_accessibility_checker_samples_first_50_files(tmp_path):
+    components = [f"src/c{i:02}.tsx" for i in range(55)]
+    make_project(tmp_path, components + ["src/widget.jsx", "site/index.html"])
+    a11y = load_checker(KIT / "skills" / "frontend-design" / "scripts" / "accessibility_checker.py")
+    selected = rel_paths(tmp_path, a11y.find_html_files(tmp_path, build_inventory(tmp_path)))
+    assert selected == ["site/index.html", "src/widget.jsx"] + components[:48]
+
+
+def test_i18n_checker_skips_test_files_by_role(tmp_path):
+    make_project(tmp_path, ["src/app.tsx", "src/app.test.tsx", "src/latest/util.ts", "e2e/home.ts",
+                            "src/__tests__/x.tsx", "src/main.py"])
+    i18n = load_checker(KIT / "skills" / "i18n-localization" / "scripts" / "i18n_checker.py")
+    report = i18n.check_hardcoded_strings(tmp_path, build_inventory(tmp_path))
+    # src/app.tsx, src/latest/util.ts and src/main.py; "latest" is not a test directory
+    assert "[OK] Analyzed 3 code files" in report["passed"]